@@ -0,0 +1,197 @@
+"""
+Admission control for the API.
+
+Each route is mapped to a cost class. Cheap routes pass straight through;
+every other class has a bounded number of requests in progress and a bounded
+priority queue (lower priority number is served first, FIFO within a
+priority). A request is shed instead of queued when the class queue is full
+(429) or when it has waited longer than the class's queue budget (503); both
+carry a Retry-After estimated from the class's recent service time.
+
+Bounding the expensive classes also keeps the server threadpool free for
+cheap calls, so a burst of resume uploads cannot starve /industries.
+
+Limits are per process (see serve.py for multi-worker deployments) and can be
+overridden with WORKFORCE_ADMISSION, e.g. "analysis=8:32:1.5,upload=2:8:5"
+(class=concurrency:queue size:queue budget in seconds).
+"""
+import asyncio
+import collections
+import heapq
+import itertools
+import math
+import os
+import re
+import time
+
+from starlette.responses import JSONResponse
+
+CHEAP = "cheap"
+
+# class -> (max concurrent requests, max queued requests, max queue wait in seconds)
+DEFAULT_CLASSES = {
+    "analysis": (8, 32, 1.5),
+    "upload": (2, 8, 5.0),
+}
+
+
+def _class_config():
+    config = dict(DEFAULT_CLASSES)
+    for item in filter(None, os.environ.get("WORKFORCE_ADMISSION", "").split(",")):
+        name, _, values = item.partition("=")
+        concurrency, queue, budget = values.split(":")
+        config[name.strip()] = (int(concurrency), int(queue), float(budget))
+    return config
+
+
+class Shed(Exception):
+    def __init__(self, status_code, detail, retry_after):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class CostClass:
+    """Bounded concurrency plus a bounded priority queue for one cost class."""
+
+    def __init__(self, name, concurrency, max_queue, budget):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.budget = budget
+        self.active = 0
+        self._queue = []                    # heap of [priority, seq, future]
+        self._seq = itertools.count()
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.shed_wait_budget = 0
+        self.max_queue_depth = 0
+        self.waits = collections.deque(maxlen=1024)     # recent queue waits (s)
+        self.service_time = None                        # EWMA of time in service (s)
+
+    def queued(self):
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    def retry_after(self):
+        per_request = self.service_time or self.budget
+        return max(1, math.ceil(per_request * (self.queued() + 1) / self.concurrency))
+
+    async def acquire(self, priority):
+        """Waits for a slot; returns the queue wait in seconds or raises Shed."""
+        if self.active < self.concurrency and not self.queued():
+            self.active += 1
+            self.admitted += 1
+            self.waits.append(0.0)
+            return 0.0
+
+        if self.queued() >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise Shed(429, f"Too many {self.name} requests queued", self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, [priority, next(self._seq), future])
+        self.max_queue_depth = max(self.max_queue_depth, self.queued())
+        start = time.perf_counter()
+        try:
+            done, _ = await asyncio.wait({future}, timeout=self.budget)
+        except asyncio.CancelledError:
+            # Client went away while queued; hand back a slot granted in the meantime
+            if future.done() and not future.cancelled():
+                self.release()
+            future.cancel()
+            raise
+
+        wait = time.perf_counter() - start
+        if not done:
+            future.cancel()
+            self.shed_wait_budget += 1
+            raise Shed(503, f"{self.name} queue wait exceeded {self.budget:g}s", self.retry_after())
+
+        self.admitted += 1
+        self.waits.append(wait)
+        return wait
+
+    def release(self, service_time=None):
+        if service_time is not None:
+            self.service_time = service_time if self.service_time is None else (
+                0.8 * self.service_time + 0.2 * service_time
+            )
+        self.active -= 1
+        # Hand the slot to the best waiter still queued (timed-out ones are cancelled)
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+                return
+
+    def stats(self):
+        waits = sorted(self.waits)
+
+        def pct(q):
+            return round(waits[min(len(waits) - 1, int(q * len(waits)))], 4) if waits else 0.0
+
+        return {
+            "concurrency": self.concurrency,
+            "max_queue": self.max_queue,
+            "queue_budget_s": self.budget,
+            "active": self.active,
+            "queue_depth": self.queued(),
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "shed_wait_budget": self.shed_wait_budget,
+            "wait_p50_s": pct(0.5),
+            "wait_p95_s": pct(0.95),
+            "wait_max_s": round(waits[-1], 4) if waits else 0.0,
+            "service_time_s": round(self.service_time, 4) if self.service_time is not None else None,
+        }
+
+
+CLASSES = {name: CostClass(name, *values) for name, values in _class_config().items()}
+
+
+def stats():
+    return {name: cost_class.stats() for name, cost_class in CLASSES.items()}
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware applying the cost classes. `routes` is a list of
+    (method, path regex, cost class, priority); unmatched routes are cheap.
+    """
+
+    def __init__(self, app, routes):
+        self.app = app
+        self.routes = [(method, re.compile(pattern), name, priority) for method, pattern, name, priority in routes]
+
+    def classify(self, method, path):
+        for route_method, pattern, name, priority in self.routes:
+            if route_method == method and pattern.fullmatch(path):
+                return name, priority
+        return CHEAP, 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        name, priority = self.classify(scope["method"], scope["path"])
+        cost_class = CLASSES.get(name)
+        if cost_class is None:
+            return await self.app(scope, receive, send)
+
+        try:
+            await cost_class.acquire(priority)
+        except Shed as e:
+            response = JSONResponse(
+                {"detail": e.detail}, status_code=e.status_code,
+                headers={"Retry-After": str(e.retry_after)}
+            )
+            return await response(scope, receive, send)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            cost_class.release(time.perf_counter() - start)
@@ -1,19 +1,43 @@
-import pandas as pd
+import time
+_api_import_start = time.perf_counter()
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from industry_analysis import IndustryDashboard
-from company_analysis import CompanyAnalysis
-from resume_analyzer import ResumeAnalyzer
+from serialization import FastJSONResponse
 import uvicorn
 from typing import List
-from fastapi import UploadFile, File, Form, Depends
+from fastapi import UploadFile, File, Form, Depends, Body, Header
+from fastapi.responses import PlainTextResponse
 from fastapi.security import OAuth2PasswordRequestForm
 import os
 import shutil
+import tempfile
+from contextlib import contextmanager
 from sqlalchemy.orm import Session
 import database, models, auth
+import services
+import singleflight
+import admission
+import profiling
+import compression
+
+app = FastAPI(title="Workforce Pipeline Risk System API", default_response_class=FastJSONResponse)
 
-app = FastAPI(title="Workforce Pipeline Risk System API")
+# Cost classes for admission control (method, path, class, priority; lower priority is served first).
+# Routes not listed here are cheap and never queued.
+ADMISSION_ROUTES = [
+    ("GET", r"/dashboard/[^/]+/\d+", "analysis", 0),
+    ("GET", r"/student/dashboard/[^/]+/\d+", "analysis", 0),
+    ("GET", r"/company/compare", "analysis", 1),
+    ("GET", r"/companies/[^/]+/ranking", "analysis", 1),
+    ("GET", r"/dashboard/range", "analysis", 1),
+    ("POST", r"/data/ingest", "analysis", 2),
+    ("POST", r"/resume/analyze", "upload", 0),
+    ("POST", r"/resume/best-matches", "upload", 1),
+]
+app.add_middleware(admission.AdmissionMiddleware, routes=ADMISSION_ROUTES)
+# Per-request profiling for admins; not installed at all unless WORKFORCE_ADMIN_TOKEN is set
+profiling.install(app)
 
 # Allow CORS for frontend
 app.add_middleware(
@@ -23,16 +47,61 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# gzip/brotli for large responses, negotiated from Accept-Encoding
+app.add_middleware(compression.CompressionMiddleware)
+
+# Analysis engines are created on first use (see services.py) and share one IndustryDashboard
 
-# Initialize Logic
-dashboard_logic = IndustryDashboard()
-company_logic = CompanyAnalysis()
-resume_logic = ResumeAnalyzer()
+@app.on_event("startup")
+def startup():
+    if services.STARTUP_MODE == "eager":
+        services.warm_up()
+    # Picks up edited CSVs in data/ without a restart; rebuilds run off the request path
+    services.start_data_watcher()
 
 @app.get("/")
 def read_root():
     return {"status": "ok", "message": "Industry Dashboard API is running"}
 
+@app.get("/system/startup")
+def get_startup_report():
+    # Import-time and init-time breakdown for cold start tuning
+    return services.startup_report()
+
+@app.get("/system/metrics")
+def get_system_metrics():
+    # Coalesced vs. executed analysis calls per single-flight group,
+    # queue depth / wait times / shed counts per admission cost class,
+    # and the data version and reload history of the background data watcher
+    return {
+        "singleflight": singleflight.stats(),
+        "admission": admission.stats(),
+        "data_watcher": services.data_watcher_stats(),
+    }
+
+def admin_required(x_admin_token: str = Header(None)):
+    if not profiling.enabled():
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not profiling.is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+@app.get("/system/profiles", dependencies=[Depends(admin_required)])
+def get_profiles():
+    # Profiles recorded for requests sent with X-Profile: 1
+    return {"profiles": profiling.list_profiles()}
+
+@app.get("/system/profiles/{profile_id}", dependencies=[Depends(admin_required)])
+def get_profile(profile_id: str):
+    text = profiling.get_profile(profile_id)
+    if text is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(text)
+
+@app.get("/system/memory", dependencies=[Depends(admin_required)])
+def get_memory_report(top: int = 20, start: bool = False):
+    # Long-lived dashboard state sizes and the top tracemalloc allocation sites
+    return profiling.memory_report(services.get_dashboard(), top=max(1, min(top, 100)), start=start)
+
 # --- AUTH ENDPOINTS ---
 
 @app.post("/auth/register")
@@ -81,6 +150,7 @@ async def login_for_access_token(
 @app.get("/industries")
 def get_industries():
     # Publicly accessible for now to populate selectors
+    dashboard_logic = services.get_dashboard()
     if dashboard_logic.data is None:
         dashboard_logic.load_data()
     industries = dashboard_logic.data['Industry'].unique().tolist()
@@ -92,34 +162,101 @@ def get_companies(
     current_user: models.User = Depends(auth.get_current_user)
 ):
     # Both roles can see companies
-    companies = company_logic.companies.get(industry, [])
+    companies = services.get_company_logic().companies.get(industry, [])
     if not companies:
         raise HTTPException(status_code=404, detail="Industry not found")
     return {"companies": companies}
 
+@app.get("/companies/{industry}/ranking")
+def rank_companies(
+    industry: str,
+    year: int = 2026,
+    sort_by: str = "risk",
+    order: str = "desc",
+    limit: int = 20,
+    cursor: str = None,
+    risk_level: str = None,
+    surge: str = None,
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    # Paged ranking over the whole company universe; pass Next_Cursor back as cursor
+    try:
+        result = services.get_company_logic().rank_companies(
+            industry, year, sort_by=sort_by, order=order, limit=limit,
+            cursor=cursor, risk_level=risk_level, surge=surge
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
+    return FastJSONResponse(result)
+
+@app.get("/skills/companies")
+def get_companies_for_skills(
+    skills: str,
+    industry: str = None,
+    match: str = "any",
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    # Which companies value these skills, answered from the skill -> company index
+    if match not in ["any", "all"]:
+        raise HTTPException(status_code=400, detail="match must be 'any' or 'all'")
+    skill_list = [s for s in skills.split(',') if s.strip()]
+    companies = services.get_company_logic().companies_for_skills(skill_list, industry=industry, match=match)
+    return {"companies": companies}
+
 @app.get("/jobs/{industry}")
 def get_jobs(
     industry: str,
     current_user: models.User = Depends(auth.get_current_user)
 ):
     # Student focused but safe for both
-    jobs_data = resume_logic.load_jobs()
+    jobs_data = services.get_resume_logic().load_jobs()
     raw_jobs = jobs_data.get(industry, [])
     # Return only titles for the frontend dropdown
     jobs = [j['title'] for j in raw_jobs]
     return {"jobs": jobs}
 
+@app.get("/dashboard/range")
+def get_dashboard_range(
+    industries: str = None,
+    start_year: int = None,
+    end_year: int = None,
+    fields: str = "supply,demand,risk,surge",
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    # Cross-industry, multi-year overview in one request: industries x years matrix per field
+    industry_list = [i.strip() for i in industries.split(',') if i.strip()] if industries else None
+    field_list = [f.strip() for f in fields.split(',') if f.strip()]
+    try:
+        result = services.get_dashboard().range_query(industry_list, start_year, end_year, field_list)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return FastJSONResponse(result)
+
+def parse_fields(fields, student=False):
+    # Sparse fieldsets, e.g. ?fields=Metrics,Supply_Demand_Trend; unselected parts are not computed
+    if fields is None:
+        return None
+    import industry_analysis
+    try:
+        return industry_analysis.parse_fields(fields, student=student)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/dashboard/{industry}/{year}")
 def get_dashboard_data(
     industry: str, 
     year: int,
+    fields: str = None,
     user: models.User = Depends(auth.role_required(["INDUSTRY_USER"]))
 ):
+    field_set = parse_fields(fields)
     try:
-        result = dashboard_logic.run_analysis(industry, year)
+        result = services.get_dashboard().run_analysis(industry, year, fields=field_set)
         if "error" in result:
              raise HTTPException(status_code=404, detail=result["error"])
-        return result
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -127,13 +264,15 @@ def get_dashboard_data(
 def get_student_dashboard_data(
     industry: str, 
     year: int,
+    fields: str = None,
     user: models.User = Depends(auth.role_required(["STUDENT_USER"]))
 ):
+    field_set = parse_fields(fields, student=True)
     try:
-        result = dashboard_logic.run_student_analysis(industry, year)
+        result = services.get_dashboard().run_student_analysis(industry, year, fields=field_set)
         if "error" in result:
              raise HTTPException(status_code=404, detail=result["error"])
-        return result
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -141,20 +280,68 @@ def get_student_dashboard_data(
 def compare_companies(
     industry: str, 
     companies: str, 
-    year: int,
+    year: int = None,
+    start_year: int = None,
+    end_year: int = None,
     user: models.User = Depends(auth.role_required(["STUDENT_USER"]))
 ):
+    # One year, or per-company series over start_year..end_year (either defaults to year)
+    if start_year is not None or end_year is not None:
+        start_year = year if start_year is None else start_year
+        end_year = year if end_year is None else end_year
+        if start_year is None or end_year is None:
+            raise HTTPException(status_code=400, detail="A year range needs start_year and end_year")
+        if start_year > end_year:
+            raise HTTPException(status_code=400, detail="start_year must not be after end_year")
+        year = start_year
+    elif year is None:
+        raise HTTPException(status_code=400, detail="year or start_year/end_year is required")
     try:
         company_list = companies.split(',')
-        result = company_logic.compare_companies(industry, company_list, year)
+        result = services.get_company_logic().compare_companies(industry, company_list, year, end_year=end_year)
         if isinstance(result, dict) and "error" in result:
              raise HTTPException(status_code=404, detail=result["error"])
-        return result
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Rewrites the panel every user and worker reads, so it also takes the admin token
+@app.post("/data/ingest", dependencies=[Depends(admin_required)])
+def ingest_data(
+    payload: dict = Body(...),
+    user: models.User = Depends(auth.role_required(["INDUSTRY_USER"]))
+):
+    # Rows use the CSV layouts: {"attrition": [...], "growth": [...], "internship": [...]}
+    # Only the industries present in the payload are refitted and rescored
+    try:
+        result = services.get_dashboard().ingest(
+            attrition=payload.get("attrition"),
+            growth=payload.get("growth"),
+            internship=payload.get("internship"),
+            rescore_all=bool(payload.get("rescore_all", False))
+        )
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return result
+
+@contextmanager
+def saved_upload(file):
+    """
+    Writes an uploaded file to a private temporary file and yields its path.
+    The name is never taken from the client, so concurrent uploads cannot
+    collide or escape the temp directory, and the file is removed however
+    the request ends.
+    """
+    buffer = tempfile.NamedTemporaryFile(prefix="upload-", suffix=".pdf", delete=False)
+    try:
+        with buffer:
+            shutil.copyfileobj(file.file, buffer)
+        yield buffer.name
+    finally:
+        os.remove(buffer.name)
+
 @app.post("/resume/analyze")
-async def analyze_resume(
+def analyze_resume(
     file: UploadFile = File(...),
     industry: str = Form(...),
     company: str = Form(...),
@@ -163,18 +350,32 @@ async def analyze_resume(
     user: models.User = Depends(auth.role_required(["STUDENT_USER"]))
 ):
     try:
-        temp_dir = "temp_uploads"
-        os.makedirs(temp_dir, exist_ok=True)
-        file_path = os.path.join(temp_dir, file.filename)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        result = resume_logic.analyze_resume(file_path, industry, company, job_title, year)
-        os.remove(file_path)
-        if "error" in result:
-            raise HTTPException(status_code=400, detail=result["error"])
-        return result
+        with saved_upload(file) as file_path:
+            result = services.get_resume_logic().analyze_resume(file_path, industry, company, job_title, year)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return FastJSONResponse(result)
+
+@app.post("/resume/best-matches")
+def resume_best_matches(
+    file: UploadFile = File(...),
+    year: int = Form(2026),
+    top_k: int = Form(10),
+    user: models.User = Depends(auth.role_required(["STUDENT_USER"]))
+):
+    # Ranks the resume against every job in every industry in one pass
+    try:
+        with saved_upload(file) as file_path:
+            result = services.get_resume_logic().best_matches(file_path, year, max(1, min(top_k, 100)))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return FastJSONResponse(result)
+
+services.record_timing("imports", "api", _api_import_start)
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
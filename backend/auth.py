@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
@@ -14,17 +13,25 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480 # 8 hours for demo stability
 
 # Switch to sha256_crypt to avoid bcrypt 72-byte/init check issues in certain environments
-pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+# Created on first use so importing the API does not pay for passlib's setup
+_pwd_context = None
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+def get_pwd_context():
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+    return _pwd_context
+
 def verify_password(plain_password, hashed_password):
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        return get_pwd_context().verify(plain_password, hashed_password)
     except Exception:
         return False
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
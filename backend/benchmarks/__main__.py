@@ -0,0 +1,49 @@
+"""
+Runs the benchmark suite.
+
+Usage (from backend/):
+    python -m benchmarks                         # everything
+    python -m benchmarks -k CompareCompanies     # only matching benchmarks
+    python -m benchmarks --max-param 100         # skip the 1000x sizes
+    python -m benchmarks --save base.json
+    python -m benchmarks --compare base.json
+"""
+import argparse
+import sys
+
+from benchmarks import harness
+
+SUITE = [
+    "benchmarks.bench_engines",
+    "benchmarks.bench_endpoints",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Workforce Intelligence benchmark suite")
+    parser.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    parser.add_argument("--max-param", type=float, help="skip parameter values above this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per benchmark")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    parser.add_argument("--verbose", action="store_true", help="do not silence engine logging")
+    args = parser.parse_args()
+
+    results = harness.run(
+        SUITE,
+        pattern=args.pattern,
+        max_param=args.max_param,
+        min_time=args.min_time,
+        quiet=not args.verbose,
+    )
+    if args.save:
+        harness.save(results, args.save)
+    if args.compare:
+        regressions = harness.compare(results, args.compare, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Endpoint benchmarks through an in-process ASGI client (no sockets), so they
+measure routing, auth dependencies, the analysis call and JSON encoding.
+Authentication is replaced by a fixed user of the role the endpoint requires.
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+
+import httpx
+
+import api
+import auth
+import compression
+import services
+from benchmarks import synthetic
+from benchmarks.bench_engines import build_dashboard
+from benchmarks.harness import SkipBenchmark
+from company_analysis import CompanyAnalysis
+from resume_analyzer import ResumeAnalyzer
+
+
+class _BenchUser:
+    email = "bench@example.com"
+
+    def __init__(self, role):
+        self.role = role
+
+
+class _EndpointBenchmark:
+    role = "STUDENT_USER"
+    params = [[1, 10, 100]]
+    param_names = ["industry_scale"]
+
+    def setup(self, industry_scale):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        dashboard = build_dashboard(self.tmp, industry_scale)
+        dashboard._prepare_data()
+        company_logic = CompanyAnalysis(dashboard=dashboard)
+        company_logic.companies = synthetic.company_universe(industries=5 * industry_scale)
+        resume_logic = ResumeAnalyzer(dashboard=dashboard, company_logic=company_logic)
+        services.install(dashboard, company_logic, resume_logic)
+
+        user = _BenchUser(self.role)
+        api.app.dependency_overrides[auth.get_current_user] = lambda: user
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=api.app), base_url="http://bench"
+        )
+
+    def teardown(self, industry_scale):
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+        api.app.dependency_overrides.pop(auth.get_current_user, None)
+        services.install()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def get(self, path, **kwargs):
+        response = self.loop.run_until_complete(self.client.get(path, **kwargs))
+        assert response.status_code == 200, response.text
+        return response
+
+
+class CheapEndpoints(_EndpointBenchmark):
+    def time_industries(self, industry_scale):
+        self.get("/industries")
+
+    def time_companies(self, industry_scale):
+        self.get("/companies/IT")
+
+
+class DashboardEndpoint(_EndpointBenchmark):
+    role = "INDUSTRY_USER"
+
+    def time_dashboard(self, industry_scale):
+        self.get("/dashboard/IT/2026")
+
+
+class RangeEndpoint(_EndpointBenchmark):
+    """One range query vs. the per-(industry, year) dashboard calls it replaces."""
+    role = "INDUSTRY_USER"
+    params = [[1, 10]]
+
+    def setup(self, industry_scale):
+        super().setup(industry_scale)
+        self.industries = synthetic.industry_names(5 * industry_scale)[:10]
+        self.years = range(2022, 2030)
+
+    def time_range_query(self, industry_scale):
+        self.get("/dashboard/range", params={
+            "industries": ",".join(self.industries),
+            "start_year": self.years[0],
+            "end_year": self.years[-1],
+        })
+
+    def time_dashboard_per_cell(self, industry_scale):
+        for industry in self.industries:
+            for year in self.years:
+                self.get(f"/dashboard/{industry}/{year}")
+
+
+class StudentEndpoints(_EndpointBenchmark):
+    def time_student_dashboard(self, industry_scale):
+        self.get("/student/dashboard/IT/2026")
+
+    def time_company_compare(self, industry_scale):
+        self.get("/company/compare", params={
+            "industry": "IT",
+            "companies": ",".join(synthetic.company_universe()["IT"][:3]),
+            "year": 2026,
+        })
+
+
+class StudentPayload(_EndpointBenchmark):
+    """
+    Bytes on the wire and CPU per request for the full student dashboard vs. a
+    sparse fieldset, uncompressed and with each negotiated encoding.
+    """
+    params = [[1, 100], ["full", "sparse"], ["identity", "gzip", "br"]]
+    param_names = ["industry_scale", "payload", "encoding"]
+    fields = {"full": None, "sparse": "Metrics,Student_Insights.Hiring_Outlook"}
+
+    def setup(self, industry_scale, payload, encoding):
+        if encoding not in compression.available_encodings() + ["identity"]:
+            raise SkipBenchmark(f"{encoding} is not available")
+        super().setup(industry_scale)
+        self.params = {"fields": self.fields[payload]} if self.fields[payload] else {}
+        self.headers = {"Accept-Encoding": encoding}
+
+    def teardown(self, industry_scale, payload, encoding):
+        super().teardown(industry_scale)
+
+    def request(self):
+        return self.get("/student/dashboard/IT/2026", params=self.params, headers=self.headers)
+
+    def time_request(self, industry_scale, payload, encoding):
+        self.request()
+
+    def track_wire_bytes(self, industry_scale, payload, encoding):
+        return self.request().num_bytes_downloaded
+    track_wire_bytes.unit = "B"
+
+    def track_cpu_per_request(self, industry_scale, payload, encoding, n=50):
+        # Server and in-process client share the CPU clock; the client side is only a JSON decode
+        self.request()
+        start = time.process_time()
+        for _ in range(n):
+            self.request()
+        return (time.process_time() - start) / n * 1e3
+    track_cpu_per_request.unit = "ms CPU"
+
+
+class ResumeEndpoint(_EndpointBenchmark):
+    params = [[1, 10]]
+    param_names = ["pages"]
+
+    def setup(self, pages):
+        super().setup(1)
+        self.pdf_bytes = open(
+            synthetic.write_resume_pdf(os.path.join(self.tmp, "resume.pdf"), pages=pages), "rb"
+        ).read()
+
+    def teardown(self, pages):
+        super().teardown(1)
+
+    def time_resume_analyze(self, pages):
+        response = self.loop.run_until_complete(self.client.post(
+            "/resume/analyze",
+            files={"file": ("resume.pdf", self.pdf_bytes, "application/pdf")},
+            data={"industry": "IT", "company": "TCS", "job_title": "Software Engineer", "year": "2026"},
+        ))
+        assert response.status_code == 200, response.text
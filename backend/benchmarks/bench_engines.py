@@ -0,0 +1,330 @@
+"""
+Engine-level benchmarks: panel preparation, scoring, company comparison,
+student analysis, resume analysis and job ranking, at 1x-1000x the shipped
+data size.
+"""
+import itertools
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import narrative_rules
+import panel_store
+import sharded_scoring
+
+from benchmarks import synthetic
+from benchmarks.harness import SkipBenchmark
+from company_analysis import CompanyAnalysis
+from industry_analysis import IndustryDashboard
+from job_catalogue import JobCatalogue
+from resume_analyzer import ResumeAnalyzer
+from skill_taxonomy import SkillTaxonomy
+
+SCALES = [1, 10, 100, 1000]
+
+
+def build_dashboard(tmp_dir, industry_scale=1, years=synthetic.BASE_YEARS):
+    data_dir = synthetic.write_panel(
+        os.path.join(tmp_dir, "data"), industries=5 * industry_scale, years=years
+    )
+    dashboard = IndustryDashboard(data_dir=data_dir)
+    dashboard.load_data()
+    return dashboard
+
+
+class PrepareData:
+    params = [SCALES, [5, 50]]
+    param_names = ["industry_scale", "years"]
+
+    def setup(self, industry_scale, years):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.dashboard = build_dashboard(self.tmp, industry_scale, years)
+
+    def teardown(self, industry_scale, years):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_load_data(self, industry_scale, years):
+        self.dashboard.data = None
+        self.dashboard.load_data()
+
+    def time_prepare_data_cold(self, industry_scale, years):
+        # Full rebuild: model fit, forecast and scoring
+        self.dashboard.models = {}
+        self.dashboard.scored_data = None
+        self.dashboard._prepare_data()
+
+    def time_reload(self, industry_scale, years):
+        # Background rebuild into a fresh dashboard plus the swap
+        self.dashboard.reload()
+
+
+class PanelStore:
+    """CSV parse + merge vs. the compiled, memory-mapped columnar store."""
+    params = [SCALES]
+    param_names = ["industry_scale"]
+
+    def setup(self, industry_scale):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.data_dir = synthetic.write_panel(
+            os.path.join(self.tmp, "data"), industries=5 * industry_scale, years=20
+        )
+        self.store_dir = panel_store.build_store(self.data_dir)
+
+    def teardown(self, industry_scale):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_load_csv(self, industry_scale):
+        panel_store.read_csv_panel(self.data_dir)
+
+    def time_load_store(self, industry_scale):
+        panel_store.load_store(self.store_dir)
+
+    def track_memory_csv(self, industry_scale):
+        return panel_store.read_csv_panel(self.data_dir).memory_usage(deep=True).sum() / 2 ** 20
+    track_memory_csv.unit = "MiB"
+
+    def track_memory_store(self, industry_scale):
+        return panel_store.load_store(self.store_dir).memory_usage(deep=True).sum() / 2 ** 20
+    track_memory_store.unit = "MiB"
+
+
+class CalculateScores:
+    params = [SCALES]
+    param_names = ["industry_scale"]
+
+    def setup(self, industry_scale):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.dashboard = build_dashboard(self.tmp, industry_scale)
+        self.dashboard.train_models()
+        future_df = self.dashboard.predict_future()
+        self.panel = pd.concat([self.dashboard.data, future_df], ignore_index=True)
+        self.panel = self.panel.sort_values(by=["Industry", "Year"])
+        self.scored = self.dashboard.calculate_scores(self.panel.copy())
+
+    def teardown(self, industry_scale):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_predict_future(self, industry_scale):
+        self.dashboard.predict_future()
+
+    def time_calculate_scores(self, industry_scale):
+        self.dashboard.calculate_scores(self.panel.copy())
+
+    def time_narrative_rules(self, industry_scale):
+        # Every rule table over the whole scored panel (part of calculate_scores)
+        narrative_rules.annotate(self.scored.copy())
+
+
+class ShardedScoring:
+    """
+    In-process vs. process-pool scoring of a scored-ready panel; the rows at
+    which the pool starts winning is the PARALLEL_MIN_ROWS crossover.
+    """
+    params = [[1000, 10000, 50000, 200000], [1, 2, 4]]
+    param_names = ["industries", "workers"]
+
+    def setup(self, industries, workers):
+        if workers > 1 and workers > (os.cpu_count() or 1):
+            raise SkipBenchmark(f"only {os.cpu_count()} CPUs")
+        rng = np.random.default_rng(5)
+        years = 20
+        n = industries * years
+        self.panel = pd.DataFrame({
+            "Industry": np.repeat(synthetic.industry_names(industries), years),
+            "Year": np.tile(np.arange(2010, 2010 + years), industries),
+            "Attrition_Rate": rng.uniform(0.05, 0.2, n),
+            "Talent_Supply_Raw": rng.uniform(100, 600, n),
+            "Talent_Demand_Raw": rng.uniform(0.1, 0.5, n),
+        })
+        if workers > 1:
+            sharded_scoring.get_pool(workers)  # pool start-up is not part of the measurement
+
+    def teardown(self, industries, workers):
+        sharded_scoring.shutdown_pool()
+
+    def time_score_panel(self, industries, workers):
+        sharded_scoring.score_panel(self.panel, workers=workers, min_parallel_rows=0)
+
+
+class Ingest:
+    params = [SCALES]
+    param_names = ["industry_scale"]
+
+    def setup(self, industry_scale):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.dashboard = build_dashboard(self.tmp, industry_scale)
+        self.dashboard._prepare_data()
+        self.rows = [{"Industry": "IT", "Year": 2026, "Attrition_Rate": 0.15}]
+
+    def teardown(self, industry_scale):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_ingest_one_industry(self, industry_scale):
+        self.dashboard.ingest(attrition=self.rows)
+
+
+class CompareCompanies:
+    params = [SCALES]
+    param_names = ["company_scale"]
+
+    def setup(self, company_scale):
+        self.dashboard = IndustryDashboard()
+        self.dashboard._prepare_data()
+        self.company_logic = CompanyAnalysis(dashboard=self.dashboard)
+        self.company_logic.companies = synthetic.company_universe(
+            companies=synthetic.BASE_COMPANIES * company_scale
+        )
+        self.all_companies = list(self.company_logic.companies["IT"])
+        self.selected = self.all_companies[:3]
+        self.new_ids = itertools.count()
+
+    def time_compare_selected(self, company_scale):
+        self.company_logic.compare_companies("IT", self.selected, 2026)
+
+    def time_compare_all(self, company_scale):
+        self.company_logic.compare_companies("IT", self.all_companies, 2026)
+
+    def time_compare_series(self, company_scale):
+        # 8 years in one call vs. the per-year calls it replaces
+        self.company_logic.compare_companies("IT", self.selected, 2022, end_year=2029)
+
+    def time_compare_per_year(self, company_scale):
+        for year in range(2022, 2030):
+            self.company_logic.compare_companies("IT", self.selected, year)
+
+    def time_add_companies(self, company_scale):
+        # 50 new companies streamed into the cached P5/P95 sketches, then a comparison
+        self.company_logic.add_companies("IT", [f"New_{next(self.new_ids)}" for _ in range(50)])
+        self.company_logic.compare_companies("IT", self.selected, 2026)
+
+
+class RankCompanies:
+    """One ranked page vs. the full comparison payload for the same universe."""
+    params = [SCALES]
+    param_names = ["company_scale"]
+
+    def setup(self, company_scale):
+        self.dashboard = IndustryDashboard()
+        self.dashboard._prepare_data()
+        self.company_logic = CompanyAnalysis(dashboard=self.dashboard)
+        self.company_logic.companies = synthetic.company_universe(
+            companies=synthetic.BASE_COMPANIES * company_scale
+        )
+        first = self.company_logic.rank_companies("IT", 2026, limit=20)
+        self.cursor = first["Next_Cursor"]
+
+    def time_first_page(self, company_scale):
+        self.company_logic.rank_companies("IT", 2026, sort_by="risk", limit=20)
+
+    def time_next_page(self, company_scale):
+        self.company_logic.rank_companies("IT", 2026, sort_by="risk", limit=20, cursor=self.cursor)
+
+    def time_filtered_page(self, company_scale):
+        self.company_logic.rank_companies("IT", 2026, sort_by="hpi", limit=20,
+                                          risk_level="High Risk", surge="1-3 months")
+
+
+class StudentAnalysis:
+    params = [[1, 10, 100]]
+    param_names = ["industry_scale"]
+
+    def setup(self, industry_scale):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.dashboard = build_dashboard(self.tmp, industry_scale)
+        self.dashboard._prepare_data()
+
+    def teardown(self, industry_scale):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_run_analysis(self, industry_scale):
+        self.dashboard.run_analysis("IT", 2026)
+
+    def time_run_student_analysis(self, industry_scale):
+        self.dashboard.run_student_analysis("IT", 2026)
+
+
+class ResumeAnalysis:
+    params = [[1, 10, 100]]
+    param_names = ["pages"]
+
+    def setup(self, pages):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.pdf_path = synthetic.write_resume_pdf(os.path.join(self.tmp, "resume.pdf"), pages=pages)
+        self.analyzer = ResumeAnalyzer()
+        self.analyzer.industry_dashboard._prepare_data()
+        if "error" in self.analyzer.analyze_resume(self.pdf_path, "IT", "", "Software Engineer"):
+            raise SkipBenchmark("synthetic resume could not be parsed")
+
+    def teardown(self, pages):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_extract_text(self, pages):
+        self.analyzer.extract_text(self.pdf_path)
+
+    def time_analyze_resume(self, pages):
+        self.analyzer.analyze_resume(self.pdf_path, "IT", "", "Software Engineer")
+
+
+class SkillMatching:
+    """Resume text against the skill taxonomy (aliases, plurals, fuzzy trigram matches)."""
+    params = [[1, 10, 100], [100, 10000]]
+    param_names = ["pages", "skills"]
+
+    def setup(self, pages, skills):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        pdf_path = synthetic.write_resume_pdf(os.path.join(self.tmp, "resume.pdf"), pages=pages)
+        self.resume_text = ResumeAnalyzer().extract_text(pdf_path)
+        if not self.resume_text:
+            raise SkipBenchmark("synthetic resume could not be parsed")
+        self.jobs_data = synthetic.job_catalogue(jobs=skills, vocabulary=skills)
+        self.taxonomy = SkillTaxonomy.build(self.jobs_data)
+
+    def teardown(self, pages, skills):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_build_taxonomy(self, pages, skills):
+        SkillTaxonomy.build(self.jobs_data)
+
+    def time_scan_cold(self, pages, skills):
+        # Fuzzy lookups are cached per word; a fresh cache is the first resume after a rebuild
+        self.taxonomy._fuzzy.cache_clear()
+        self.taxonomy.scan(self.resume_text)
+
+    def time_scan(self, pages, skills):
+        self.taxonomy.scan(self.resume_text)
+
+    def track_words_per_second(self, pages, skills):
+        words = len(self.resume_text.split())
+        self.taxonomy.scan(self.resume_text)
+        start = time.perf_counter()
+        self.taxonomy.scan(self.resume_text)
+        return round(words / (time.perf_counter() - start))
+    track_words_per_second.unit = "words/s"
+
+
+class RankJobs:
+    """One resume against the whole job catalogue (best-matches mode)."""
+    params = [[11, 1000, 10000, 50000]]
+    param_names = ["jobs"]
+
+    def setup(self, jobs):
+        self.tmp = tempfile.mkdtemp(prefix="wf-bench-")
+        self.analyzer = ResumeAnalyzer()
+        self.analyzer.industry_dashboard._prepare_data()
+        self.jobs_data = synthetic.job_catalogue(jobs=jobs)
+        self.catalogue = JobCatalogue(self.jobs_data)
+        pdf_path = synthetic.write_resume_pdf(os.path.join(self.tmp, "resume.pdf"), pages=2)
+        self.resume_text = self.analyzer.extract_text(pdf_path)
+
+    def teardown(self, jobs):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def time_build_catalogue(self, jobs):
+        JobCatalogue(self.jobs_data)
+
+    def time_rank_jobs(self, jobs):
+        self.analyzer.rank_jobs(self.resume_text, 2026, top_k=10, catalogue=self.catalogue)
@@ -0,0 +1,65 @@
+"""
+Startup benchmark for the API process.
+
+Spawns fresh interpreters and measures how long `import api` takes and how
+long the first analysis request pays for deferred imports and warm-up.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_SCRIPT = """
+import contextlib, io, json, time
+start = time.perf_counter()
+import api, services
+import_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    services.warm_up()
+warm_up_ms = (time.perf_counter() - start) * 1000
+report = services.startup_report()
+print(json.dumps({"import_ms": import_ms, "first_request_ms": warm_up_ms, "report": report}))
+"""
+
+
+def run_once():
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API import and warm-up time")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    first_ms = statistics.median(s["first_request_ms"] for s in samples)
+
+    print(f"import api           median {import_ms:8.1f} ms  ({args.runs} runs)")
+    print(f"first request warm   median {first_ms:8.1f} ms")
+
+    # Breakdown from the last run (individual timings vary little between runs)
+    report = samples[-1]["report"]
+    for section in ("imports", "init", "warm_up"):
+        print(f"\n{section}:")
+        for name, ms in sorted(report[section].items(), key=lambda kv: -kv[1]):
+            print(f"  {name:<28} {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
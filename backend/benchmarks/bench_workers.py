@@ -0,0 +1,141 @@
+"""
+RPS scaling benchmark for the multi-worker launcher (serve.py).
+
+For each worker count it starts `serve.py`, drives /dashboard/{industry}/{year}
+from several client processes for a fixed duration, and reports requests per
+second plus the resident (RSS) and proportional (PSS, Linux only) memory of
+the server processes. PSS shows how much of the preloaded state the workers
+actually share.
+
+Usage (from backend/):
+    python -m benchmarks.bench_workers --workers 1 2 4 --duration 10
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def get_token():
+    sys.path.insert(0, BACKEND_DIR)
+    import auth
+    import init_db
+    init_db.init_db()
+    return auth.create_access_token(
+        data={"sub": "industry@example.com", "role": "INDUSTRY_USER"}
+    )
+
+
+def wait_ready(base_url, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(base_url + "/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def client_loop(url, token, duration, counter):
+    headers = {"Authorization": f"Bearer {token}"}
+    done = 0
+    with httpx.Client(headers=headers, timeout=30) as client:
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            if client.get(url).status_code == 200:
+                done += 1
+    with counter.get_lock():
+        counter.value += done
+
+
+def process_tree(pid):
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            pids += [int(p) for p in f.read().split()]
+    except OSError:
+        pass
+    return pids
+
+
+def memory_mb(pids):
+    rss = pss = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("Rss:"):
+                        rss += int(line.split()[1])
+                    elif line.startswith("Pss:"):
+                        pss += int(line.split()[1])
+        except OSError:
+            return None, None
+    return rss / 1024, pss / 1024
+
+
+def run(workers, clients, duration, token, path):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    proc = subprocess.Popen(
+        [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers)],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        start = time.monotonic()
+        wait_ready(base_url)
+        boot_s = time.monotonic() - start
+
+        counter = multiprocessing.Value("i", 0)
+        procs = [
+            multiprocessing.Process(target=client_loop, args=(base_url + path, token, duration, counter))
+            for _ in range(clients)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+
+        rss, pss = memory_mb(process_tree(proc.pid))
+        return counter.value / duration, boot_s, rss, pss
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API throughput vs. worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--path", default="/dashboard/IT/2026")
+    args = parser.parse_args()
+
+    token = get_token()
+    print(f"{'workers':>7} {'rps':>9} {'boot s':>7} {'rss MB':>8} {'pss MB':>8}")
+    for n in args.workers:
+        rps, boot_s, rss, pss = run(n, args.clients, args.duration, token, args.path)
+        rss_s = f"{rss:8.1f}" if rss is not None else "     n/a"
+        pss_s = f"{pss:8.1f}" if pss is not None else "     n/a"
+        print(f"{n:>7} {rps:9.1f} {boot_s:7.1f} {rss_s} {pss_s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Minimal asv-style benchmark runner.
+
+A benchmark module defines classes with optional `params` / `param_names`
+(a list of value lists; every combination is run), an optional `setup(*params)`
+and `teardown(*params)`, and one or more `time_*` methods. Setup runs once per
+class and parameter combination; each `time_*` method is then called
+repeatedly and the median and minimum wall time are reported. `track_*`
+methods are called once and their return value is reported as-is (with the
+method's optional `unit` attribute), e.g. for memory footprints.
+
+Results can be saved as JSON and compared against a previous run to catch
+regressions:
+
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json --threshold 1.25
+"""
+import contextlib
+import importlib
+import inspect
+import io
+import itertools
+import json
+import statistics
+import time
+
+
+class SkipBenchmark(Exception):
+    """Raised from setup() to skip a parameter combination."""
+
+
+def _param_grid(cls):
+    params = getattr(cls, "params", None)
+    if not params:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _label(cls, method_name, combo):
+    name = f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}.{method_name}"
+    if combo:
+        name += "(" + ", ".join(str(p) for p in combo) + ")"
+    return name
+
+
+def _time_call(fn, combo, min_time, min_repeat, max_repeat):
+    samples = []
+    total = 0.0
+    while len(samples) < max_repeat and (len(samples) < min_repeat or total < min_time):
+        start = time.perf_counter()
+        fn(*combo)
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        total += elapsed
+    return samples
+
+
+def discover(module_names):
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            methods = sorted(n for n in dir(cls) if n.startswith(("time_", "track_")))
+            if methods:
+                yield cls, methods
+
+
+def run(module_names, pattern=None, max_param=None, min_time=0.2, min_repeat=3,
+        max_repeat=50, quiet=True):
+    """
+    Runs every discovered benchmark and returns {label: {"median": s, "min": s, "n": k}}.
+    max_param skips parameter combinations containing a numeric value above it.
+    """
+    results = {}
+    for cls, methods in discover(module_names):
+        for combo in _param_grid(cls):
+            if max_param is not None and any(
+                isinstance(p, (int, float)) and p > max_param for p in combo
+            ):
+                continue
+            labels = [_label(cls, m, combo) for m in methods]
+            if pattern and not any(pattern in label for label in labels):
+                continue
+
+            instance = cls()
+            sink = io.StringIO()
+            # Engines log heavily via print(); keep that out of the report
+            redirect = contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()
+            try:
+                with redirect:
+                    if hasattr(instance, "setup"):
+                        instance.setup(*combo)
+            except SkipBenchmark as e:
+                print(f"skip  {labels[0]}: {e}")
+                continue
+
+            try:
+                for method_name, label in zip(methods, labels):
+                    if pattern and pattern not in label:
+                        continue
+                    fn = getattr(instance, method_name)
+                    if method_name.startswith("track_"):
+                        with redirect:
+                            value = fn(*combo)
+                        unit = getattr(fn, "unit", "")
+                        results[label] = {"value": value, "unit": unit}
+                        print(f"{label:<70} {value:12.3f} {unit}")
+                        continue
+                    with redirect:
+                        fn(*combo)  # warm-up call, not timed
+                        samples = _time_call(fn, combo, min_time, min_repeat, max_repeat)
+                    sink.seek(0)
+                    sink.truncate()
+                    results[label] = {
+                        "median": statistics.median(samples),
+                        "min": min(samples),
+                        "n": len(samples),
+                    }
+                    print(f"{label:<70} {_fmt(results[label]['median'])}  (min {_fmt(results[label]['min'])}, n={len(samples)})")
+            finally:
+                if hasattr(instance, "teardown"):
+                    with redirect:
+                        instance.teardown(*combo)
+    return results
+
+
+def _fmt(seconds):
+    if seconds >= 1:
+        return f"{seconds:8.3f} s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.1f} us"
+
+
+def save(results, path):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def compare(results, baseline_path, threshold):
+    """Prints the ratio to a saved baseline; returns the labels that regressed."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = []
+    print(f"\n{'benchmark':<70} {'ratio':>7}")
+    for label, current in sorted(results.items()):
+        if label not in baseline:
+            continue
+        key = "median" if "median" in current else "value"
+        if not baseline[label].get(key):
+            continue
+        ratio = current[key] / baseline[label][key]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(label)
+        elif ratio < 1 / threshold:
+            flag = "  improved"
+        print(f"{label:<70} {ratio:7.2f}{flag}")
+    return regressions
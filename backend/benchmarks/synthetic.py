@@ -0,0 +1,139 @@
+"""
+Synthetic data generators for the benchmark suite.
+
+The real panel is 5 industries x 5 years with 5 companies per industry. These
+helpers write panels of the same shape scaled along industries, years and
+companies, plus resume PDFs of arbitrary length, so the engines can be timed
+at 10x-1000x the shipped data.
+"""
+import os
+import random
+
+BASE_INDUSTRIES = ["IT", "Healthcare", "Manufacturing", "EV", "Finance"]
+BASE_YEARS = 5
+BASE_COMPANIES = 5
+LAST_YEAR = 2026  # forecasts start at 2027, as with the real data
+
+SKILL_POOL = [
+    "Python", "Java", "SQL", "AI/ML", "Cloud", "React", "Radiology", "Nursing",
+    "Patient Care", "CAD", "Quality Control", "Supply Chain", "Robotics", "Safety",
+    "Battery Tech", "Power Electronics", "Embedded Systems", "Excel", "Accounting",
+    "Risk Management", "Compliance", "Financial Analysis", "Kubernetes", "Docker",
+]
+
+
+def industry_names(n):
+    names = BASE_INDUSTRIES[:n]
+    names += [f"Industry_{i:04d}" for i in range(len(names), n)]
+    return names
+
+
+def write_panel(data_dir, industries=5, years=BASE_YEARS, seed=7):
+    """Writes attrition/growth/internship CSVs for industries x years rows."""
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+    first_year = LAST_YEAR - years + 1
+
+    attrition = ["Industry,Year,Attrition_Rate"]
+    growth = ["Industry,Year,Growth_Rate"]
+    internship = ["Industry,Year,Interns_Intake,Conversion_Rate,Top_Skills"]
+    for name in industry_names(industries):
+        intake = rng.randint(400, 1200)
+        attr = rng.uniform(0.05, 0.2)
+        grow = rng.uniform(0.03, 0.2)
+        conv = rng.uniform(0.25, 0.5)
+        for year in range(first_year, LAST_YEAR + 1):
+            intake = max(50, int(intake * rng.uniform(0.95, 1.12)))
+            attr = min(0.35, max(0.02, attr + rng.uniform(-0.015, 0.015)))
+            grow = min(0.3, max(0.0, grow + rng.uniform(-0.02, 0.02)))
+            conv = min(0.95, max(0.2, conv + rng.uniform(-0.03, 0.03)))
+            skills = ", ".join(rng.sample(SKILL_POOL, 3))
+            attrition.append(f"{name},{year},{attr:.3f}")
+            growth.append(f"{name},{year},{grow:.3f}")
+            internship.append(f'{name},{year},{intake},{conv:.2f},"{skills}"')
+
+    for filename, lines in (
+        ("attrition_data.csv", attrition),
+        ("industry_growth.csv", growth),
+        ("internship_data.csv", internship),
+    ):
+        with open(os.path.join(data_dir, filename), "w") as f:
+            f.write("\n".join(lines) + "\n")
+    return data_dir
+
+
+def company_universe(industries=5, companies=BASE_COMPANIES):
+    """Company names per industry, shaped like CompanyAnalysis.companies."""
+    return {
+        name: [f"{name}_Co{j:05d}" for j in range(companies)]
+        for name in industry_names(industries)
+    }
+
+
+def job_catalogue(jobs=11, industries=5, skills_per_job=5, vocabulary=2000, seed=13):
+    """jobs.json-shaped catalogue: `jobs` jobs spread over `industries` industries."""
+    rng = random.Random(seed)
+    # Real skill names first so synthetic resumes hit some of them
+    pool = SKILL_POOL + [f"Skill {i}" for i in range(max(0, vocabulary - len(SKILL_POOL)))]
+    names = industry_names(industries)
+    catalogue = {name: [] for name in names}
+    for i in range(jobs):
+        catalogue[names[i % industries]].append({
+            "title": f"Job {i}",
+            "core_skills": rng.sample(pool, skills_per_job),
+        })
+    return catalogue
+
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_resume_pdf(path, pages=1, lines_per_page=45, seed=11):
+    """Writes a minimal text-only PDF resume with the given number of pages."""
+    rng = random.Random(seed)
+    filler = ["experience", "project", "team", "delivered", "designed", "built",
+              "improved", "analysis", "pipeline", "platform", "results", "with"]
+
+    font_id = 3
+    page_ids = []
+    content_ids = []
+    next_id = 4
+    for _ in range(pages):
+        page_ids.append(next_id)
+        content_ids.append(next_id + 1)
+        next_id += 2
+
+    bodies = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: "<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{p} 0 R" for p in page_ids), pages),
+        font_id: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, content_id in zip(page_ids, content_ids):
+        bodies[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {content_id} 0 R /Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        lines = []
+        for _ in range(lines_per_page):
+            words = rng.sample(filler, 5) + rng.sample(SKILL_POOL, 2)
+            rng.shuffle(words)
+            lines.append(_pdf_escape(" ".join(words)))
+        stream = "BT /F1 10 Tf 14 TL 50 760 Td " + " ".join(f"({l}) '" for l in lines) + " ET"
+        bodies[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in range(1, next_id):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{bodies[obj_id]}\nendobj\n".encode("latin-1")
+    xref_at = len(out)
+    out += f"xref\n0 {next_id}\n0000000000 65535 f \n".encode()
+    for obj_id in range(1, next_id):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {next_id} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+    return path
@@ -1,11 +1,44 @@
-import pandas as pd
 import numpy as np
+import base64
+import heapq
+import threading
 from industry_analysis import IndustryDashboard
+from quantile_sketch import QuantileSketch
+from singleflight import coalesced
+from skill_index import SkillIndex, PROFILES_FILE
 import json
 
+# rank_companies sort keys -> company_frame columns
+RANK_FIELDS = {"risk": "Risk_Score", "hpi": "HPI", "demand": "Demand_Score", "supply": "Supply_Score"}
+RISK_LEVELS = ["Low Risk", "Medium Risk", "High Risk"]
+SURGE_WINDOWS = ["1-3 months", "4-6 months", "6-12 months"]
+MAX_PAGE_SIZE = 100
+# Industry metrics the company raw metrics are derived from; a change rebuilds the bounds sketches
+BASELINE_METRICS = ["Internship_Intake", "Conversion_Rate", "Attrition_Rate", "Growth_Rate"]
+SKETCH_CHUNK = 65536
+# The only part of the industry analysis the company metrics are derived from
+BASELINE_FIELDS = frozenset(["Metrics"])
+
+
+def encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, company, row = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (float(value), str(company), int(row))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
 class CompanyAnalysis:
-    def __init__(self, dashboard=None):
+    def __init__(self, dashboard=None, profiles_path=PROFILES_FILE):
         self.industry_dashboard = dashboard or IndustryDashboard()
+        # Fallback universe, only used when company_profiles.csv is missing or has no
+        # rows for an industry. The shipped CSV profiles all five industries, so
+        # normally every list below is replaced by the CSV's companies.
         self.companies = {
             "IT": ["MetaSystems", "CyberCloud", "DataPulse", "NexTech", "CloudCore"],
             "Healthcare": ["BioHealth", "MediLife", "NanoCare", "PulseMedical", "LifeStream"],
@@ -13,6 +46,36 @@ class CompanyAnalysis:
             "EV": ["VoltMotors", "ChargePoint", "EcoDrive", "LithiumIon", "SparkEV"],
             "Finance": ["WealthWise", "SecureBank", "FinFlow", "CapitalOne", "TradeMaster"]
         }
+        # Skill -> company inverted index; profiled industries replace the fallback lists
+        self.skill_index = SkillIndex.from_csv(profiles_path)
+        self.companies.update({industry: list(names) for industry, names in self.skill_index.companies.items()})
+        # Per-seed random draws are deterministic, so they are computed once
+        self._draw_cache = {}
+        self._trend_cache = {}
+        # (industry, year) -> Supply/Demand raw quantile sketches over the company universe
+        self._sketches = {}
+        self._sketch_lock = threading.Lock()
+        if self.industry_dashboard.company_logic is None:
+            self.industry_dashboard.company_logic = self
+
+    def companies_for_skills(self, skills, industry=None, match="any"):
+        """Companies whose core/emerging skills include the given skills (see SkillIndex)."""
+        return self.skill_index.companies_for_skills(skills, industry=industry, match=match)
+
+    def _company_draws(self, seed):
+        # Same values as np.random.seed(seed) + np.random.rand() calls, without the global state
+        draws = self._draw_cache.get(seed)
+        if draws is None:
+            draws = self._draw_cache[seed] = np.random.RandomState(seed).rand(4)
+        return draws
+
+    def _trend_proxy(self, company_name):
+        # Stable company-specific trend in [-5, 5] (no multi-year company data yet)
+        trend = self._trend_cache.get(company_name)
+        if trend is None:
+            seed = sum(ord(c) for c in company_name)
+            trend = self._trend_cache[company_name] = (np.random.RandomState(seed).rand() - 0.5) * 10
+        return trend
 
     def get_company_metrics(self, industry, year, company_name):
         """
@@ -20,7 +83,7 @@ class CompanyAnalysis:
         Uses the company name as a seed for stable scaling factors.
         """
         # Get industry baseline
-        industry_data = self.industry_dashboard.run_analysis(industry, year, include_companies=False)
+        industry_data = self.industry_dashboard.run_analysis(industry, year, include_companies=False, fields=BASELINE_FIELDS)
         if "error" in industry_data:
             return industry_data
 
@@ -28,15 +91,15 @@ class CompanyAnalysis:
         
         # Use company name to generate a stable seed
         seed = sum(ord(c) for c in company_name) + year
-        np.random.seed(seed)
+        draws = self._company_draws(seed)
 
         # Scale Factor ∈ [0.8, 1.2]
-        scale_factor = 0.8 + (np.random.rand() * 0.4)
+        scale_factor = 0.8 + (draws[0] * 0.4)
         # Growth Bias reflects startup vs enterprise (randomly assigned but stable)
-        growth_bias = 0.7 + (np.random.rand() * 0.6)
+        growth_bias = 0.7 + (draws[1] * 0.6)
         # Variance for attrition and conversion
-        attr_variance = (np.random.rand() - 0.5) * 0.05
-        conv_variance = (np.random.rand() - 0.5) * 0.04
+        attr_variance = (draws[2] - 0.5) * 0.05
+        conv_variance = (draws[3] - 0.5) * 0.04
 
         # Company Level Raw Metrics
         comp_intern_intake = metrics["Internship_Intake"] * scale_factor
@@ -63,108 +126,316 @@ class CompanyAnalysis:
             }
         }
 
-    def compare_companies(self, industry, selected_companies, year):
+    def add_companies(self, industry, names):
+        """Appends companies to an industry's universe; its bounds sketches take in just the new ones."""
+        universe = self.companies.setdefault(industry, [])
+        known = set(universe)
+        universe.extend(name for name in dict.fromkeys(names) if name not in known)
+        return len(universe)
+
+    def _company_raw(self, names, year, metrics):
+        # get_company_metrics' raw metrics for many companies at once. With an array
+        # of years (and metrics holding one value per year) the arrays are company x year.
+        if np.ndim(year) == 0:
+            draws = np.array([self._company_draws(sum(ord(c) for c in name) + year) for name in names])
+            draws = draws.reshape(len(names), 4)
+        else:
+            years = [int(y) for y in year]
+            draws = np.array([
+                [self._company_draws(seed + y) for y in years]
+                for seed in (sum(ord(c) for c in name) for name in names)
+            ]).reshape(len(names), len(years), 4)
+        scale_factor = 0.8 + (draws[..., 0] * 0.4)
+        growth_bias = 0.7 + (draws[..., 1] * 0.6)
+        attr_variance = (draws[..., 2] - 0.5) * 0.05
+        conv_variance = (draws[..., 3] - 0.5) * 0.04
+
+        conv_rate = np.maximum(0.4, np.minimum(0.95, metrics["Conversion_Rate"] + conv_variance))
+        attr_rate = np.maximum(0.02, np.minimum(0.35, metrics["Attrition_Rate"] + attr_variance))
+        supply_raw = (metrics["Internship_Intake"] * scale_factor) * conv_rate
+        demand_raw = (metrics["Growth_Rate"] * growth_bias) + (attr_rate * 1.5)
+        return attr_rate, supply_raw, demand_raw
+
+    def normalization_bounds(self, industry, year, metrics):
         """
-        Compares multiple companies in an industry with P5-P95 normalization.
+        P5/P95 of Supply and Demand raw over the industry's whole company universe.
+
+        Kept in a quantile sketch per (industry, year): built once, then only
+        companies appended to the universe (add_companies) are streamed in, in
+        chunks of SKETCH_CHUNK. A new industry baseline (reload, ingest) or a
+        replaced universe rebuilds it. Exact up to QuantileSketch's k companies.
+        """
+        names = self.companies.get(industry, [])
+        baseline = tuple(metrics[key] for key in BASELINE_METRICS)
+        with self._sketch_lock:
+            entry = self._sketches.get((industry, year))
+            if (entry is None or entry["baseline"] != baseline
+                    or entry["names"] is not names or entry["count"] > len(names)):
+                entry = self._sketches[(industry, year)] = {
+                    "baseline": baseline, "names": names, "count": 0,
+                    "Supply": QuantileSketch(), "Demand": QuantileSketch()
+                }
+            for start in range(entry["count"], len(names), SKETCH_CHUNK):
+                _, supply_raw, demand_raw = self._company_raw(names[start:start + SKETCH_CHUNK], year, metrics)
+                entry["Supply"].update(supply_raw)
+                entry["Demand"].update(demand_raw)
+            entry["count"] = len(names)
+            return {
+                "Supply": tuple(entry["Supply"].quantiles([0.05, 0.95]).tolist()),
+                "Demand": tuple(entry["Demand"].quantiles([0.05, 0.95]).tolist())
+            }
+
+    def company_frame(self, industry, year, companies=None):
+        """
+        Raw metrics and scores for the industry's companies (all of them, or the
+        given ones), as arrays. Same formulas as get_company_metrics /
+        compare_companies, computed at once from a single industry baseline and
+        normalized against the P5/P95 of the whole universe (normalization_bounds).
         """
-        # 1. Generate Raw Metrics for ALL companies in the industry for normalization context
         all_companies = self.companies.get(industry, [])
         if not all_companies:
             return {"error": f"Industry {industry} not found"}
 
-        industry_raw_data = []
-        for company in all_companies:
-            data = self.get_company_metrics(industry, year, company)
-            industry_raw_data.append(data)
-
-        # 2. Compute P5/P95 within industry
-        df = pd.DataFrame([
-            {
-                "Company": d["Company"],
-                "Supply_Raw": d["Raw"]["Supply"],
-                "Demand_Raw": d["Raw"]["Demand"],
-                "Attrition": d["Raw"]["Attrition_Rate"],
-                "Conversion": d["Raw"]["Conversion_Rate"]
-            }
-            for d in industry_raw_data
-        ])
+        industry_data = self.industry_dashboard.run_analysis(industry, year, include_companies=False, fields=BASELINE_FIELDS)
+        if "error" in industry_data:
+            return industry_data
+        metrics = industry_data["Metrics"]
+
+        names = all_companies if companies is None else companies
+        attr_rate, supply_raw, demand_raw = self._company_raw(names, year, metrics)
+
+        # P5/P95 within industry
+        bounds = self.normalization_bounds(industry, year, metrics)
+        trend_proxy = np.array([self._trend_proxy(name) for name in names], dtype=np.float64)
+        frame = self._company_scores(attr_rate, supply_raw, demand_raw, bounds["Supply"], bounds["Demand"], trend_proxy)
+        frame["Company"] = list(names)
+        frame["Attrition_Rate"] = attr_rate
+        frame["Percentiles"] = bounds
+        return frame
+
+    def _company_scores(self, attr_rate, supply_raw, demand_raw, supply_bounds, demand_bounds, trend_proxy):
+        # Scores from raw metrics; the bounds and trend proxy broadcast against the raw arrays
+        p5_supply, p95_supply = supply_bounds
+        p5_demand, p95_demand = demand_bounds
+
+        def normalize(val, p5, p95):
+            range_val = np.where(p95 != p5, np.subtract(p95, p5), 1.0)
+            clipped = np.clip(val, p5, p95)
+            return ((clipped - p5) / range_val) * 100
+
+        # Clamp to [10, 90] for better UI separation
+        supply_score = np.clip(normalize(supply_raw, p5_supply, p95_supply), 10, 90)
+        demand_score = np.clip(normalize(demand_raw, p5_demand, p95_demand), 10, 90)
+
+        # Risk = (Demand_Score - Supply_Score) + (Attrition * 15)
+        risk = np.clip((demand_score - supply_score) + (attr_rate * 15), 0, 100)
+
+        # HPI = (Demand_Score - Supply_Score) + (Attrition * 20) + (Demand_Trend * 0.8)
+        hpi = (demand_score - supply_score) + (attr_rate * 20) + (trend_proxy * 0.8)
+
+        # Surge Mapping
+        surge = np.where(hpi >= 30, "1-3 months",
+                         np.where((hpi >= 15) | (trend_proxy > 0), "4-6 months", "6-12 months"))
+        risk_level = np.where(risk < 30, "Low Risk", np.where(risk < 60, "Medium Risk", "High Risk"))
+
+        return {
+            "Supply_Score": supply_score,
+            "Demand_Score": demand_score,
+            "Risk_Score": risk,
+            "HPI": hpi,
+            "Hiring_Surge": surge,
+            "Risk_Level": risk_level,
+        }
+
+    def company_series(self, industry, selected_companies, start_year, end_year):
+        """
+        compare_companies over a range of years in one call: per-company series of
+        scores, risk levels and surge windows. The industry baselines for all years
+        come from one pass over the scored panel and the companies are scored as a
+        single company x year block. Each point matches compare_companies for that
+        year (surge windows, as there, only for 2026). Years without data are left out.
+        """
+        if start_year > end_year:
+            raise ValueError("start_year must not be after end_year")
+        all_companies = self.companies.get(industry, [])
+        if not all_companies:
+            return {"error": f"Industry {industry} not found"}
 
-        p5_supply = df["Supply_Raw"].quantile(0.05)
-        p95_supply = df["Supply_Raw"].quantile(0.95)
-        p5_demand = df["Demand_Raw"].quantile(0.05)
-        p95_demand = df["Demand_Raw"].quantile(0.95)
+        dashboard = self.industry_dashboard
+        panel = dashboard._prepare_data()
+        rows = panel[(panel['Industry'] == industry) & (panel['Year'] >= start_year) & (panel['Year'] <= end_year)]
+        if rows.empty:
+            return {"error": "Data not available for this year/industry"}
+        rows = rows.sort_values('Year')
+        years = rows['Year'].astype(int).tolist()
+        # industry_metrics' rounding, applied to whole columns
+        metrics = {
+            "Internship_Intake": np.trunc(rows['Interns_Intake'].to_numpy(dtype=np.float64)).astype(np.int64),
+            "Conversion_Rate": np.round(rows['Conversion_Rate'].to_numpy(dtype=np.float64), 2),
+            "Attrition_Rate": np.round(rows['Attrition_Rate'].to_numpy(dtype=np.float64), 3),
+            "Growth_Rate": np.round(rows['Growth_Rate'].to_numpy(dtype=np.float64), 3),
+        }
+        year_metrics = [dict(zip(BASELINE_METRICS, values))
+                        for values in zip(*(metrics[key].tolist() for key in BASELINE_METRICS))]
+
+        selected = set(selected_companies)
+        names = [name for name in all_companies if name in selected]
+        attr_rate, supply_raw, demand_raw = self._company_raw(names, years, metrics)
+
+        # Per-year P5/P95 of the whole universe, broadcast across the company axis
+        bounds = [self.normalization_bounds(industry, year, m) for year, m in zip(years, year_metrics)]
+        supply_bounds = np.array([b["Supply"] for b in bounds]).T
+        demand_bounds = np.array([b["Demand"] for b in bounds]).T
+        trend_proxy = np.array([self._trend_proxy(name) for name in names], dtype=np.float64)[:, None]
+        scores = self._company_scores(attr_rate, supply_raw, demand_raw, supply_bounds, demand_bounds, trend_proxy)
+
+        current = np.array(years) == 2026
+        surge = np.where(current, scores["Hiring_Surge"], None).tolist()
+        supply = np.round(scores["Supply_Score"], 2).tolist()
+        demand = np.round(scores["Demand_Score"], 2).tolist()
+        risk = np.round(scores["Risk_Score"], 2).tolist()
+        risk_level = scores["Risk_Level"].tolist()
+        return {
+            "Industry": industry,
+            "Years": years,
+            "Companies": [
+                {
+                    "Company": name,
+                    "Supply_Score": supply[i],
+                    "Demand_Score": demand[i],
+                    "Risk_Score": risk[i],
+                    "Risk_Level": risk_level[i],
+                    "Hiring_Surge": surge[i]
+                }
+                for i, name in enumerate(names)
+            ]
+        }
+
+    def _company_result(self, frame, i, year):
+        """The per-company payload of compare_companies for row i of a company_frame."""
+        # Scalar re-clamps keep the original int/float edge values (e.g. 10 rather than 10.0)
+        supply_score = max(10, min(90, frame["Supply_Score"][i]))
+        demand_score = max(10, min(90, frame["Demand_Score"][i]))
+        risk = max(0, min(100, frame["Risk_Score"][i]))
+        attrition = frame["Attrition_Rate"][i]
+
+        # Rule-based Insights
+        insights = []
+        if attrition > 0.15:
+            insights.append("High attrition is driving elevated hiring pressure.")
+        if supply_score > 70:
+            insights.append("Strong internal talent pipeline reduces supply-side risk.")
+        if demand_score > 75:
+            insights.append("Rapid growth requirements are outpacing current supply.")
+        if risk < 30:
+            insights.append("Workforce stability is exceptionally high.")
+        
+        if not insights:
+            insights.append("Workforce metrics are currently in a state of equilibrium.")
+
+        return {
+            "Company": frame["Company"][i],
+            "Metrics": {
+                "Supply_Score": round(supply_score, 2),
+                "Demand_Score": round(demand_score, 2),
+                "Risk_Score": round(risk, 2),
+                "Risk_Level": str(frame["Risk_Level"][i]),
+                "Attrition_Rate": round(attrition, 3),
+                "Hiring_Surge": str(frame["Hiring_Surge"][i]) if year == 2026 else None
+            },
+            "Insights": insights[:2]
+        }
+
+    @coalesced
+    def compare_companies(self, industry, selected_companies, year, end_year=None):
+        """
+        Compares multiple companies in an industry with P5-P95 normalization.
+        With end_year, returns their series from year to end_year (company_series).
+        """
+        if end_year is not None:
+            return self.company_series(industry, selected_companies, year, end_year)
+
+        # 1. Raw metrics and scores for the selected companies (in universe order),
+        #    normalized against the whole industry's P5/P95 sketches
+        selected = set(selected_companies)
+        frame = self.company_frame(
+            industry, year, companies=[name for name in self.companies.get(industry, []) if name in selected]
+        )
+        if "error" in frame:
+            return frame
 
         # Logging for validation
+        (p5_supply, p95_supply), (p5_demand, p95_demand) = frame["Percentiles"].values()
         print(f"\n--- Normalization Context ({industry} {year}) ---")
         print(f"P5 Supply: {p5_supply:.2f}, P95 Supply: {p95_supply:.2f}")
         print(f"P5 Demand: {p5_demand:.2f}, P95 Demand: {p95_demand:.2f}")
 
-        def normalize(val, p5, p95):
-            range_val = p95 - p5 if p95 != p5 else 1.0
-            clipped = np.clip(val, p5, p95)
-            return ((clipped - p5) / range_val) * 100
+        # 2. Build the payload for the selected companies
+        return [self._company_result(frame, i, year) for i in range(len(frame["Company"]))]
+
+    def rank_companies(self, industry, year, sort_by="risk", order="desc", limit=20,
+                       cursor=None, risk_level=None, surge=None):
+        """
+        One page of the industry's companies ranked by Risk_Score, HPI, demand or supply.
 
-        comparison_results = []
-        for d in industry_raw_data:
-            if d["Company"] not in selected_companies:
-                continue
-
-            supply_score = normalize(d["Raw"]["Supply"], p5_supply, p95_supply)
-            demand_score = normalize(d["Raw"]["Demand"], p5_demand, p95_demand)
-
-            # Clamp to [10, 90] for better UI separation
-            supply_score = max(10, min(90, supply_score))
-            demand_score = max(10, min(90, demand_score))
-
-            # Risk = (Demand_Score - Supply_Score) + (Attrition * 15)
-            risk = (demand_score - supply_score) + (d["Raw"]["Attrition_Rate"] * 15)
-            risk = max(0, min(100, risk))
-
-            # HPI = (Demand_Score - Supply_Score) + (Attrition * 20) + (Demand_Trend * 0.8)
-            # Since we don't have multi-year company trend yet, we use a stable company-specific random trend
-            np.random.seed(sum(ord(c) for c in d["Company"]))
-            trend_proxy = (np.random.rand() - 0.5) * 10
-            hpi = (demand_score - supply_score) + (d["Raw"]["Attrition_Rate"] * 20) + (trend_proxy * 0.8)
-
-            # Surge Mapping
-            if hpi >= 30:
-                surge = "1-3 months"
-            elif hpi >= 15 or trend_proxy > 0:
-                surge = "4-6 months"
-            else:
-                surge = "6-12 months"
-
-            # Rule-based Insights
-            insights = []
-            if d["Raw"]["Attrition_Rate"] > 0.15:
-                insights.append("High attrition is driving elevated hiring pressure.")
-            if supply_score > 70:
-                insights.append("Strong internal talent pipeline reduces supply-side risk.")
-            if demand_score > 75:
-                insights.append("Rapid growth requirements are outpacing current supply.")
-            if risk < 30:
-                insights.append("Workforce stability is exceptionally high.")
-            
-            if not insights:
-                insights.append("Workforce metrics are currently in a state of equilibrium.")
-
-            comparison_results.append({
-                "Company": d["Company"],
-                "Metrics": {
-                    "Supply_Score": round(supply_score, 2),
-                    "Demand_Score": round(demand_score, 2),
-                    "Risk_Score": round(risk, 2),
-                    "Risk_Level": "Low Risk" if risk < 30 else "Medium Risk" if risk < 60 else "High Risk",
-                    "Attrition_Rate": round(d["Raw"]["Attrition_Rate"], 3),
-                    "Hiring_Surge": surge if year == 2026 else None
-                },
-                "Insights": insights[:2]
-            })
-
-        return comparison_results
+        Scores come from company_frame (vectorized over the whole universe);
+        filters are array masks, the page is a heap-based top-k over the rows
+        after the cursor, and only the page's rows are turned into payloads.
+        The cursor is the opaque sort key of the last row of the previous page.
+        """
+        if sort_by not in RANK_FIELDS:
+            raise ValueError(f"sort_by must be one of {', '.join(RANK_FIELDS)}")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be 'asc' or 'desc'")
+        if risk_level is not None and risk_level not in RISK_LEVELS:
+            raise ValueError(f"risk_level must be one of {', '.join(RISK_LEVELS)}")
+        if surge is not None and surge not in SURGE_WINDOWS:
+            raise ValueError(f"surge must be one of {', '.join(SURGE_WINDOWS)}")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else None
+
+        frame = self.company_frame(industry, year)
+        if "error" in frame:
+            return frame
+
+        mask = np.ones(len(frame["Company"]), dtype=bool)
+        if risk_level is not None:
+            mask &= frame["Risk_Level"] == risk_level
+        if surge is not None:
+            # Hiring_Surge is only reported for the current hiring window
+            mask &= (frame["Hiring_Surge"] == surge) & (year == 2026)
+        rows = np.flatnonzero(mask)
+
+        # Sort key (value, company, row): ascending tuple order, value negated for desc
+        values = frame[RANK_FIELDS[sort_by]]
+        sign = -1.0 if order == "desc" else 1.0
+        names = frame["Company"]
+        keys = ((sign * float(values[i]), names[i], int(i)) for i in rows)
+        if after is not None:
+            keys = (k for k in keys if k > after)
+        page = heapq.nsmallest(limit + 1, keys)
+
+        has_more = len(page) > limit
+        page = page[:limit]
+        companies = []
+        for _, _, i in page:
+            result = self._company_result(frame, i, year)
+            result["Metrics"]["HPI"] = round(float(frame["HPI"][i]), 2)
+            companies.append(result)
+
+        return {
+            "Industry": industry,
+            "Year": int(year),
+            "Sort_By": sort_by,
+            "Order": order,
+            "Total": int(len(rows)),
+            "Companies": companies,
+            "Next_Cursor": encode_cursor(page[-1]) if has_more else None
+        }
 
 if __name__ == "__main__":
     ca = CompanyAnalysis()
     print("\n--- Testing Comparison for IT 2026 ---")
-    results = ca.compare_companies("IT", ["MetaSystems", "CyberCloud", "NexTech"], 2026)
+    # The first three IT companies of company_profiles.csv
+    results = ca.compare_companies("IT", ca.companies["IT"][:3], 2026)
     print(json.dumps(results, indent=2))
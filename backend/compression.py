@@ -0,0 +1,123 @@
+"""
+Response compression negotiated from Accept-Encoding.
+
+Responses of at least MIN_SIZE bytes are sent brotli-compressed when the
+client accepts `br` and the optional brotli package is installed, gzip when
+it accepts `gzip`, and as they are otherwise. Streaming responses, ones that
+already carry a Content-Encoding and non-compressible types pass through.
+Every other response carries `Vary: Accept-Encoding`, compressed or not, so a
+cache never hands a compressed body to a client that cannot read it (or the
+other way round).
+
+brotli is an optional dependency (pip install brotli); without it only gzip
+is offered.
+
+Both codecs run at low levels (brotli 4, gzip 5): JSON dashboards shrink
+about as much as at the maximum levels for a fraction of the CPU time. Tune
+with WORKFORCE_COMPRESSION_MIN_SIZE, _BROTLI_QUALITY and _GZIP_LEVEL.
+"""
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is used without it
+    brotli = None
+
+MIN_SIZE = int(os.environ.get("WORKFORCE_COMPRESSION_MIN_SIZE", 1024))
+BROTLI_QUALITY = int(os.environ.get("WORKFORCE_COMPRESSION_BROTLI_QUALITY", 4))
+GZIP_LEVEL = int(os.environ.get("WORKFORCE_COMPRESSION_GZIP_LEVEL", 5))
+COMPRESSIBLE_TYPES = (b"application/json", b"text/")
+
+
+def available_encodings():
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def negotiate(accept_encoding):
+    """The encoding to use for an Accept-Encoding header value, or None."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    best, best_q = None, 0.0
+    for encoding in available_encodings():
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def add_vary(headers, vary):
+    """Response headers with Accept-Encoding added to the Vary header (list of pairs)."""
+    if vary is not None and (vary.strip() == b"*" or b"accept-encoding" in vary.lower()):
+        return headers
+    headers = [(name, value) for name, value in headers if name.lower() != b"vary"]
+    return headers + [(b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding")]
+
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, min_size=MIN_SIZE):
+        self.app = app
+        self.min_size = min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        encoding = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                encoding = negotiate(value.decode("latin-1"))
+                break
+
+        start = None
+
+        async def send_wrapper(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Held back until the body shows whether it is worth compressing
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                return await send(message)
+
+            response_start, start = start, None
+            body = message.get("body", b"")
+            headers = {name.lower(): value for name, value in response_start.get("headers", [])}
+            content_type = headers.get(b"content-type", b"")
+            if (message.get("more_body", False) or b"content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)):
+                await send(response_start)
+                return await send(message)
+
+            response_headers = add_vary(list(response_start.get("headers", [])), headers.get(b"vary"))
+            if encoding is None or len(body) < self.min_size:
+                await send({**response_start, "headers": response_headers})
+                return await send(message)
+
+            compressed = compress(body, encoding)
+            response_headers = [
+                (name, value) for name, value in response_headers if name.lower() != b"content-length"
+            ] + [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode()),
+            ]
+            await send({**response_start, "headers": response_headers})
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,115 @@
+"""
+Background refresher for the CSVs in data/.
+
+A daemon thread polls the size and mtime of the panel CSVs every
+WORKFORCE_DATA_WATCH_INTERVAL seconds (default 5, 0 disables it). When they
+differ from the ones the dashboard was built from, and have stayed the same
+for one more poll (so a file still being written is not picked up half way),
+it calls IndustryDashboard.reload(). The rebuild happens on this thread, into
+a fresh dashboard, and the result is swapped in at once: requests never wait
+for it and in-flight ones finish on the snapshot they started with. While it
+runs both builds are in memory; the old one is freed with its last reader.
+
+A failed rebuild (e.g. a malformed CSV) is logged and the current data keeps
+being served; it is retried on the next change to the files.
+
+Nothing is done until the dashboard has loaded its data, so lazy startup stays
+lazy. Pre-forked workers do not run a watcher (services.disable_data_watcher):
+serve.py polls check() from its parent process and replaces the workers after
+a reload, so they keep sharing the panel copy-on-write.
+"""
+import os
+import threading
+import time
+
+WATCH_INTERVAL = float(os.environ.get("WORKFORCE_DATA_WATCH_INTERVAL", 5))
+
+
+class DataWatcher:
+    def __init__(self, get_dashboard, interval=WATCH_INTERVAL):
+        # get_dashboard returns the live IndustryDashboard, or None before it exists
+        self.get_dashboard = get_dashboard
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._pending = None        # changed signature waiting to settle
+        self._failed = None         # signature whose rebuild failed
+        self.checks = 0
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload = None
+        self.last_reload_ms = None
+        self.last_error = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="data-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Data watcher check failed: {e}")
+
+    def check(self):
+        """One poll; returns True if the dashboard was reloaded."""
+        dashboard = self.get_dashboard()
+        if dashboard is None or dashboard.loaded_signature is None:
+            return False
+        self.checks += 1
+
+        import panel_store
+        try:
+            signature = panel_store.source_signature(dashboard.data_dir)
+        except FileNotFoundError:
+            # A file is being replaced; look again on the next poll
+            return False
+
+        if signature == dashboard.loaded_signature or signature == self._failed:
+            self._pending = None
+            return False
+        if signature != self._pending:
+            self._pending = signature
+            return False
+
+        self._pending = None
+        start = time.perf_counter()
+        try:
+            version = dashboard.reload()
+        except Exception as e:
+            self._failed = signature
+            self.failures += 1
+            self.last_error = str(e)
+            print(f"Data reload failed, still serving version {dashboard.data_version}: {e}")
+            return False
+
+        self._failed = None
+        self.reloads += 1
+        self.last_reload = time.time()
+        self.last_reload_ms = round((time.perf_counter() - start) * 1000, 2)
+        self.last_error = None
+        print(f"Data reloaded (version {version}) in {self.last_reload_ms:.0f} ms")
+        return True
+
+    def stats(self):
+        dashboard = self.get_dashboard()
+        return {
+            "enabled": True,
+            "interval_s": self.interval,
+            "data_version": dashboard.data_version if dashboard is not None else 0,
+            "checks": self.checks,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload": self.last_reload,
+            "last_reload_ms": self.last_reload_ms,
+            "last_error": self.last_error,
+        }
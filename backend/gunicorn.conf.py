@@ -0,0 +1,31 @@
+# Gunicorn deployment for the API:  gunicorn -c gunicorn.conf.py api:app
+#
+# preload_app loads the API in the master process; when_ready then builds the
+# scored panel and model coefficients there once, before any worker is forked,
+# so workers share that state copy-on-write instead of each rebuilding it.
+#
+# Workers do not run the data watcher (it would rebuild, and so unshare, the
+# panel in each of them). To pick up edited data files, restart gunicorn, or
+# run python serve.py, whose parent process reloads and replaces its workers.
+# Needs: pip install gunicorn uvicorn-worker
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get("WORKFORCE_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WORKFORCE_WORKERS", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+
+def when_ready(server):
+    import services
+    services.disable_data_watcher()
+    services.warm_up()
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import database
+    database.engine.dispose(close=False)
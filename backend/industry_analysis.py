@@ -1,34 +1,128 @@
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.linear_model import LinearRegression
 import json
 import os
+import threading
+from serialization import frame_records
+from singleflight import coalesced
+import narrative_rules
+import panel_store
+import sharded_scoring
 
 # Configuration
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+MODEL_TARGETS = ['Interns_Intake', 'Conversion_Rate', 'Growth_Rate', 'Attrition_Rate']
+# Years are centred on this origin before fitting to keep the sums well conditioned
+YEAR_ORIGIN = 2000
+# Dashboard payloads list at most this many companies (the highest-risk ones);
+# the rest are paged through /companies/{industry}/ranking
+COMPANY_SUMMARY_LIMIT = 50
+# range_query fields -> scored panel columns (surge and risk_level are labels, see narrative_rules)
+RANGE_FIELDS = {
+    'supply': 'Talent_Supply_Score',
+    'demand': 'Talent_Demand_Score',
+    'risk': 'Risk_Score',
+    'risk_level': 'Risk_Level',
+    'surge': 'Hiring_Surge',
+    'intake': 'Interns_Intake',
+    'conversion': 'Conversion_Rate',
+    'attrition': 'Attrition_Rate',
+    'growth': 'Growth_Rate',
+}
+RANGE_DECIMALS = {'conversion': 2, 'attrition': 3, 'growth': 3}
+RANGE_LABELS = {'risk_level', 'surge'}
+# Sections of the run_analysis / Student_Insights payloads that `fields` can select.
+# Industry and Year identify the payload and are always included.
+ANALYSIS_FIELDS = [
+    'Metrics', 'Hiring_Surge_Timeline', 'AI_Explanation', 'Supply_Demand_Trend',
+    'Simulation_Context', 'Company_Metrics',
+]
+STUDENT_INSIGHT_FIELDS = [
+    'Hiring_Outlook', 'Outlook_Description', 'Competition_Level', 'Competition_Description',
+    'Preparation_Guidance', 'Industry_Switch', 'Skills',
+]
+
+
+def parse_fields(fields, student=False):
+    """
+    Parses a `fields=` selector ("Metrics,Company_Metrics") into a frozenset, or
+    None for everything. Student payloads also take Student_Insights or single
+    insights as Student_Insights.<name>. Raises ValueError on unknown names.
+    """
+    if fields is None:
+        return None
+    names = frozenset(f.strip() for f in fields.split(',') if f.strip())
+    allowed = set(ANALYSIS_FIELDS) | {'Industry', 'Year'}
+    if student:
+        allowed.add('Student_Insights')
+        allowed.update(f'Student_Insights.{name}' for name in STUDENT_INSIGHT_FIELDS)
+    unknown = sorted(names - allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+class TrendModel:
+    """Linear Year trend shared across industries with a per-industry intercept."""
+    def __init__(self, slope, intercepts):
+        self.slope = slope
+        self.intercepts = intercepts
+
+    def predict(self, industries, years):
+        base = self.intercepts.reindex(industries).to_numpy()
+        return base + self.slope * (np.asarray(years, dtype=np.float64) - YEAR_ORIGIN)
 
 class IndustryDashboard:
-    def __init__(self):
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
         self.data = None
         self.scalers = {}
         self.models = {}
+        self.model_stats = None
         self.future_years = [2027, 2028, 2029]
         self.normalization_bounds = {}
+        # (scored panel, normalization bounds) of the current build. The scored panel
+        # (history + forecast) is built once and reused by every request, and built
+        # before forking workers so they share it copy-on-write (see serve.py).
+        # Every build publishes a new tuple (and a new bounds dict) in one assignment.
+        self._snapshot = None
+        # Bumped by every reload(); signature of the CSVs the current data came from
+        self.data_version = 0
+        self.loaded_signature = None
+        # CompanyAnalysis used for dashboard company summaries (registered by CompanyAnalysis)
+        self.company_logic = None
+        # Serializes builds and swaps of the snapshot: the cold build, ingest() and
+        # reload()'s swap. Reentrant because ingest() reads the snapshot under it.
+        self._ingest_lock = threading.RLock()
+
+    @property
+    def scored_data(self):
+        snapshot = self._snapshot
+        return snapshot[0] if snapshot is not None else None
+
+    @scored_data.setter
+    def scored_data(self, panel):
+        self._snapshot = (panel, self.normalization_bounds) if panel is not None else None
+
+    def _publish(self, panel, bounds):
+        # Callers hold _ingest_lock; readers see the old pair or the new one, never a mix
+        self.normalization_bounds = bounds
+        self._snapshot = (panel, bounds)
 
     def load_data(self):
         if self.data is not None:
             return
         try:
-            attrition = pd.read_csv(os.path.join(DATA_DIR, 'attrition_data.csv'))
-            growth = pd.read_csv(os.path.join(DATA_DIR, 'industry_growth.csv'))
-            internship = pd.read_csv(os.path.join(DATA_DIR, 'internship_data.csv'))
-            
+            # Taken before reading, so an edit made during the read still shows up as a change
+            self.loaded_signature = panel_store.source_signature(self.data_dir)
+            # Prefer the compiled columnar store when it was built from the current CSVs
+            store_dir = os.path.join(self.data_dir, 'compiled', 'panel')
+            if panel_store.is_fresh(self.data_dir, store_dir):
+                self.data = panel_store.load_store(store_dir)
+                print("Data loaded from compiled store.")
+                return
+
             # Merge datasets on Industry and Year
-            df = attrition.merge(growth, on=['Industry', 'Year'])
-            df = df.merge(internship, on=['Industry', 'Year'])
-            
-            self.data = df
+            self.data = panel_store.read_csv_panel(self.data_dir)
             print("Data loaded successfully.")
         except Exception as e:
             print(f"Error loading data: {e}")
@@ -43,273 +137,271 @@ class IndustryDashboard:
         return df
 
     def calculate_scores(self, df):
+        return self._score(df)[0]
+
+    def _score(self, df):
+        # Scored frame and its {industry: bounds}; nothing on self is modified
         # Calculate raw metrics first if not present
         if 'Talent_Supply_Raw' not in df.columns:
             df = self.calculate_raw_metrics(df)
             
         print("\n--- Percentile-Based Normalization (P5-P95) ---")
-        
-        def normalize_group(group):
-            industry = group.name
-            
-            # Compute P5 and P95 percentiles for outlier-resistant normalization
-            p5_supply = group['Talent_Supply_Raw'].quantile(0.05)
-            p95_supply = group['Talent_Supply_Raw'].quantile(0.95)
-            
-            p5_demand = group['Talent_Demand_Raw'].quantile(0.05)
-            p95_demand = group['Talent_Demand_Raw'].quantile(0.95)
-            
-            print(f"  Supply P5: {p5_supply:.2f}, P95: {p95_supply:.2f}")
-            print(f"  Demand P5: {p5_demand:.2f}, P95: {p95_demand:.2f}")
-            
-            # Store for What-If Simulation context
-            self.normalization_bounds[industry] = {
-                'supply': (p5_supply, p95_supply),
-                'demand': (p5_demand, p95_demand)
-            }
-            
-            # Clip values to P5-P95 range to avoid extreme outliers
-            supply_clipped = group['Talent_Supply_Raw'].clip(p5_supply, p95_supply)
-            demand_clipped = group['Talent_Demand_Raw'].clip(p5_demand, p95_demand)
-            
-            # Normalize using clipped range
-            supply_range = p95_supply - p5_supply if p95_supply != p5_supply else 1.0
-            demand_range = p95_demand - p5_demand if p95_demand != p5_demand else 1.0
-            
-            group['Talent_Supply_Score'] = ((supply_clipped - p5_supply) / supply_range) * 100
-            group['Talent_Demand_Score'] = ((demand_clipped - p5_demand) / demand_range) * 100
-            
-            # Debug sample row (first row of group)
-            if len(group) > 0:
-                sample_idx = group.index[0]
-                print(f"  Sample Row {group.loc[sample_idx, 'Year']:.0f}:")
-                print(f"    Supply - Raw: {group.loc[sample_idx, 'Talent_Supply_Raw']:.2f}, "
-                      f"Clipped: {supply_clipped.loc[sample_idx]:.2f}, "
-                      f"Normalized: {group.loc[sample_idx, 'Talent_Supply_Score']:.2f}")
-                print(f"    Demand - Raw: {group.loc[sample_idx, 'Talent_Demand_Raw']:.2f}, "
-                      f"Clipped: {demand_clipped.loc[sample_idx]:.2f}, "
-                      f"Normalized: {group.loc[sample_idx, 'Talent_Demand_Score']:.2f}")
-            
-            return group
 
-        df = df.groupby('Industry', group_keys=False).apply(normalize_group)
-        
-        # Prevent extreme 0 and 100 values (clamp to realistic range)
-        # Scores are clamped to 10-90 to avoid misleading absolutes and provide better separation
-        df['Talent_Supply_Score'] = df['Talent_Supply_Score'].clip(10, 90)
-        df['Talent_Demand_Score'] = df['Talent_Demand_Score'].clip(10, 90)
-        
-        # Dynamic Baseline Risk (varies by year based on market conditions)
-        # 
-        # Formula: baseline = BASE + (Attrition × Attrition_Factor) + (Demand_Trend × Trend_Factor)
-        # 
-        # Rationale: Risk should fluctuate naturally year-to-year, not remain constant.
-        # - Attrition component: Higher attrition → higher baseline operational risk
-        # - Demand trend component: Growing demand → increased baseline pressure
-        # - Ensures risk never collapses to zero while maintaining year-to-year variance
-        
-        BASE_RISK = 5
-        ATTRITION_FACTOR = 10
-        TREND_FACTOR = 0.5
-        ATTRITION_WEIGHT = 15
-        
-        # Calculate demand trend (change from previous year) per industry
-        def calculate_dynamic_risk(group):
-            # Sort by year to ensure correct trend calculation
-            group = group.sort_values('Year')
-            
-            # Calculate demand trend (current - previous year)
-            group['Demand_Trend'] = group['Talent_Demand_Score'].diff().fillna(0)
-            
-            # Dynamic baseline = BASE + (Attrition × Factor) + (Demand_Trend × Factor)
-            # Ensure baseline never drops below BASE_RISK floor
-            dynamic_baseline = (
-                BASE_RISK 
-                + (group['Attrition_Rate'] * ATTRITION_FACTOR)
-                + (group['Demand_Trend'] * TREND_FACTOR)
-            )
-            dynamic_baseline = dynamic_baseline.clip(lower=BASE_RISK)
-            
-            # Core risk = (Demand - Supply) + (Attrition × Weight)
-            core_risk = (
-                (group['Talent_Demand_Score'] - group['Talent_Supply_Score'])
-                + (group['Attrition_Rate'] * ATTRITION_WEIGHT)
-            )
-            
-            # Final risk = max(dynamic_baseline, core_risk)
-            group['Risk_Score'] = core_risk.combine(dynamic_baseline, max)
-            
-            return group
-        
-        df = df.groupby('Industry', group_keys=False).apply(calculate_dynamic_risk)
-        
-        # Final safety clamp
-        df['Risk_Score'] = df['Risk_Score'].clip(0, 100)
+        # Per-industry P5-P95 normalization, 10-90 clamp and dynamic baseline risk,
+        # scored shard by shard (in parallel for large panels, see sharded_scoring)
+        df, bounds = sharded_scoring.score_panel(df)
+        print(f"  Scored {len(df)} rows across {len(bounds)} industries")
+
+        # Risk levels, surge windows, explanations and student insights for every row
+        df = narrative_rules.annotate(df)
         
-        return df
+        return df, bounds
 
     def get_risk_level(self, score):
-        if score <= 35:
-            return "Low Risk"
-        elif score <= 65:
-            return "Medium Risk"
-        else:
-            return "High Risk"
+        return narrative_rules.risk_levels([score])[0]
 
     def train_models(self):
         if self.models:
             return
         # Predict: Interns_Intake, Conversion_Rate, Growth_Rate, Attrition_Rate
-        targets = ['Interns_Intake', 'Conversion_Rate', 'Growth_Rate', 'Attrition_Rate']
-        
-        # Features: Year, Industry (One-Hot)
-        X = self.data[['Year', 'Industry']]
-        X_encoded = pd.get_dummies(X, columns=['Industry'], drop_first=False)
-        
-        self.feature_columns = X_encoded.columns # Save for prediction alignment
-        
-        for target in targets:
-            y = self.data[target]
-            # Use LinearRegression for trend extrapolation (better for future believability than RF)
-            model = LinearRegression()
-            model.fit(X_encoded, y)
-            self.models[target] = model
-            
-    def predict_future(self):
+        # Features: Year, Industry (One-Hot) -> a linear Year trend shared by all
+        # industries plus a per-industry intercept. This is fitted in closed form from
+        # per-industry sums, so ingest() can fold in new rows without a full refit.
+        self.model_stats = self._trend_stats(self.data)
+        self._fit_models()
+
+    def _trend_stats(self, df):
+        # Per-industry sufficient statistics: n, sum(t), sum(t^2), sum(y), sum(t*y)
+        t = df['Year'].to_numpy(dtype=np.float64) - YEAR_ORIGIN
+        parts = {'n': np.ones(len(df)), 'St': t, 'Stt': t * t}
+        for target in MODEL_TARGETS:
+            y = df[target].to_numpy(dtype=np.float64)
+            parts[f'Sy_{target}'] = y
+            parts[f'Sty_{target}'] = t * y
+        stats = pd.DataFrame(parts, index=df.index)
+        return stats.groupby(df['Industry'], sort=False, observed=True).sum()
+
+    def _fit_models(self):
+        stats = self.model_stats
+        n, st = stats['n'], stats['St']
+        sxx = (stats['Stt'] - st * st / n).sum()
+        for target in MODEL_TARGETS:
+            sy = stats[f'Sy_{target}']
+            sxy = (stats[f'Sty_{target}'] - st * sy / n).sum()
+            slope = sxy / sxx if sxx else 0.0
+            self.models[target] = TrendModel(slope, (sy - slope * st) / n)
+
+    def predict_future(self, industries=None):
         # Create future dataframe
-        future_rows = []
-        industries = self.data['Industry'].unique()
-        
-        for industry in industries:
-            for year in self.future_years:
-                future_rows.append({'Industry': industry, 'Year': year})
-                
-        future_df = pd.DataFrame(future_rows)
-        X_future = future_df[['Year', 'Industry']]
-        X_future_encoded = pd.get_dummies(X_future, columns=['Industry'], drop_first=False)
-        
-        # Align columns
-        for col in self.feature_columns:
-            if col not in X_future_encoded.columns:
-                X_future_encoded[col] = 0
-        X_future_encoded = X_future_encoded[self.feature_columns]
-        
+        if industries is None:
+            industries = self.data['Industry'].unique()
+        industries = np.asarray(industries, dtype=object)
+        years = np.asarray(self.future_years)
+
+        future_df = pd.DataFrame({
+            'Industry': np.repeat(industries, len(years)),
+            'Year': np.tile(years, len(industries))
+        })
+
         # Predict components
         for target, model in self.models.items():
-            future_df[target] = model.predict(X_future_encoded)
-            
+            future_df[target] = model.predict(future_df['Industry'], future_df['Year'])
+
         return future_df
 
     def get_hiring_surge(self, row, prev_row=None):
         """
-        Calculate Hiring Pressure Index (HPI) and predict hiring surge window.
-        
-        HPI = (Demand - Supply) + (Attrition × 20) + (Demand_Trend × 0.8)
-        
-        Uses existing computed metrics (no recalculation):
-        - Demand_Score, Supply_Score (normalized 0-100)
-        - Attrition_Rate (0-1)
-        - Demand_Trend (year-over-year delta, already in row)
-        
-        NOTE: Hiring surge prediction is intentionally limited to year 2026 only.
-        This represents the current planning horizon. For all other years,
-        this method returns None to prevent display of surge predictions.
+        Hiring surge window of a scored panel row, from the Hiring Pressure Index
+        (HPI = (Demand - Supply) + (Attrition x 20) + (Demand_Trend x 0.8), see
+        narrative_rules.SURGE_RULES). Intentionally limited to 2026, the current
+        planning horizon: None for every other year.
         """
-        
-        # Design Decision: Limit hiring surge prediction to 2026 only
-        if row['Year'] != 2026:
-            return None
-        
-        # Extract demand trend (already calculated in calculate_dynamic_risk)
-        demand_trend = row.get('Demand_Trend', 0)
-        
-        # Hiring Pressure Index (HPI)
-        # Components:
-        # 1. Supply-Demand gap (primary signal, can be negative)
-        # 2. Attrition impact (weight 20, urgency amplifier)
-        # 3. Demand trend (weight 0.8, momentum indicator)
-        hpi = (
-            (row['Talent_Demand_Score'] - row['Talent_Supply_Score'])
-            + (row['Attrition_Rate'] * 20)
-            + (demand_trend * 0.8)
-        )
-        
-        # Map HPI to hiring surge window
-        if hpi >= 30 or (hpi >= 20 and demand_trend > 5):
-            return "1-3 months"  # Immediate hiring pressure
-        elif hpi >= 15 or demand_trend > 0:
-            return "4-6 months"  # Near-term hiring
-        else:
-            return "6-12 months"  # Long-term planning
+        return row['Hiring_Surge']
 
     def generate_explanation(self, row):
-        # Rule-based strategic insight (No AI/GPT mentions)
-        
-        risk_level = self.get_risk_level(row['Risk_Score'])
-        reasons = []
-        
-        # 1. Supply-Demand Analysis
-        gap = row['Talent_Demand_Score'] - row['Talent_Supply_Score']
-        if gap > 20:
-            reasons.append("demand significantly exceeds supply, creating critical shortage pressure")
-        elif gap > 0:
-            reasons.append("demand outpaces supply, tightening the talent pipeline")
-        elif gap < -20:
-            reasons.append("talent supply is robust relative to current market demand")
-        else:
-            reasons.append("supply and demand are currently in a state of relative equilibrium")
-            
-        # 2. Demand Trend / Momentum
-        demand_trend = row.get('Demand_Trend', 0)
-        if demand_trend > 10:
-            reasons.append("strong demand momentum suggests accelerating hiring needs")
-        elif demand_trend > 0:
-            reasons.append("positive demand momentum indicates steady market growth")
-        elif demand_trend < -10:
-            reasons.append("declining demand trend is easing immediate workforce pressure")
-            
-        # 3. Attrition / Leakage
-        if row['Attrition_Rate'] > 0.18: 
-            reasons.append("aggressive attrition rates are accelerating workforce leakage")
-        elif row['Attrition_Rate'] > 0.12:
-            reasons.append("steady attrition continues to drive routine hiring requirements")
-        elif row['Attrition_Rate'] < 0.05:
-            reasons.append("exceptionally stable retention rates are mitigating overall risk")
-            
-        # 4. Baseline Risk Context
-        if abs(row['Risk_Score'] - 5) < 5: # Near absolute minimum
-            reasons.append("workforce risk is at a historic low for this industry")
-        elif gap < 0 and row['Risk_Score'] > 20: 
-            # High risk despite good supply? Must be baseline/attrition driven
-            reasons.append("operational risk remains elevated due to high attrition despite healthy supply")
-
-        # Select top 3 most relevant reasons to keep it concise
-        selected_reasons = reasons[:3]
-        reason_str = "; ".join(selected_reasons)
-        
-        # Add planning horizon context for 2026
-        year_ctx = ""
-        if row['Year'] == 2026:
-            year_ctx = " (Current Planning Horizon)"
-            
-        return f"{risk_level}{year_ctx} detected. {reason_str.capitalize()}."
+        # Rule-based strategic insight (No AI/GPT mentions), see narrative_rules
+        return row['AI_Explanation']
 
     def _prepare_data(self):
-        self.load_data()
-        self.train_models()
-        future_df = self.predict_future()
-        full_df = pd.concat([self.data, future_df], ignore_index=True)
-        full_df = full_df.sort_values(by=['Industry', 'Year'])
-        full_df = self.calculate_scores(full_df)
-        return full_df
+        # The returned panel is shared between requests and must be treated as read-only
+        return self.snapshot()[0]
+
+    def snapshot(self):
+        """
+        (scored panel, normalization bounds) of one build, read in a single step
+        so a request never pairs a panel with bounds from a newer reload().
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        # Concurrent first requests wait for one build instead of each running it
+        with self._ingest_lock:
+            if self._snapshot is None:
+                self.load_data()
+                self.train_models()
+                future_df = self.predict_future()
+                full_df = pd.concat([self.data, future_df], ignore_index=True)
+                full_df = full_df.sort_values(by=['Industry', 'Year'])
+                # Store the bounds for What-If Simulation context
+                self._publish(*self._score(full_df))
+            return self._snapshot
+
+    def reload(self):
+        """
+        Rebuilds the merged, forecast and scored panel and the model coefficients
+        from the files on disk, off to the side in a fresh IndustryDashboard, then
+        swaps them in. Requests already holding the previous snapshot finish on it;
+        nothing waits on the rebuild. Rows added with ingest() but not written to
+        the CSVs are dropped, the files on disk being the source of truth.
+        Returns the new data_version.
+        """
+        fresh = IndustryDashboard(data_dir=self.data_dir)
+        fresh.future_years = list(self.future_years)
+        fresh.snapshot()
+
+        with self._ingest_lock:
+            self.data = fresh.data
+            self.models = fresh.models
+            self.model_stats = fresh.model_stats
+            self.loaded_signature = fresh.loaded_signature
+            # Readers pick up the new panel together with its bounds from this one assignment
+            self._publish(*fresh._snapshot)
+            self.data_version += 1
+        return self.data_version
+
+    def ingest(self, attrition=None, growth=None, internship=None, rescore_all=False):
+        """
+        Adds or updates rows for specific industries/years without a full rebuild.
+
+        Each argument takes rows in the layout of the matching CSV (a DataFrame or a
+        list of dicts). Existing (Industry, Year) rows are updated, new ones are
+        appended and must be complete across the three datasets. Only the affected
+        industries are refitted, forecast and rescored; every other partition of the
+        scored panel is reused as-is.
+
+        The forecast Year slope is pooled across industries. It is refitted from the
+        cached per-industry sums, but untouched industries keep forecasts made with
+        the previous slope. Pass rescore_all=True to re-forecast and rescore every
+        industry with the refitted model (still no reload, merge or raw refit).
+        """
+        keys = ['Industry', 'Year']
+        frames = [
+            pd.DataFrame(rows).drop_duplicates(keys, keep='last').set_index(keys)
+            for rows in (attrition, growth, internship) if rows is not None
+        ]
+        if not frames:
+            return {"industries": [], "rows": 0}
+
+        with self._ingest_lock:
+            panel, bounds = self.snapshot()
+            # Categorical columns from the compiled store cannot take new values
+            data = self.data.astype({
+                col: object for col in self.data.select_dtypes('category').columns
+            }).set_index(keys)
+
+            updates = frames[0]
+            for frame in frames[1:]:
+                updates = updates.combine_first(frame)
+            unknown = updates.columns.difference(data.columns)
+            if len(unknown):
+                raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+            # Columns not supplied for existing rows keep their current values
+            existing = updates.index.isin(data.index)
+            merged = data.reindex(updates.index)
+            merged.update(updates)
+            updates = merged
+            incomplete = updates.isna().any(axis=1)
+            if incomplete.any():
+                missing = [f"{ind} {year}" for ind, year in updates.index[incomplete]]
+                raise ValueError(f"Incomplete rows for new industry/year: {', '.join(missing)}")
+            updates = updates.astype(data.dtypes.to_dict())
+
+            data.loc[updates.index[existing]] = updates[existing]
+            data = pd.concat([data, updates[~existing]]).reset_index()
+            affected = updates.index.get_level_values('Industry').unique().tolist()
+            if rescore_all:
+                affected = data['Industry'].unique().tolist()
+            affected_data = data[data['Industry'].isin(affected)]
+
+            # Swap the changed industries' sums and refit from the cached totals
+            changed = updates.index.get_level_values('Industry').unique()
+            self.model_stats = pd.concat([
+                self.model_stats.drop(changed, errors='ignore'),
+                self._trend_stats(data[data['Industry'].isin(changed)])
+            ])
+            self._fit_models()
+
+            part = pd.concat([affected_data, self.predict_future(affected)], ignore_index=True)
+            part, part_bounds = self._score(part.sort_values(by=keys))
+
+            untouched = panel[~panel['Industry'].isin(affected)]
+            self.data = data
+            # A new bounds dict: the one in the previous snapshot may still be in use
+            self._publish(pd.concat([untouched, part], ignore_index=True).sort_values(by=keys),
+                          {**bounds, **part_bounds})
+
+        print(f"Ingested {len(updates)} rows for {', '.join(affected)}")
+        return {"industries": affected, "rows": int(len(updates))}
+
+    def range_query(self, industries=None, start_year=None, end_year=None,
+                    fields=('supply', 'demand', 'risk', 'surge')):
+        """
+        Column-oriented slice of the scored panel for comparison views.
+        Each field is an industries x years matrix (None where the panel has no
+        row), built from one filter over the scored panel.
+        """
+        unknown = [f for f in fields if f not in RANGE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(RANGE_FIELDS)}")
+
+        full_df = self._prepare_data()
+        mask = np.ones(len(full_df), dtype=bool)
+        if industries:
+            mask &= full_df['Industry'].isin(industries).to_numpy()
+        if start_year is not None:
+            mask &= (full_df['Year'] >= start_year).to_numpy()
+        if end_year is not None:
+            mask &= (full_df['Year'] <= end_year).to_numpy()
+        sub = full_df[mask]
+
+        # Requested order first, then panel order for "all industries"
+        present = set(sub['Industry'].unique())
+        names = [i for i in dict.fromkeys(industries or sorted(present)) if i in present]
+        years = sorted(int(y) for y in sub['Year'].unique())
+        rows = pd.Index(names).get_indexer(sub['Industry'])
+        cols = np.searchsorted(np.asarray(years, dtype=np.int64), sub['Year'].to_numpy(dtype=np.int64))
+
+        result = {"Industries": names, "Years": years, "Fields": {}}
+        for field in fields:
+            if field in RANGE_LABELS:
+                values = sub[RANGE_FIELDS[field]].to_numpy(dtype=object)
+            else:
+                values = sub[RANGE_FIELDS[field]].to_numpy(dtype=np.float64)
+                if field == 'intake':
+                    # Forecast intakes are fractional; truncated like int() in run_analysis
+                    values = values.astype(np.int64).astype(object)
+                else:
+                    values = np.round(values, RANGE_DECIMALS.get(field, 2)).astype(object)
+            matrix = np.full((len(names), len(years)), None, dtype=object)
+            matrix[rows, cols] = values
+            result["Fields"][field] = matrix.tolist()
+        return result
 
     def get_company_summaries(self, industry, target_year):
-        from company_analysis import CompanyAnalysis
-        ca = CompanyAnalysis(dashboard=self)
+        if self.company_logic is None:
+            from company_analysis import CompanyAnalysis
+            CompanyAnalysis(dashboard=self)
+        ca = self.company_logic
         all_companies = ca.companies.get(industry, [])
-        
-        # Get comparison results for all companies essentially
-        results = ca.compare_companies(industry, all_companies, target_year)
+
+        if len(all_companies) > COMPANY_SUMMARY_LIMIT:
+            # Large universes: only the top of the risk ranking goes into the payload
+            results = ca.rank_companies(industry, target_year, sort_by="risk", limit=COMPANY_SUMMARY_LIMIT)
+            results = results.get("Companies", results)
+        else:
+            # Get comparison results for all companies essentially
+            results = ca.compare_companies(industry, all_companies, target_year)
         
         summaries = []
         if isinstance(results, list):
@@ -322,66 +414,78 @@ class IndustryDashboard:
                 })
         return summaries
 
-    def run_analysis(self, target_industry, target_year, include_companies=True):
+    def industry_metrics(self, row):
+        """The Metrics block of run_analysis for one scored panel row."""
+        return {
+            "Talent_Supply_Score": round(row['Talent_Supply_Score'], 2),
+            "Talent_Demand_Score": round(row['Talent_Demand_Score'], 2),
+            "Workforce_Risk_Score": round(row['Risk_Score'], 2),
+            "Risk_Level": row['Risk_Level'],
+            # Raw Metrics for Pipeline UI
+            "Internship_Intake": int(row['Interns_Intake']),
+            "Conversion_Rate": round(row['Conversion_Rate'], 2),
+            "Attrition_Rate": round(row['Attrition_Rate'], 3),
+            "Growth_Rate": round(row['Growth_Rate'], 3)
+        }
+
+    @coalesced
+    def run_analysis(self, target_industry, target_year, include_companies=True, fields=None):
+        """
+        The industry dashboard payload. `fields` (see parse_fields) limits it to
+        the given sections; the others are neither computed nor returned.
+        """
         print(f"\nRunning Industry analysis for {target_industry} {target_year}...")
-        full_df = self._prepare_data()
+        full_df, bounds = self.snapshot()
+
+        def wanted(name):
+            return fields is None or name in fields
         
         # 6. Extract specific request
-        prev_year = target_year - 1
-        
         row = full_df[(full_df['Industry'] == target_industry) & (full_df['Year'] == target_year)]
         
         if row.empty:
             return {"error": "Data not available for this year/industry"}
         
         row = row.iloc[0]
-        
-        prev_row = full_df[(full_df['Industry'] == target_industry) & (full_df['Year'] == prev_year)]
-        prev_row = prev_row.iloc[0] if not prev_row.empty else None
-        
-        # Calculate recent demand trend for simulation/risk
-        industry_df = full_df[full_df['Industry'] == target_industry].sort_values('Year')
-        if len(industry_df) >= 3:
-            recent_df = industry_df.tail(3)
-            demand_trend = (recent_df['Talent_Demand_Score'].iloc[-1] - recent_df['Talent_Demand_Score'].iloc[0])
-        else:
-            demand_trend = 0
-        
-        # 7. Build Result
-        
-        # Historical Trend Data for Chart
-        industry_df = full_df[full_df['Industry'] == target_industry]
-        trend_data = []
-        for _, r in industry_df.iterrows():
-            trend_data.append({
-                "Year": int(r['Year']),
-                "Talent_Supply": round(r['Talent_Supply_Score'], 2),
-                "Talent_Demand": round(r['Talent_Demand_Score'], 2)
-            })
-
 
+        # 7. Build Result
         result = {
             "Industry": target_industry,
             "Year": int(target_year),
-            "Metrics": {
-                "Talent_Supply_Score": round(row['Talent_Supply_Score'], 2),
-                "Talent_Demand_Score": round(row['Talent_Demand_Score'], 2),
-                "Workforce_Risk_Score": round(row['Risk_Score'], 2),
-                "Risk_Level": self.get_risk_level(row['Risk_Score']),
-                # Raw Metrics for Pipeline UI
-                "Internship_Intake": int(row['Interns_Intake']),
-                "Conversion_Rate": round(row['Conversion_Rate'], 2),
-                "Attrition_Rate": round(row['Attrition_Rate'], 3),
-                "Growth_Rate": round(row['Growth_Rate'], 3)
-            },
-            "Hiring_Surge_Timeline": self.get_hiring_surge(row, prev_row),
-            "AI_Explanation": self.generate_explanation(row),
-            "Supply_Demand_Trend": trend_data,
-            "Simulation_Context": {
-                "Supply_P5": round(self.normalization_bounds[target_industry]['supply'][0], 2),
-                "Supply_P95": round(self.normalization_bounds[target_industry]['supply'][1], 2),
-                "Demand_P5": round(self.normalization_bounds[target_industry]['demand'][0], 2),
-                "Demand_P95": round(self.normalization_bounds[target_industry]['demand'][1], 2),
+        }
+
+        if wanted("Metrics"):
+            result["Metrics"] = self.industry_metrics(row)
+
+        if wanted("Hiring_Surge_Timeline"):
+            result["Hiring_Surge_Timeline"] = self.get_hiring_surge(row)
+
+        if wanted("AI_Explanation"):
+            result["AI_Explanation"] = self.generate_explanation(row)
+
+        if wanted("Supply_Demand_Trend"):
+            # Historical Trend Data for Chart
+            industry_df = full_df[full_df['Industry'] == target_industry]
+            result["Supply_Demand_Trend"] = frame_records(industry_df, {
+                "Year": 'Year',
+                "Talent_Supply": 'Talent_Supply_Score',
+                "Talent_Demand": 'Talent_Demand_Score'
+            })
+
+        if wanted("Simulation_Context"):
+            # Calculate recent demand trend for simulation/risk
+            industry_df = full_df[full_df['Industry'] == target_industry].sort_values('Year')
+            if len(industry_df) >= 3:
+                recent_df = industry_df.tail(3)
+                demand_trend = (recent_df['Talent_Demand_Score'].iloc[-1] - recent_df['Talent_Demand_Score'].iloc[0])
+            else:
+                demand_trend = 0
+
+            result["Simulation_Context"] = {
+                "Supply_P5": round(bounds[target_industry]['supply'][0], 2),
+                "Supply_P95": round(bounds[target_industry]['supply'][1], 2),
+                "Demand_P5": round(bounds[target_industry]['demand'][0], 2),
+                "Demand_P95": round(bounds[target_industry]['demand'][1], 2),
                 "Demand_Trend": round(demand_trend, 2),
                 "Baseline": {
                     "Internship_Intake": int(row['Interns_Intake']),
@@ -390,9 +494,8 @@ class IndustryDashboard:
                     "Growth_Rate": float(row['Growth_Rate'])
                 }
             }
-        }
         
-        if include_companies:
+        if include_companies and wanted("Company_Metrics"):
             result["Company_Metrics"] = self.get_company_summaries(target_industry, target_year)
         
         return result
@@ -425,6 +528,13 @@ class IndustryDashboard:
         }
 
 
+    def get_student_skills(self, target_industry, target_year):
+        """The Student_Insights["Skills"] block of run_student_analysis, without the rest of the analysis."""
+        full_df = self._prepare_data()
+        if not ((full_df['Industry'] == target_industry) & (full_df['Year'] == target_year)).any():
+            return {}
+        return self.get_skills_for_industry(target_industry, target_year)
+
     def get_industry_switch_suggestion(self, current_industry, target_year, full_df):
         all_industries = full_df['Industry'].unique()
         best_industry = None
@@ -451,102 +561,52 @@ class IndustryDashboard:
             }
         return None
 
-    def get_student_insights(self, row, full_df):
-        demand = row['Talent_Demand_Score']
-        risk = row['Risk_Score']
-        supply = row['Talent_Supply_Score']
-        growth = row['Growth_Rate']
-        conversion = row['Conversion_Rate']
+    def get_student_insights(self, row, full_df, fields=None):
+        """Student_Insights for a scored row; `fields` limits it to those insight names."""
         industry = row['Industry']
-        
-        # 1. Outlook mapping (More Granular Categories)
-        if risk <= 30 and demand >= 60:
-            outlook = "Excellent" if growth > 0.08 else "Favorable"
-            if growth > 0.05:
-                desc = f"Rapidly expanding {industry} market. Strong demand combined with high growth makes this an ideal entry point for early-career professionals."
-            else:
-                desc = f"Stable and favorable {industry} outlook. Consistent hiring and low risk provide a secure career trajectory."
-        elif risk <= 55:
-            outlook = "Promising" if conversion > 0.8 else "Moderate"
-            if conversion > 0.75:
-                desc = f"Balanced market with high internship-to-job conversion. Competition exists, but focus on hands-on experience as a primary differentiator."
-            else:
-                desc = f"Transitional {industry} market. Evolving industry requirements mean students should focus on both traditional and emerging skills to stay relevant."
-        else:
-            outlook = "Niche-only" if risk > 85 else "Competitive"
-            desc = f"High-bar entry environment in {industry}. Success requires elite technical specializations and a strong professional network to bypass standard filters."
-            
-        # 2. Competition level (More Granular Categories)
-        gap = demand - supply
-        if gap < -30:
-            comp_level = "Hyper-Competitive"
-            comp_desc = f"Market saturation in {industry} is high. Generalist roles are extremely contested; focus on distinct technical edge cases."
-        elif gap < -15:
-            comp_level = "Selective"
-            comp_desc = f"Applicant supply in {industry} outpaces standard demand. Focus on highly specialized niches to stand out from the general pool."
-        elif gap > 20:
-            comp_level = "High Opportunity"
-            comp_desc = f"Significant talent shortage in {industry}. Employers are actively competing for graduates with core competencies."
-        elif gap > 5 or (gap > 0 and growth > 0.08):
-            comp_level = "Growth-led"
-            comp_desc = f"Emerging demand in {industry} is creating new vacancies faster than they can be filled. Early entry is highly advantageous."
-        else:
-            comp_level = "Balanced"
-            comp_desc = f"Stable talent equilibrium in {industry}. Typical recruitment cycles; standard qualifications and strong portfolios are the keys to success."
-
-
-            
-        # 3. Preparation Guidance (Enriched)
-        guidance = []
-        surge = self.get_hiring_surge(row)
-        
-        # Timing/Surge based
-        if surge == "1-3 months":
-            guidance.append("Immediate Action: Finalize your portfolio and start applying now to catch the upcoming hiring peak.")
-        elif surge == "4-6 months":
-            guidance.append("Strategic Prep: Use the next quarter to master 1-2 'In-Demand' skills before the surge begins.")
-        else:
-            guidance.append("Plan Ahead: Aim for foundational certifications and early internships to build a long-term lead.")
-            
-        # Risk/Competition based
-        if comp_level == "High Competition":
-            guidance.append("Differentiation: Focus on multi-disciplinary projects to stand out in a crowded applicant pool.")
-        elif comp_level == "Opportunity-rich":
-            guidance.append("Speed-to-Market: Optimize your LinkedIn and resume for rapid technical screening.")
-            
-        # Industry/Skill based
-        guidance.append(f"Network Strategy: Connect with 3-5 professionals currently in {row['Industry']} to understand team culture.")
-        
-        # Conversion/Retention based
-        if row['Conversion_Rate'] > 0.7:
-             guidance.append("Internship Focus: Target top-tier internships here, as conversion rates to full-time roles are exceptional.")
-        else:
-             guidance.append("Broaden Search: Diversify your applications beyond just internships to include direct entry-level roles.")
-
-        return {
-            "Hiring_Outlook": outlook,
-            "Outlook_Description": desc,
-            "Competition_Level": comp_level,
-            "Competition_Description": comp_desc,
-            "Preparation_Guidance": guidance,
-            "Industry_Switch": self.get_industry_switch_suggestion(row['Industry'], row['Year'], full_df),
-            "Skills": self.get_skills_for_industry(row['Industry'], row['Year'])
+        # Outlook, competition and guidance come from the panel's rule columns (see narrative_rules)
+        insights = {
+            "Hiring_Outlook": row['Hiring_Outlook'],
+            "Outlook_Description": narrative_rules.OUTLOOK_DESCRIPTIONS[row['Outlook_Key']].format(industry=industry),
+            "Competition_Level": row['Competition_Level'],
+            "Competition_Description": narrative_rules.COMPETITION_DESCRIPTIONS[row['Competition_Level']].format(industry=industry),
+            "Preparation_Guidance": narrative_rules.preparation_guidance(row),
         }
+        # The industry switch scan and the skills lookup are the costly parts; skipped when not asked for
+        if fields is None or "Industry_Switch" in fields:
+            insights["Industry_Switch"] = self.get_industry_switch_suggestion(row['Industry'], row['Year'], full_df)
+        if fields is None or "Skills" in fields:
+            insights["Skills"] = self.get_skills_for_industry(row['Industry'], row['Year'])
+        if fields is not None:
+            insights = {key: value for key, value in insights.items() if key in fields}
+        return insights
 
 
-    def run_student_analysis(self, target_industry, target_year, include_companies=True):
+    @coalesced
+    def run_student_analysis(self, target_industry, target_year, include_companies=True, fields=None):
+        """run_analysis plus Student_Insights; `fields` as in parse_fields(student=True)."""
         print(f"\nRunning Student analysis for {target_industry} {target_year}...")
         full_df = self._prepare_data()
         
         row = full_df[(full_df['Industry'] == target_industry) & (full_df['Year'] == target_year)]
         if row.empty: return {"error": "Data not available"}
         row = row.iloc[0]
-        
-        # Reuse existing industry data structure
-        industry_data = self.run_analysis(target_industry, target_year, include_companies=include_companies)
+
+        analysis_fields = insight_fields = None
+        if fields is not None:
+            analysis_fields = frozenset(f for f in fields if not f.startswith("Student_Insights"))
+            if "Student_Insights" not in fields:
+                prefix = "Student_Insights."
+                insight_fields = frozenset(f[len(prefix):] for f in fields if f.startswith(prefix))
+        
+        # Reuse existing industry data structure (copied: run_analysis results are shared by coalesced callers)
+        industry_data = dict(self.run_analysis(
+            target_industry, target_year, include_companies=include_companies, fields=analysis_fields
+        ))
         
         # Add student reframing
-        industry_data["Student_Insights"] = self.get_student_insights(row, full_df)
+        if insight_fields is None or insight_fields:
+            industry_data["Student_Insights"] = self.get_student_insights(row, full_df, fields=insight_fields)
         
         return industry_data
 
@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class JobCatalogue:
+    """
+    Every job in jobs.json as a sparse skill x job incidence matrix.
+
+    The matrix is stored CSR-style by job: the core skills of job j are
+    term ids core_indices[core_indptr[j]:core_indptr[j + 1]] (duplicates kept,
+    so a job counts them the same way analyze_resume does). Scoring a resume
+    is then a gather of the resume's found-skill mask over core_indices and
+    one bincount per job, independent of how many jobs share a skill.
+    """
+
+    def __init__(self, jobs_data):
+        self.terms = []                 # term id -> lowercase skill
+        self.term_ids = {}              # lowercase skill -> term id
+        self.industries = list(jobs_data.keys())
+        self.titles = []
+        self.core_skills = []           # job -> [lowercase skill, ...], for per-job details
+
+        job_industry = []
+        indices = []
+        indptr = [0]
+        for code, industry in enumerate(self.industries):
+            for job in jobs_data[industry]:
+                skills = [s.lower() for s in job['core_skills']]
+                self.titles.append(job['title'])
+                self.core_skills.append(skills)
+                job_industry.append(code)
+                indices.extend(self.term_id(s) for s in skills)
+                indptr.append(len(indices))
+
+        self.job_industry = np.asarray(job_industry, dtype=np.int32)
+        self.core_indices = np.asarray(indices, dtype=np.int32)
+        self.core_indptr = np.asarray(indptr, dtype=np.int64)
+        self.core_counts = np.diff(self.core_indptr)
+        # Row (job) of every stored entry, for the per-job bincount
+        self.core_rows = np.repeat(np.arange(len(self.titles), dtype=np.int32), self.core_counts)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def term_id(self, skill):
+        term = self.term_ids.get(skill)
+        if term is None:
+            term = self.term_ids[skill] = len(self.terms)
+            self.terms.append(skill)
+        return term
+
+    def core_scores(self, found_mask):
+        """Core component (0-60) of the ATS score for every job at once."""
+        hits = np.bincount(
+            self.core_rows, weights=found_mask[self.core_indices], minlength=len(self.titles)
+        )
+        counts = self.core_counts
+        return np.where(counts > 0, hits / np.maximum(counts, 1) * 60, 60.0)
+
+    def top_k(self, scores, k):
+        """Indices of the k best scores, best first; ties keep catalogue order."""
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        if k < len(scores):
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            # argpartition does not break ties by position; widen to every tied score
+            cutoff = scores[candidates].min()
+            candidates = np.flatnonzero(scores >= cutoff)
+        else:
+            candidates = np.arange(len(scores))
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order][:k]
+
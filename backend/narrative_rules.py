@@ -0,0 +1,234 @@
+"""
+Narrative rules of the dashboards (risk level, hiring surge window, AI
+explanation, student outlook, competition level and preparation guidance),
+evaluated over the whole scored panel at once.
+
+Each rule table is an ordered list of (condition, value) pairs plus a default:
+a row gets the value of the first condition that holds, like an if/elif chain.
+Conditions are functions of RuleInputs, whose attributes are column arrays, so
+one np.select call evaluates a table for every (industry, year) row.
+annotate() stores the results as columns of the scored panel; requests read
+their row's values instead of re-running the rules.
+
+Values are shared label objects picked by index (no per-row string copies).
+Texts that name the industry are stored as keys and filled in when rendered.
+"""
+import itertools
+from functools import lru_cache
+from types import SimpleNamespace
+
+import numpy as np
+
+# Hiring surge windows are only predicted for the current planning horizon
+CURRENT_YEAR = 2026
+
+
+class RuleInputs:
+    """Column arrays the rule conditions read, with the derived gap and HPI."""
+
+    def __init__(self, df):
+        def column(name):
+            return df[name].to_numpy(dtype=np.float64)
+
+        self.supply = column('Talent_Supply_Score')
+        self.demand = column('Talent_Demand_Score')
+        self.risk = column('Risk_Score')
+        self.attrition = column('Attrition_Rate')
+        self.growth = column('Growth_Rate')
+        self.conversion = column('Conversion_Rate')
+        self.trend = column('Demand_Trend') if 'Demand_Trend' in df else np.zeros(len(df))
+        self.year = df['Year'].to_numpy()
+        self.gap = self.demand - self.supply
+        # Hiring Pressure Index = (Demand - Supply) + (Attrition x 20) + (Demand_Trend x 0.8):
+        # the supply-demand gap, attrition as an urgency amplifier and demand momentum
+        self.hpi = self.gap + self.attrition * 20 + self.trend * 0.8
+
+
+RISK_LEVEL_RULES = [
+    (lambda r: r.risk <= 35, "Low Risk"),
+    (lambda r: r.risk <= 65, "Medium Risk"),
+], "High Risk"
+
+SURGE_RULES = [
+    (lambda r: (r.hpi >= 30) | ((r.hpi >= 20) & (r.trend > 5)), "1-3 months"),  # immediate pressure
+    (lambda r: (r.hpi >= 15) | (r.trend > 0), "4-6 months"),                    # near-term hiring
+], "6-12 months"                                                                 # long-term planning
+
+# AI_Explanation: "<risk level>[ (Current Planning Horizon)] detected. <up to 3 reasons>."
+GAP_REASONS = [
+    (lambda r: r.gap > 20, "demand significantly exceeds supply, creating critical shortage pressure"),
+    (lambda r: r.gap > 0, "demand outpaces supply, tightening the talent pipeline"),
+    (lambda r: r.gap < -20, "talent supply is robust relative to current market demand"),
+], "supply and demand are currently in a state of relative equilibrium"
+
+TREND_REASONS = [
+    (lambda r: r.trend > 10, "strong demand momentum suggests accelerating hiring needs"),
+    (lambda r: r.trend > 0, "positive demand momentum indicates steady market growth"),
+    (lambda r: r.trend < -10, "declining demand trend is easing immediate workforce pressure"),
+], None
+
+ATTRITION_REASONS = [
+    (lambda r: r.attrition > 0.18, "aggressive attrition rates are accelerating workforce leakage"),
+    (lambda r: r.attrition > 0.12, "steady attrition continues to drive routine hiring requirements"),
+    (lambda r: r.attrition < 0.05, "exceptionally stable retention rates are mitigating overall risk"),
+], None
+
+RISK_REASONS = [
+    # Near the absolute minimum
+    (lambda r: np.abs(r.risk - 5) < 5, "workforce risk is at a historic low for this industry"),
+    # High risk despite good supply: baseline/attrition driven
+    (lambda r: (r.gap < 0) & (r.risk > 20),
+     "operational risk remains elevated due to high attrition despite healthy supply"),
+], None
+
+EXPLANATION_REASONS = [GAP_REASONS, TREND_REASONS, ATTRITION_REASONS, RISK_REASONS]
+MAX_REASONS = 3
+
+# Student_Insights
+OUTLOOK_RULES = [
+    (lambda r: (r.risk <= 30) & (r.demand >= 60) & (r.growth > 0.08), "Excellent"),
+    (lambda r: (r.risk <= 30) & (r.demand >= 60), "Favorable"),
+    (lambda r: (r.risk <= 55) & (r.conversion > 0.8), "Promising"),
+    (lambda r: r.risk <= 55, "Moderate"),
+    (lambda r: r.risk > 85, "Niche-only"),
+], "Competitive"
+
+OUTLOOK_DESCRIPTION_RULES = [
+    (lambda r: (r.risk <= 30) & (r.demand >= 60) & (r.growth > 0.05), "expanding"),
+    (lambda r: (r.risk <= 30) & (r.demand >= 60), "stable"),
+    (lambda r: (r.risk <= 55) & (r.conversion > 0.75), "balanced"),
+    (lambda r: r.risk <= 55, "transitional"),
+], "high_bar"
+
+OUTLOOK_DESCRIPTIONS = {
+    "expanding": "Rapidly expanding {industry} market. Strong demand combined with high growth makes this an ideal entry point for early-career professionals.",
+    "stable": "Stable and favorable {industry} outlook. Consistent hiring and low risk provide a secure career trajectory.",
+    "balanced": "Balanced market with high internship-to-job conversion. Competition exists, but focus on hands-on experience as a primary differentiator.",
+    "transitional": "Transitional {industry} market. Evolving industry requirements mean students should focus on both traditional and emerging skills to stay relevant.",
+    "high_bar": "High-bar entry environment in {industry}. Success requires elite technical specializations and a strong professional network to bypass standard filters.",
+}
+
+COMPETITION_RULES = [
+    (lambda r: r.gap < -30, "Hyper-Competitive"),
+    (lambda r: r.gap < -15, "Selective"),
+    (lambda r: r.gap > 20, "High Opportunity"),
+    (lambda r: (r.gap > 5) | ((r.gap > 0) & (r.growth > 0.08)), "Growth-led"),
+], "Balanced"
+
+COMPETITION_DESCRIPTIONS = {
+    "Hyper-Competitive": "Market saturation in {industry} is high. Generalist roles are extremely contested; focus on distinct technical edge cases.",
+    "Selective": "Applicant supply in {industry} outpaces standard demand. Focus on highly specialized niches to stand out from the general pool.",
+    "High Opportunity": "Significant talent shortage in {industry}. Employers are actively competing for graduates with core competencies.",
+    "Growth-led": "Emerging demand in {industry} is creating new vacancies faster than they can be filled. Early entry is highly advantageous.",
+    "Balanced": "Stable talent equilibrium in {industry}. Typical recruitment cycles; standard qualifications and strong portfolios are the keys to success.",
+}
+
+# Preparation_Guidance: timing, competition (if any), network, conversion
+TIMING_GUIDANCE = {
+    "1-3 months": "Immediate Action: Finalize your portfolio and start applying now to catch the upcoming hiring peak.",
+    "4-6 months": "Strategic Prep: Use the next quarter to master 1-2 'In-Demand' skills before the surge begins.",
+}
+DEFAULT_TIMING_GUIDANCE = "Plan Ahead: Aim for foundational certifications and early internships to build a long-term lead."
+
+COMPETITION_GUIDANCE = {
+    "High Competition": "Differentiation: Focus on multi-disciplinary projects to stand out in a crowded applicant pool.",
+    "Opportunity-rich": "Speed-to-Market: Optimize your LinkedIn and resume for rapid technical screening.",
+}
+
+NETWORK_GUIDANCE = "Network Strategy: Connect with 3-5 professionals currently in {industry} to understand team culture."
+
+CONVERSION_GUIDANCE_RULES = [
+    (lambda r: r.conversion > 0.7,
+     "Internship Focus: Target top-tier internships here, as conversion rates to full-time roles are exceptional."),
+], "Broaden Search: Diversify your applications beyond just internships to include direct entry-level roles."
+
+NARRATIVE_COLUMNS = [
+    'Risk_Level', 'Hiring_Surge', 'AI_Explanation', 'Hiring_Outlook', 'Outlook_Key',
+    'Competition_Level', 'Timing_Guidance', 'Competition_Guidance', 'Conversion_Guidance',
+]
+
+
+def rule_codes(table, inputs):
+    """Index of the first rule of the table that holds, per row (len(rules) for the default)."""
+    rules, _ = table
+    return np.select([condition(inputs) for condition, _ in rules], np.arange(len(rules)), len(rules))
+
+
+def rule_labels(table):
+    rules, default = table
+    return np.array([value for _, value in rules] + [default], dtype=object)
+
+
+def evaluate(table, inputs):
+    return rule_labels(table)[rule_codes(table, inputs)]
+
+
+def mapped_labels(labels, mapping, default=None):
+    """Labels translated through a dict, indexed by the same rule codes."""
+    return np.array([mapping.get(label, default) for label in labels], dtype=object)
+
+
+def risk_levels(risk):
+    """RISK_LEVEL_RULES over an array of risk scores."""
+    return evaluate(RISK_LEVEL_RULES, SimpleNamespace(risk=np.asarray(risk, dtype=np.float64)))
+
+
+@lru_cache(maxsize=None)
+def explanation_table():
+    """
+    AI_Explanation of every combination of rule outcomes (risk level, current
+    year or not, one code per EXPLANATION_REASONS table), flattened in
+    np.ravel_multi_index order over explanation_dims(). A thousand or so texts,
+    formatted once and shared by every row.
+    """
+    risk_labels = rule_labels(RISK_LEVEL_RULES)
+    reason_labels = [rule_labels(table) for table in EXPLANATION_REASONS]
+    texts = []
+    for combo in itertools.product(*(range(n) for n in explanation_dims())):
+        reasons = [labels[code] for labels, code in zip(reason_labels, combo[2:])]
+        reason_str = "; ".join([r for r in reasons if r is not None][:MAX_REASONS])
+        year_ctx = " (Current Planning Horizon)" if combo[1] else ""
+        texts.append(f"{risk_labels[combo[0]]}{year_ctx} detected. {reason_str.capitalize()}.")
+    return np.array(texts, dtype=object)
+
+
+def explanation_dims():
+    tables = [RISK_LEVEL_RULES] + EXPLANATION_REASONS
+    dims = [len(rules) + 1 for rules, _ in tables]
+    return tuple(dims[:1] + [2] + dims[1:])
+
+
+def annotate(df):
+    """Adds NARRATIVE_COLUMNS to a scored frame (in place) and returns it."""
+    inputs = RuleInputs(df)
+    current = inputs.year == CURRENT_YEAR
+
+    risk_codes = rule_codes(RISK_LEVEL_RULES, inputs)
+    df['Risk_Level'] = rule_labels(RISK_LEVEL_RULES)[risk_codes]
+    # One extra code for "no window" (None) outside the current year
+    surge_labels = np.append(rule_labels(SURGE_RULES), None)
+    surge_codes = rule_codes(SURGE_RULES, inputs)
+    surge_codes[~current] = len(surge_labels) - 1
+    df['Hiring_Surge'] = surge_labels[surge_codes]
+    codes = [risk_codes, current.astype(np.int64)] + [rule_codes(table, inputs) for table in EXPLANATION_REASONS]
+    df['AI_Explanation'] = explanation_table()[np.ravel_multi_index(codes, explanation_dims())]
+
+    df['Hiring_Outlook'] = evaluate(OUTLOOK_RULES, inputs)
+    df['Outlook_Key'] = evaluate(OUTLOOK_DESCRIPTION_RULES, inputs)
+    competition_labels = rule_labels(COMPETITION_RULES)
+    competition_codes = rule_codes(COMPETITION_RULES, inputs)
+    df['Competition_Level'] = competition_labels[competition_codes]
+    df['Timing_Guidance'] = mapped_labels(surge_labels, TIMING_GUIDANCE, DEFAULT_TIMING_GUIDANCE)[surge_codes]
+    df['Competition_Guidance'] = mapped_labels(competition_labels, COMPETITION_GUIDANCE)[competition_codes]
+    df['Conversion_Guidance'] = evaluate(CONVERSION_GUIDANCE_RULES, inputs)
+    return df
+
+
+def preparation_guidance(row):
+    """Preparation_Guidance of a scored panel row."""
+    guidance = [row['Timing_Guidance']]
+    if row['Competition_Guidance'] is not None:
+        guidance.append(row['Competition_Guidance'])
+    guidance.append(NETWORK_GUIDANCE.format(industry=row['Industry']))
+    guidance.append(row['Conversion_Guidance'])
+    return guidance
@@ -0,0 +1,165 @@
+"""
+Compiled, typed columnar store for the merged workforce panel.
+
+`python panel_store.py` reads the three CSVs once, performs the Industry/Year
+merge and writes one .npy file per column under data/compiled/panel/:
+
+- Industry and Top_Skills as categorical codes (+ categories in the manifest)
+- Year as int16, Interns_Intake as int32
+- rates as float32, with the number of decimals seen in the CSV recorded so
+  the loader can restore the exact CSV values
+
+IndustryDashboard.load_data() memory-maps these files instead of parsing and
+merging the CSVs, as long as the manifest still matches the CSVs on disk.
+
+Only the categorical and integer columns stay zero-copy memory maps. The app
+loads with exact=True, which widens the rates into float64 copies so scores
+are bit-identical to the CSV path. The memory saved therefore comes from the
+categorical columns (Industry, and Top_Skills strings in particular) and the
+narrow integers, not the rates: the PanelStore benchmark shows about 20% less
+than the CSV frame at 10x and about 4x less at 1000x, where Top_Skills dominates.
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+STORE_DIR = os.path.join(DATA_DIR, 'compiled', 'panel')
+SOURCE_FILES = ['attrition_data.csv', 'industry_growth.csv', 'internship_data.csv']
+STORE_VERSION = 1
+
+CATEGORICAL_COLUMNS = ['Industry', 'Top_Skills']
+INT_COLUMNS = {'Year': np.int16, 'Interns_Intake': np.int32}
+RATE_COLUMNS = ['Attrition_Rate', 'Growth_Rate', 'Conversion_Rate']
+
+
+def read_csv_panel(data_dir=DATA_DIR):
+    """Reads and merges the three CSVs (the layout IndustryDashboard works with)."""
+    attrition = pd.read_csv(os.path.join(data_dir, 'attrition_data.csv'))
+    growth = pd.read_csv(os.path.join(data_dir, 'industry_growth.csv'))
+    internship = pd.read_csv(os.path.join(data_dir, 'internship_data.csv'))
+
+    # Merge datasets on Industry and Year
+    df = attrition.merge(growth, on=['Industry', 'Year'])
+    return df.merge(internship, on=['Industry', 'Year'])
+
+
+def source_signature(data_dir=DATA_DIR):
+    signature = {}
+    for name in SOURCE_FILES:
+        st = os.stat(os.path.join(data_dir, name))
+        signature[name] = [st.st_size, st.st_mtime_ns]
+    return signature
+
+
+def _decimals(values, max_decimals=6):
+    # Smallest number of decimals that reproduces every value exactly
+    for d in range(max_decimals + 1):
+        if np.array_equal(np.round(values, d), values):
+            return d
+    return None
+
+
+def _code_dtype(n_categories):
+    return np.int8 if n_categories < 2 ** 7 else np.int16 if n_categories < 2 ** 15 else np.int32
+
+
+def build_store(data_dir=DATA_DIR, store_dir=None):
+    """One-shot build of the compiled store from the CSVs."""
+    store_dir = store_dir or os.path.join(data_dir, 'compiled', 'panel')
+    os.makedirs(store_dir, exist_ok=True)
+    df = read_csv_panel(data_dir)
+
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if col in CATEGORICAL_COLUMNS:
+            cat = values.astype('category')
+            codes = cat.cat.codes.to_numpy().astype(_code_dtype(len(cat.cat.categories)))
+            np.save(os.path.join(store_dir, f'{col}.npy'), codes)
+            columns[col] = {'kind': 'categorical', 'categories': cat.cat.categories.tolist()}
+        elif col in INT_COLUMNS:
+            np.save(os.path.join(store_dir, f'{col}.npy'), values.to_numpy().astype(INT_COLUMNS[col]))
+            columns[col] = {'kind': 'int'}
+        else:
+            arr = values.to_numpy(dtype=np.float64)
+            decimals = _decimals(arr)
+            # float32 keeps 7 significant digits; only use it when that round-trips
+            compact = decimals is not None and np.array_equal(
+                np.round(arr.astype(np.float32).astype(np.float64), decimals), arr
+            )
+            np.save(os.path.join(store_dir, f'{col}.npy'), arr.astype(np.float32) if compact else arr)
+            columns[col] = {'kind': 'float', 'decimals': decimals if compact else None}
+
+    manifest = {
+        'version': STORE_VERSION,
+        'rows': len(df),
+        'column_order': df.columns.tolist(),
+        'columns': columns,
+        'sources': source_signature(data_dir),
+    }
+    with open(os.path.join(store_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return store_dir
+
+
+def read_manifest(store_dir):
+    path = os.path.join(store_dir, 'manifest.json')
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def is_fresh(data_dir=DATA_DIR, store_dir=None):
+    """True when a compiled store exists and was built from the current CSVs."""
+    store_dir = store_dir or os.path.join(data_dir, 'compiled', 'panel')
+    manifest = read_manifest(store_dir)
+    if manifest is None or manifest.get('version') != STORE_VERSION:
+        return False
+    try:
+        return manifest['sources'] == source_signature(data_dir)
+    except OSError:
+        return False
+
+
+def load_store(store_dir, exact=True):
+    """
+    Loads the compiled panel. Categorical and integer columns are zero-copy
+    memory maps. With exact=True (what the app uses) the float32 rates are
+    widened into float64 copies and rounded back to their CSV decimals, so
+    scores match the CSV path bit for bit. exact=False keeps them as float32
+    maps: about 1e-7 relative error per rate, which can move a rounded score
+    in its last published decimal.
+    """
+    manifest = read_manifest(store_dir)
+    data = {}
+    for col in manifest['column_order']:
+        spec = manifest['columns'][col]
+        values = np.load(os.path.join(store_dir, f'{col}.npy'), mmap_mode='r')
+        if spec['kind'] == 'categorical':
+            dtype = pd.CategoricalDtype(spec['categories'])
+            data[col] = pd.Categorical.from_codes(values, dtype=dtype)
+        elif spec['kind'] == 'float' and exact and spec['decimals'] is not None:
+            data[col] = np.round(values.astype(np.float64), spec['decimals'])
+        else:
+            data[col] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the workforce CSVs into a columnar store")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--out', default=None, help="store directory (default: <data-dir>/compiled/panel)")
+    args = parser.parse_args()
+
+    store_dir = build_store(args.data_dir, args.out)
+    manifest = read_manifest(store_dir)
+    print(f"Compiled {manifest['rows']} rows into {store_dir}")
+
+
+if __name__ == '__main__':
+    main()
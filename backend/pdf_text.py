@@ -0,0 +1,144 @@
+"""
+Bounded PDF text extraction for resume analysis.
+
+- files above MAX_PDF_BYTES are rejected before parsing
+- only the first MAX_PAGES pages are read
+- extraction stops once MAX_TEXT_CHARS characters have been gathered
+- page texts are collected in a list and joined once
+- long documents (PARALLEL_MIN_PAGES and up) are split into page ranges
+  that a process pool extracts in parallel (PyPDF2 is pure Python, so
+  threads would serialize on the GIL); ranges are consumed in order and the
+  rest are cancelled once the character budget is reached. Pool workers
+  start from a forkserver, never by forking the server process.
+
+normalize() lowercases and blanks everything except ASCII letters, digits and
+whitespace in one str.translate pass over a precompiled table, with the same
+result as text.lower() followed by re.sub(r'[^a-zA-Z0-9\\s]', ' ', ...).
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+MAX_PDF_BYTES = 10 * 2 ** 20
+MAX_PAGES = 50
+MAX_TEXT_CHARS = 200_000
+PARALLEL_MIN_PAGES = 16
+PAGES_PER_TASK = 8
+EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class _NormalizeTable(dict):
+    """str.translate table: code point -> its lowercase form with non [a-z0-9\\s] blanked."""
+
+    def __missing__(self, code):
+        mapped = ''.join(
+            ch if (ch.isascii() and ch.isalnum()) or ch.isspace() else ' '
+            for ch in chr(code).lower()
+        )
+        self[code] = mapped
+        return mapped
+
+
+NORMALIZE_TABLE = _NormalizeTable()
+for _code in range(128):
+    NORMALIZE_TABLE[_code]
+
+
+def normalize(text):
+    return text.translate(NORMALIZE_TABLE)
+
+
+def _extract_range(path, start, stop, max_chars):
+    # Runs in a pool worker for long documents; each worker parses the file itself
+    import PyPDF2
+
+    contents = []
+    total = 0
+    with open(path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        for i in range(start, stop):
+            content = reader.pages[i].extract_text()
+            if content:
+                contents.append(content)
+                total += len(content) + 1
+                if total >= max_chars:
+                    break
+    return contents
+
+
+def _pool_context():
+    # Not fork: the pool starts lazily on a request, in a process already running
+    # the event loop and threadpool, whose held locks a forked child would inherit
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # A preload also hands our sys.path to the server, so workers can import this module
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _get_pool(workers):
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context())
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def extract_pdf_text(path, max_pages=MAX_PAGES, max_chars=MAX_TEXT_CHARS,
+                     max_bytes=MAX_PDF_BYTES, workers=EXTRACT_WORKERS):
+    """
+    Raw text of the first max_pages pages (one space after each non-empty page),
+    cut at max_chars. Raises ValueError for files above max_bytes.
+    """
+    size = os.path.getsize(path)
+    if size > max_bytes:
+        raise ValueError(f"PDF is {size} bytes, above the {max_bytes} byte limit")
+
+    import PyPDF2
+
+    contents = []
+    total = 0
+    with open(path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        n_pages = min(len(reader.pages), max_pages)
+
+        if workers > 1 and n_pages >= PARALLEL_MIN_PAGES:
+            pool = _get_pool(workers)
+            futures = [
+                pool.submit(_extract_range, path, start, min(start + PAGES_PER_TASK, n_pages), max_chars)
+                for start in range(0, n_pages, PAGES_PER_TASK)
+            ]
+            try:
+                for future in futures:
+                    for content in future.result():
+                        contents.append(content)
+                        total += len(content) + 1
+                    if total >= max_chars:
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+        else:
+            for i in range(n_pages):
+                content = reader.pages[i].extract_text()
+                if content:
+                    contents.append(content)
+                    total += len(content) + 1
+                    if total >= max_chars:
+                        break
+
+    text = ''.join(content + ' ' for content in contents)
+    return text[:max_chars]
@@ -0,0 +1,253 @@
+"""
+Opt-in request profiling and memory tracing for diagnosing slow requests.
+
+Nothing here is installed unless WORKFORCE_ADMIN_TOKEN is set. With it set:
+
+- a request carrying `X-Profile: 1` (or `?profile=1`) and the admin token in
+  the `X-Admin-Token` header runs under cProfile. That covers both the
+  event-loop part and the sync endpoint code FastAPI runs in its threadpool.
+  The profile is stored and its id returned in `X-Profile-Id`; with
+  `X-Profile: inline` the profile text replaces the response body. The token
+  is only read from the header: in a query string it would end up in access
+  logs and browser history.
+- GET /system/profiles[/{id}] lists / returns the stored profiles.
+- GET /system/memory reports the size of the long-lived IndustryDashboard
+  state and, when tracemalloc is running, the top allocation sites.
+  Tracing starts at import with WORKFORCE_TRACEMALLOC=1, so the panel build
+  is covered, or on demand with ?start=1.
+
+Loop-thread profiling also sees other requests interleaved on the event loop,
+so profile on a quiet worker for clean results.
+"""
+import collections
+import contextvars
+import cProfile
+import hmac
+import io
+import itertools
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from urllib.parse import parse_qs
+
+from starlette.responses import PlainTextResponse
+
+ADMIN_TOKEN = os.environ.get("WORKFORCE_ADMIN_TOKEN")
+MAX_PROFILES = 20
+PROFILE_LINES = 40
+
+if os.environ.get("WORKFORCE_TRACEMALLOC") == "1" and not tracemalloc.is_tracing():
+    tracemalloc.start(int(os.environ.get("WORKFORCE_TRACEMALLOC_FRAMES", 1)))
+
+_session = contextvars.ContextVar("profile_session", default=None)
+_profiles = collections.OrderedDict()
+_profiles_lock = threading.Lock()
+_ids = itertools.count(1)
+_loop_profiling = False      # one profiled request at a time on the event loop thread
+
+
+def enabled():
+    return ADMIN_TOKEN is not None
+
+
+def is_admin(token):
+    return enabled() and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)
+
+
+class ProfileSession:
+    """cProfile profilers for one request, one per thread that ran its code."""
+
+    profiler_class = cProfile.Profile
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.profilers = []
+
+    def start(self):
+        """
+        A new profiler, enabled in the calling thread, or None when another one
+        is active. From Python 3.12 cProfile registers with sys.monitoring,
+        which allows one profiler per process: a second enable() raises
+        ValueError, and the active profiler already sees every thread.
+        """
+        profiler = self.profiler_class()
+        try:
+            profiler.enable()
+        except ValueError:
+            return None
+        with self._lock:
+            self.profilers.append(profiler)
+        return profiler
+
+    def run(self, func, *args, **kwargs):
+        profiler = self.start()
+        if profiler is None:
+            # Recorded by the request's event-loop profiler instead
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+
+    def report(self, title, wall_time):
+        out = io.StringIO()
+        out.write(f"{title}\nwall time: {wall_time * 1e3:.1f} ms\n\n")
+        stats = None
+        for profiler in self.profilers:
+            if stats is None:
+                stats = pstats.Stats(profiler, stream=out)
+            else:
+                stats.add(profiler)
+        if stats is not None:
+            stats.sort_stats("cumulative").print_stats(PROFILE_LINES)
+        return out.getvalue()
+
+
+def store_profile(text):
+    profile_id = str(next(_ids))
+    with _profiles_lock:
+        _profiles[profile_id] = {"id": profile_id, "created": time.time(), "text": text}
+        while len(_profiles) > MAX_PROFILES:
+            _profiles.popitem(last=False)
+    return profile_id
+
+
+def list_profiles():
+    with _profiles_lock:
+        return [
+            {"id": p["id"], "created": p["created"], "title": p["text"].split("\n", 1)[0]}
+            for p in _profiles.values()
+        ]
+
+
+def get_profile(profile_id):
+    with _profiles_lock:
+        profile = _profiles.get(profile_id)
+    return profile["text"] if profile else None
+
+
+def _patch_threadpool():
+    # FastAPI runs sync endpoints and dependencies via run_in_threadpool; wrap it so
+    # a profiled request's threadpool work runs under its own profiler in that thread
+    import fastapi.dependencies.utils
+    import fastapi.routing
+    import starlette.concurrency
+
+    original = starlette.concurrency.run_in_threadpool
+
+    async def run_in_threadpool(func, *args, **kwargs):
+        session = _session.get()
+        if session is None:
+            return await original(func, *args, **kwargs)
+        return await original(session.run, func, *args, **kwargs)
+
+    for module in (fastapi.routing, fastapi.dependencies.utils):
+        if getattr(module, "run_in_threadpool", None) is original:
+            module.run_in_threadpool = run_in_threadpool
+
+
+class ProfilingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        global _loop_profiling
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope["headers"])
+        mode = headers.get(b"x-profile", b"").decode()
+        token = headers.get(b"x-admin-token", b"").decode() or None
+        if not mode and b"profile=" in scope.get("query_string", b""):
+            query = parse_qs(scope["query_string"].decode())
+            mode = query.get("profile", [""])[0]
+        if not mode or not is_admin(token) or _loop_profiling:
+            return await self.app(scope, receive, send)
+
+        session = ProfileSession()
+        # Started first: with a profiler from outside this module active, serve unprofiled
+        profiler = session.start()
+        if profiler is None:
+            return await self.app(scope, receive, send)
+        reset = _session.set(session)
+        title = f"{scope['method']} {scope['path']}"
+        inline = mode == "inline"
+        status = {}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if inline:
+                    return
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-profile-id", status["id"].encode())]
+            elif inline and message["type"] == "http.response.body":
+                return
+            await send(message)
+
+        # The id is reserved up front so it can go out with the response headers
+        status["id"] = store_profile(f"{title}\n(in progress)")
+        start = time.perf_counter()
+        _loop_profiling = True
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            _loop_profiling = False
+            _session.reset(reset)
+            text = session.report(f"{title} -> {status.get('code')}", time.perf_counter() - start)
+            with _profiles_lock:
+                if status["id"] in _profiles:
+                    _profiles[status["id"]]["text"] = text
+
+        if inline:
+            response = PlainTextResponse(text, headers={"X-Profile-Id": status["id"]})
+            await response(scope, receive, send)
+
+
+def install(app):
+    """Adds the profiling middleware; a no-op unless WORKFORCE_ADMIN_TOKEN is set."""
+    if not enabled():
+        return
+    _patch_threadpool()
+    app.add_middleware(ProfilingMiddleware)
+
+
+def _frame_bytes(df):
+    return int(df.memory_usage(deep=True).sum()) if df is not None else 0
+
+
+def memory_report(dashboard, top=20, start=False):
+    """Sizes of the dashboard's long-lived state plus the top tracemalloc sites."""
+    state = {
+        "data_bytes": _frame_bytes(dashboard.data),
+        "scored_data_bytes": _frame_bytes(dashboard.scored_data),
+        "model_stats_bytes": _frame_bytes(dashboard.model_stats),
+        "normalization_bounds": len(dashboard.normalization_bounds),
+    }
+    company_logic = getattr(dashboard, "company_logic", None)
+    if company_logic is not None:
+        state["company_draw_cache"] = len(company_logic._draw_cache)
+        state["company_trend_cache"] = len(company_logic._trend_cache)
+
+    if start and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    report = {"dashboard_state": state, "tracing": tracemalloc.is_tracing()}
+    if not tracemalloc.is_tracing():
+        report["hint"] = "start tracing with ?start=1, or WORKFORCE_TRACEMALLOC=1 at boot"
+        return report
+
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+    ])
+    report["traced_current_bytes"] = current
+    report["traced_peak_bytes"] = peak
+    report["top_allocations"] = [
+        {"site": str(stat.traceback[0]), "size_bytes": stat.size, "blocks": stat.count}
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    return report
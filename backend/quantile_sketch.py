@@ -0,0 +1,98 @@
+"""
+Mergeable streaming quantile sketch (KLL) for company-level normalization bounds.
+
+Values are added in batches to level 0. When a level outgrows its capacity it
+is sorted and every other item is promoted to the next level with twice the
+weight, so the sketch keeps O(k) items however many values it has seen.
+Sketches built over different slices of a universe (chunks, shards, workers)
+merge level by level into the sketch of the whole.
+
+Until the first compaction every value is kept with weight 1 and quantile()
+is exactly Series.quantile (linear interpolation); that covers universes of up
+to k values. Past that, the rank error is a small multiple of 1/k (under 3/k
+in the tests, whether values arrive at once, in batches or as merged
+sketches). Compaction offsets alternate instead of being drawn at random, so
+the same input always gives the same bounds, in every worker.
+"""
+import math
+
+import numpy as np
+
+DEFAULT_K = 400
+
+
+class QuantileSketch:
+    def __init__(self, k=DEFAULT_K, c=2 / 3):
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._offset = 0
+
+    @classmethod
+    def of(cls, values, k=DEFAULT_K):
+        sketch = cls(k=k)
+        sketch.update(values)
+        return sketch
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * self.c ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind at this level
+                odd = len(items) % 2
+                promoted = items[self._offset:len(items) - odd:2]
+                self._offset ^= 1
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = items[len(items) - odd:]
+            level += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return self
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Folds another sketch (e.g. from another shard) into this one."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def is_exact(self):
+        return len(self.levels) == 1
+
+    def quantiles(self, qs):
+        if not self.n:
+            raise ValueError("empty sketch")
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.is_exact():
+            # The percentiles pandas hands to numpy, so small universes match Series.quantile
+            return np.percentile(self.levels[0], qs * 100.0)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        weights = weights[order]
+        # Each item stands for `weight` consecutive ranks; interpolate between their centres
+        centres = np.cumsum(weights) - weights + (weights - 1) / 2
+        return np.interp(qs * (self.n - 1), centres, items)
+
+    def size(self):
+        return sum(len(items) for items in self.levels)
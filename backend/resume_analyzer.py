@@ -1,24 +1,27 @@
-import PyPDF2
-import re
 import json
 import os
+import numpy as np
 from industry_analysis import IndustryDashboard
 from company_analysis import CompanyAnalysis
+from job_catalogue import JobCatalogue
+from skill_index import spell_symbols
+from skill_taxonomy import ABBREVIATIONS, SkillTaxonomy
+import pdf_text
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.industry_dashboard = IndustryDashboard()
-        self.company_logic = CompanyAnalysis()
+    def __init__(self, dashboard=None, company_logic=None):
+        self.industry_dashboard = dashboard or IndustryDashboard()
+        self.company_logic = company_logic or CompanyAnalysis(dashboard=self.industry_dashboard)
         self.data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
         self.jobs_file = os.path.join(self.data_dir, 'jobs.json')
-        self.skill_normalization = {
-            "ml": "machine learning",
-            "ai": "artificial intelligence",
-            "js": "javascript",
-            "aws": "amazon web services",
-            "genai": "generative ai",
-            "nlp": "natural language processing"
-        }
+        self.skill_normalization = dict(ABBREVIATIONS)
+        self._catalogue = None
+        self._catalogue_mtime = None
+        self._taxonomy = None
+        self._taxonomy_key = None
+        # Resume extraction limits (a resume rarely needs more than a few pages)
+        self.max_pages = pdf_text.MAX_PAGES
+        self.max_text_chars = pdf_text.MAX_TEXT_CHARS
 
     def load_jobs(self):
         if os.path.exists(self.jobs_file):
@@ -26,25 +29,53 @@ class ResumeAnalyzer:
                 return json.load(f)
         return {}
 
+    def get_catalogue(self):
+        # Rebuilt only when jobs.json changes on disk
+        mtime = os.path.getmtime(self.jobs_file) if os.path.exists(self.jobs_file) else None
+        if self._catalogue is None or mtime != self._catalogue_mtime:
+            self._catalogue = JobCatalogue(self.load_jobs())
+            self._catalogue_mtime = mtime
+        return self._catalogue
+
+    def get_taxonomy(self):
+        # Rebuilt when jobs.json, the panel (a data reload) or the company profiles change
+        self.industry_dashboard.load_data()
+        skill_index = self.company_logic.skill_index
+        jobs_mtime = os.path.getmtime(self.jobs_file) if os.path.exists(self.jobs_file) else None
+        key = (jobs_mtime, self.industry_dashboard.data_version, id(skill_index), len(skill_index.display_names))
+        if self._taxonomy is None or key != self._taxonomy_key:
+            self._taxonomy = SkillTaxonomy.build(
+                self.load_jobs(),
+                self.industry_dashboard.data['Top_Skills'].dropna().unique(),
+                skill_index,
+                self.skill_normalization
+            )
+            self._taxonomy_key = key
+        return self._taxonomy
+
+    def industry_skill_names(self, industry, year):
+        """Lowercase in-demand and future skill names for an industry, as used in the ATS score."""
+        industry_skills_raw = self.industry_dashboard.get_student_skills(industry, year)
+
+        # Flatten skills
+        def extract_names(skill_list):
+            return [s['name'].lower() for s in skill_list if s and 'name' in s]
+
+        return extract_names(industry_skills_raw.get("in_demand", [])), extract_names(industry_skills_raw.get("future", []))
+
     def extract_text(self, pdf_path):
-        """Extracts and normalizes text from a PDF file."""
-        text = ""
+        """Extracts and normalizes text from a PDF file (bounded, see pdf_text)."""
         try:
-            with open(pdf_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                for page in reader.pages:
-                    content = page.extract_text()
-                    if content:
-                        text += content + " "
+            text = pdf_text.extract_pdf_text(
+                pdf_path, max_pages=self.max_pages, max_chars=self.max_text_chars
+            )
         except Exception as e:
             print(f"Error extracting PDF: {e}")
             return ""
         
-        # Normalize
-        text = text.lower()
-        # Remove non-alphanumeric characters but keep spaces
-        text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-        return text
+        # Normalize: "C++"/"C#" spelled out as skill names are, then lowercase and
+        # keep only letters, digits and whitespace
+        return pdf_text.normalize(spell_symbols(text))
 
     def analyze_resume(self, pdf_path, industry, company, job_title, year=2026):
         resume_text = self.extract_text(pdf_path)
@@ -62,28 +93,16 @@ class ResumeAnalyzer:
         core_skills = [s.lower() for s in selected_job['core_skills']]
         
         # Industry & Future Skills from IndustryDashboard
-        industry_info = self.industry_dashboard.run_student_analysis(industry, year)
-        industry_skills_raw = industry_info.get("Student_Insights", {}).get("Skills", {})
-        
-        # Flatten skills
-        def extract_names(skill_list):
-            return [s['name'].lower() for s in skill_list if s and 'name' in s]
+        industry_skills, future_skills = self.industry_skill_names(industry, year)
 
-        industry_skills = extract_names(industry_skills_raw.get("in_demand", []))
-        future_skills = extract_names(industry_skills_raw.get("future", []))
+        # 2. Matching Logic (aliases, plurals and near-miss spellings, see skill_taxonomy)
+        match = self.get_taxonomy().scan(resume_text)
 
-        # 2. Matching Logic
         def check_skills(skill_list):
             found = []
             missing = []
             for skill in skill_list:
-                # Basic normalization check
-                variants = [skill]
-                for k, v in self.skill_normalization.items():
-                    if skill == v: variants.append(k)
-                    if skill == k: variants.append(v)
-                
-                if any(re.search(r'\b' + re.escape(v) + r'\b', resume_text) for v in variants):
+                if match.has(skill):
                     found.append(skill.title())
                 else:
                     missing.append(skill.title())
@@ -103,9 +122,7 @@ class ResumeAnalyzer:
         final_score = min(100, max(0, final_score))
 
         # 4. Readiness Level
-        if final_score >= 80: readiness = "High"
-        elif final_score >= 50: readiness = "Moderate"
-        else: readiness = "Critical Review Needed"
+        readiness = self.readiness_level(final_score)
 
         # 5. Rule-based Recommendations
         recommendations = []
@@ -121,6 +138,10 @@ class ResumeAnalyzer:
         else:
             recommendations.append("Strengthening foundational skills will significantly improve your match rate.")
 
+        # 6. Companies in this industry that list skills found in the resume
+        resume_skills = match.found.intersection(self.company_logic.skill_index.vocabulary(industry))
+        matching_companies = self.company_logic.companies_for_skills(resume_skills, industry=industry)
+
         return {
             "ATS_Match_Score": final_score,
             "Readiness_Level": readiness,
@@ -128,5 +149,61 @@ class ResumeAnalyzer:
             "Missing_Critical_Skills": missing_core,
             "Missing_Industry_Skills": missing_ind,
             "Missing_Future_Skills": missing_fut,
-            "Recommendations": recommendations
+            "Recommendations": recommendations,
+            "Matching_Companies": matching_companies[:5]
         }
+
+    def readiness_level(self, score):
+        if score >= 80: return "High"
+        elif score >= 50: return "Moderate"
+        else: return "Critical Review Needed"
+
+    def best_matches(self, pdf_path, year=2026, top_k=10, catalogue=None):
+        """
+        Scores one resume against every job in the catalogue and returns the
+        top_k by ATS score. The resume's skills are matched once per distinct
+        skill; the per-job scores are then vector operations over the
+        catalogue's skill x job matrix, using the same weights as analyze_resume.
+        """
+        resume_text = self.extract_text(pdf_path)
+        if not resume_text:
+            return {"error": "Could not extract text from resume"}
+        return self.rank_jobs(resume_text, year, top_k, catalogue)
+
+    def rank_jobs(self, resume_text, year=2026, top_k=10, catalogue=None):
+        catalogue = catalogue if catalogue is not None else self.get_catalogue()
+        match = self.get_taxonomy().scan(resume_text)
+        core_found = np.array([match.has(s) for s in catalogue.terms], dtype=np.float64)
+
+        # Industry and future components depend only on the job's industry
+        industry_names = [self.industry_skill_names(ind, year) for ind in catalogue.industries]
+        extra_terms = sorted({s for names in industry_names for group in names for s in group})
+        extra_found = {s: match.has(s) for s in extra_terms}
+
+        def component(skills, weight):
+            if not skills:
+                return weight
+            return sum(extra_found[s] for s in skills) / len(skills) * weight
+
+        ind_scores = np.array([component(ind, 30) for ind, _ in industry_names], dtype=np.float64)
+        fut_scores = np.array([component(fut, 10) for _, fut in industry_names], dtype=np.float64)
+
+        # Same summation order as analyze_resume, so rounding agrees job for job
+        codes = catalogue.job_industry
+        scores = catalogue.core_scores(core_found) + ind_scores[codes] + fut_scores[codes]
+        scores = np.clip(np.round(scores), 0, 100)
+
+        matches = []
+        for j in catalogue.top_k(scores, top_k):
+            score = int(scores[j])
+            missing_core = [
+                s.title() for s in catalogue.core_skills[j] if not core_found[catalogue.term_ids[s]]
+            ]
+            matches.append({
+                "Industry": catalogue.industries[catalogue.job_industry[j]],
+                "Job_Title": catalogue.titles[j],
+                "ATS_Match_Score": score,
+                "Readiness_Level": self.readiness_level(score),
+                "Missing_Critical_Skills": missing_core
+            })
+        return {"Jobs_Scored": len(catalogue), "Best_Matches": matches}
@@ -0,0 +1,55 @@
+import json
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used as a fallback
+    orjson = None
+
+
+def _default(obj):
+    # NumPy scalars/arrays that leak out of the analysis engines
+    # (duck-typed so importing this module does not pull in NumPy)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content):
+    """Encodes analysis results straight to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(content, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    Returning an instance directly from an endpoint skips FastAPI's
+    jsonable_encoder walk over the (potentially large) result dict.
+    """
+
+    def render(self, content):
+        return dumps(content)
+
+
+def frame_records(df, columns, decimals=2):
+    """
+    Converts DataFrame columns to a list of row dicts in one vectorized pass.
+    columns maps output key -> source column; integer columns are kept as ints,
+    float columns are rounded with np.round instead of per-value round().
+    """
+    import numpy as np
+
+    out = {}
+    for key, col in columns.items():
+        values = df[col].to_numpy()
+        if np.issubdtype(values.dtype, np.integer):
+            out[key] = values.tolist()
+        else:
+            out[key] = np.round(values.astype(np.float64), decimals).tolist()
+    keys = list(out)
+    return [dict(zip(keys, row)) for row in zip(*out.values())]
@@ -0,0 +1,183 @@
+"""
+Multi-worker launcher for the API.
+
+The parent process imports the API and builds the scored panel and model
+coefficients once (services.warm_up), then forks N uvicorn workers that all
+accept on one shared listening socket. Workers inherit the warm state
+copy-on-write, so adding workers costs neither N x warm-up nor N x memory.
+
+Usage (from backend/):
+    python serve.py --workers 4 --port 8000
+
+Edited data files (see data_watcher.py) are picked up by the parent alone:
+it polls them between reaping workers, rebuilds the panel in its own memory
+and then replaces the workers one by one, so the new ones fork from the
+rebuilt panel and share it copy-on-write again. Workers never watch or
+rebuild on their own.
+
+On platforms without os.fork this falls back to a single uvicorn process.
+For gunicorn deployments see gunicorn.conf.py, which does the same preload.
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def bind_socket(host, port, backlog=2048):
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload(forking=True):
+    """Imports the app and builds all shared state in the parent process."""
+    import services
+    import api
+
+    if forking:
+        # The parent watches the data files; a worker rebuilding on its own would unshare the panel
+        services.disable_data_watcher()
+
+    start = time.perf_counter()
+    services.warm_up()
+    print(f"Shared state built in {(time.perf_counter() - start) * 1000:.0f} ms")
+    freeze_shared_state()
+    return api.app
+
+
+def freeze_shared_state():
+    # Move everything allocated so far into the permanent generation so the
+    # cyclic GC in the workers does not touch (and thereby copy) those pages
+    gc.collect()
+    gc.freeze()
+
+
+def parent_data_watcher():
+    """A DataWatcher polled from the parent's main loop (no thread), or None when disabled."""
+    import data_watcher
+    import services
+    if data_watcher.WATCH_INTERVAL <= 0:
+        return None
+    return data_watcher.DataWatcher(services.get_dashboard)
+
+
+def run_worker(app, sock, log_level):
+    # SQLAlchemy connections must not be shared across a fork
+    import database
+    database.engine.dispose(close=False)
+
+    config = uvicorn.Config(app, log_level=log_level)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API with N pre-forked workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--log-level", default="warning")
+    args = parser.parse_args()
+
+    if args.workers <= 1 or not hasattr(os, "fork"):
+        app = preload(forking=False)
+        uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
+        return
+
+    app = preload()
+    sock = bind_socket(args.host, args.port)
+    print(f"Serving on {args.host}:{args.port} with {args.workers} workers")
+
+    children = {}
+    retiring = set()            # workers replaced after a data reload
+    shutting_down = False
+    watcher = parent_data_watcher()
+    next_check = time.monotonic() + (watcher.interval if watcher else 0)
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                run_worker(app, sock, args.log_level)
+            finally:
+                os._exit(0)
+        children[pid] = time.monotonic()
+
+    def shutdown(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    for _ in range(args.workers):
+        spawn()
+
+    def roll_workers():
+        # New workers fork from the reloaded panel; the old ones finish their requests and exit
+        for pid in list(children):
+            spawn()
+            retiring.add(pid)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    while children:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        if pid == 0:
+            if watcher is not None and not shutting_down and time.monotonic() >= next_check:
+                next_check = time.monotonic() + watcher.interval
+                try:
+                    reloaded = watcher.check()
+                except Exception as e:
+                    print(f"Data watcher check failed: {e}", file=sys.stderr)
+                    reloaded = False
+                if reloaded:
+                    freeze_shared_state()
+                    roll_workers()
+            time.sleep(0.2)
+            continue
+        started = children.pop(pid, None)
+        if pid in retiring:
+            retiring.discard(pid)
+            continue
+        if started is None or shutting_down:
+            continue
+        # Replace workers that die unexpectedly, but not ones failing at boot
+        if time.monotonic() - started > 5:
+            print(f"Worker {pid} exited with status {status}, respawning")
+            spawn()
+        else:
+            print(f"Worker {pid} failed during startup (status {status})", file=sys.stderr)
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
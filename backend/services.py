@@ -0,0 +1,165 @@
+import importlib
+import os
+import sys
+import threading
+import time
+
+# Startup mode: "lazy" defers pandas/PyPDF2 and the analysis engines
+# until the first request that needs them, "eager" builds everything at boot.
+STARTUP_MODE = os.environ.get("WORKFORCE_STARTUP_MODE", "lazy").lower()
+
+_lock = threading.RLock()
+_dashboard = None
+_company_logic = None
+_resume_logic = None
+_data_watcher = None
+# Set in a pre-forking parent (serve.py, gunicorn.conf.py) so its workers do not watch on their own
+_data_watcher_disabled = False
+
+STARTUP_TIMINGS = {
+    "mode": STARTUP_MODE,
+    "imports": {},
+    "init": {},
+    "warm_up": {},
+}
+
+
+def _elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def record_timing(section, name, start):
+    STARTUP_TIMINGS[section][name] = _elapsed_ms(start)
+
+
+def timed_import(module_name):
+    """Imports a module, recording how long it took if it was not loaded yet."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    record_timing("imports", module_name, start)
+    return module
+
+
+def get_dashboard():
+    global _dashboard
+    if _dashboard is None:
+        with _lock:
+            if _dashboard is None:
+                timed_import("numpy")
+                timed_import("pandas")
+                industry_analysis = timed_import("industry_analysis")
+                start = time.perf_counter()
+                _dashboard = industry_analysis.IndustryDashboard()
+                record_timing("init", "IndustryDashboard", start)
+    return _dashboard
+
+
+def get_company_logic():
+    global _company_logic
+    if _company_logic is None:
+        with _lock:
+            if _company_logic is None:
+                dashboard = get_dashboard()
+                company_analysis = timed_import("company_analysis")
+                start = time.perf_counter()
+                _company_logic = company_analysis.CompanyAnalysis(dashboard=dashboard)
+                record_timing("init", "CompanyAnalysis", start)
+    return _company_logic
+
+
+def get_resume_logic():
+    global _resume_logic
+    if _resume_logic is None:
+        with _lock:
+            if _resume_logic is None:
+                dashboard = get_dashboard()
+                company_logic = get_company_logic()
+                resume_analyzer = timed_import("resume_analyzer")
+                start = time.perf_counter()
+                _resume_logic = resume_analyzer.ResumeAnalyzer(
+                    dashboard=dashboard, company_logic=company_logic
+                )
+                record_timing("init", "ResumeAnalyzer", start)
+    return _resume_logic
+
+
+def install(dashboard=None, company_logic=None, resume_logic=None):
+    """Replaces the shared engines, e.g. with ones built on a synthetic panel."""
+    global _dashboard, _company_logic, _resume_logic
+    with _lock:
+        _dashboard = dashboard
+        _company_logic = company_logic
+        _resume_logic = resume_logic
+
+
+def warm_up():
+    """
+    Builds every engine and the scored panel up front.
+    Used by eager startup so the first request does not pay for it.
+    """
+    start = time.perf_counter()
+    dashboard = get_dashboard()
+    get_company_logic()
+    get_resume_logic()
+
+    step = time.perf_counter()
+    timed_import("PyPDF2")
+    record_timing("warm_up", "deferred_imports", step)
+
+    step = time.perf_counter()
+    dashboard.load_data()
+    record_timing("warm_up", "load_data", step)
+
+    step = time.perf_counter()
+    dashboard._prepare_data()
+    record_timing("warm_up", "prepare_data", step)
+
+    record_timing("warm_up", "total", start)
+
+
+def disable_data_watcher():
+    """
+    Keeps start_data_watcher() from starting a watcher thread in this process
+    and the workers it forks. A worker rebuilding the panel on its own would
+    stop sharing it copy-on-write; pre-forking launchers watch in the parent.
+    """
+    global _data_watcher_disabled
+    _data_watcher_disabled = True
+
+
+def start_data_watcher():
+    """
+    Starts this process's background data refresher (see data_watcher.py);
+    a no-op when WORKFORCE_DATA_WATCH_INTERVAL is 0, it is disabled (see
+    disable_data_watcher) or it is already running.
+    """
+    global _data_watcher
+    with _lock:
+        if _data_watcher is None and not _data_watcher_disabled:
+            data_watcher = timed_import("data_watcher")
+            if data_watcher.WATCH_INTERVAL > 0:
+                _data_watcher = data_watcher.DataWatcher(lambda: _dashboard).start()
+    return _data_watcher
+
+
+def data_watcher_stats():
+    if _data_watcher is None:
+        return {"enabled": False}
+    return _data_watcher.stats()
+
+
+def startup_report():
+    return {
+        **STARTUP_TIMINGS,
+        "engines_loaded": {
+            "IndustryDashboard": _dashboard is not None,
+            "CompanyAnalysis": _company_logic is not None,
+            "ResumeAnalyzer": _resume_logic is not None,
+        },
+        "heavy_modules_loaded": {
+            name: name in sys.modules
+            for name in ("numpy", "pandas", "PyPDF2", "passlib")
+        },
+    }
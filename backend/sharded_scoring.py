@@ -0,0 +1,223 @@
+"""
+Sharded scoring engine behind IndustryDashboard.calculate_scores.
+
+Every score depends only on its own industry's rows (P5/P95 bounds, the
+10-90 clip, the demand trend and the dynamic baseline risk), so the panel is
+partitioned by Industry into contiguous, Year-ordered shards. A block of
+shards is scored by one vectorized kernel call (segment-wise percentiles and
+diffs, no per-industry Python loop). Small panels are scored in-process; large
+ones are split into blocks that a process pool scores in parallel, reading the
+input columns from and writing the scores into shared memory.
+
+Workers default to os.cpu_count() (WORKFORCE_SCORING_WORKERS). The pool is
+only used from PARALLEL_MIN_ROWS rows (WORKFORCE_PARALLEL_MIN_ROWS); below
+that, copying into shared memory and dispatching cost more than they save.
+Run the ShardedScoring benchmark on the target machine to find the crossover.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+SCORING_WORKERS = int(os.environ.get("WORKFORCE_SCORING_WORKERS", os.cpu_count() or 1))
+PARALLEL_MIN_ROWS = int(os.environ.get("WORKFORCE_PARALLEL_MIN_ROWS", 1_000_000))
+
+BASE_RISK = 5
+ATTRITION_FACTOR = 10
+TREND_FACTOR = 0.5
+ATTRITION_WEIGHT = 15
+
+INPUT_COLUMNS = ['Talent_Supply_Raw', 'Talent_Demand_Raw', 'Attrition_Rate']
+OUTPUT_COLUMNS = ['Talent_Supply_Score', 'Talent_Demand_Score', 'Demand_Trend', 'Risk_Score']
+BOUND_COLUMNS = ['supply_p5', 'supply_p95', 'demand_p5', 'demand_p95']
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _segment_percentiles(values, starts, lengths):
+    """P5 and P95 of every segment, exactly as Series.quantile computes them."""
+    p5 = np.empty(len(starts))
+    p95 = np.empty(len(starts))
+    qs = np.array([0.05, 0.95]) * 100.0  # the percentiles pandas hands to numpy
+    for length in np.unique(lengths):
+        segs = np.flatnonzero(lengths == length)
+        block = values[starts[segs, None] + np.arange(length)]
+        result = np.percentile(block, qs, axis=1)
+        p5[segs] = result[0]
+        p95[segs] = result[1]
+    return p5, p95
+
+
+def _normalize(values, p5, p95):
+    # Clip to P5-P95 to avoid extreme outliers, then normalize using the clipped range
+    value_range = np.where(p95 != p5, p95 - p5, 1.0)
+    clipped = np.minimum(np.maximum(values, p5), p95)
+    return ((clipped - p5) / value_range) * 100
+
+
+def score_block(supply_raw, demand_raw, attrition, starts, lengths):
+    """
+    Scores consecutive shards laid out back to back (each Year-ordered).
+    Returns the four score columns and the per-shard P5/P95 bounds.
+    """
+    seg = np.repeat(np.arange(len(starts)), lengths)
+
+    p5_supply, p95_supply = _segment_percentiles(supply_raw, starts, lengths)
+    p5_demand, p95_demand = _segment_percentiles(demand_raw, starts, lengths)
+
+    # Scores are clamped to 10-90 to avoid misleading absolutes and provide better separation
+    supply = np.clip(_normalize(supply_raw, p5_supply[seg], p95_supply[seg]), 10, 90)
+    demand = np.clip(_normalize(demand_raw, p5_demand[seg], p95_demand[seg]), 10, 90)
+
+    # Demand trend: change from the previous year of the same industry
+    trend = np.zeros(len(demand))
+    trend[1:] = demand[1:] - demand[:-1]
+    trend[starts] = 0.0
+
+    # Dynamic baseline = BASE + (Attrition x Factor) + (Demand_Trend x Factor), floored at BASE
+    baseline = np.maximum(BASE_RISK + (attrition * ATTRITION_FACTOR) + (trend * TREND_FACTOR), BASE_RISK)
+    # Core risk = (Demand - Supply) + (Attrition x Weight); final risk is the larger, clamped to 0-100
+    core_risk = (demand - supply) + (attrition * ATTRITION_WEIGHT)
+    risk = np.clip(np.maximum(core_risk, baseline), 0, 100)
+
+    scores = np.column_stack([supply, demand, trend, risk])
+    bounds = np.column_stack([p5_supply, p95_supply, p5_demand, p95_demand])
+    return scores, bounds
+
+
+def _score_shared(inputs_name, scores_name, bounds_name, n_rows, n_shards, shard_starts, shard_lengths, first_shard):
+    # Pool task: score one block of shards in place in the shared buffers
+    inputs_shm = shared_memory.SharedMemory(name=inputs_name)
+    scores_shm = shared_memory.SharedMemory(name=scores_name)
+    bounds_shm = shared_memory.SharedMemory(name=bounds_name)
+    try:
+        inputs = np.ndarray((len(INPUT_COLUMNS), n_rows), dtype=np.float64, buffer=inputs_shm.buf)
+        scores = np.ndarray((n_rows, len(OUTPUT_COLUMNS)), dtype=np.float64, buffer=scores_shm.buf)
+        bounds = np.ndarray((n_shards, len(BOUND_COLUMNS)), dtype=np.float64, buffer=bounds_shm.buf)
+
+        lo = shard_starts[0]
+        hi = shard_starts[-1] + shard_lengths[-1]
+        block_scores, block_bounds = score_block(
+            inputs[0, lo:hi], inputs[1, lo:hi], inputs[2, lo:hi], shard_starts - lo, shard_lengths
+        )
+        scores[lo:hi] = block_scores
+        bounds[first_shard:first_shard + len(shard_starts)] = block_bounds
+        del inputs, scores, bounds
+    finally:
+        inputs_shm.close()
+        scores_shm.close()
+        bounds_shm.close()
+
+
+def pool_context():
+    """
+    forkserver (spawn where it is missing) rather than fork: the pool is created
+    lazily inside a threaded server, and a forked child could inherit locks held
+    by other threads. Workers start from a clean server process instead.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # A preload also hands our sys.path to the server, so workers can import this module
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def _score_parallel(inputs, starts, lengths, workers):
+    n_rows = inputs.shape[1]
+    n_shards = len(starts)
+    buffers = [
+        shared_memory.SharedMemory(create=True, size=max(1, inputs.nbytes)),
+        shared_memory.SharedMemory(create=True, size=max(1, n_rows * len(OUTPUT_COLUMNS) * 8)),
+        shared_memory.SharedMemory(create=True, size=max(1, n_shards * len(BOUND_COLUMNS) * 8)),
+    ]
+    try:
+        np.ndarray(inputs.shape, dtype=np.float64, buffer=buffers[0].buf)[:] = inputs
+
+        # A few blocks per worker so uneven shards still balance
+        blocks = np.array_split(np.arange(n_shards), min(n_shards, workers * 4))
+        pool = get_pool(workers)
+        futures = [
+            pool.submit(_score_shared, buffers[0].name, buffers[1].name, buffers[2].name,
+                        n_rows, n_shards, starts[b], lengths[b], int(b[0]))
+            for b in blocks if len(b)
+        ]
+        for future in futures:
+            future.result()
+
+        scores = np.ndarray((n_rows, len(OUTPUT_COLUMNS)), dtype=np.float64, buffer=buffers[1].buf).copy()
+        bounds = np.ndarray((n_shards, len(BOUND_COLUMNS)), dtype=np.float64, buffer=buffers[2].buf).copy()
+        return scores, bounds
+    finally:
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
+
+
+def partition(df):
+    """
+    Row order that lays the panel out as Industry shards (groupby order),
+    each sorted by Year, plus the shard labels, starts and lengths.
+    """
+    codes, labels = pd.factorize(df['Industry'], sort=True)
+    order = np.lexsort((df['Year'].to_numpy(), codes))
+    lengths = np.bincount(codes, minlength=len(labels))
+    observed = lengths > 0
+    lengths = lengths[observed]
+    starts = (np.cumsum(lengths) - lengths).astype(np.int64)
+    return order, list(np.asarray(labels)[observed]), starts, lengths
+
+
+def score_panel(df, workers=None, min_parallel_rows=None):
+    """
+    Adds Talent_Supply_Score, Talent_Demand_Score, Demand_Trend and Risk_Score
+    to a panel that already has the raw metrics. Returns the scored frame
+    (rows grouped by Industry, Year-ordered, original index kept) and
+    {industry: {'supply': (p5, p95), 'demand': (p5, p95)}}.
+    """
+    workers = SCORING_WORKERS if workers is None else workers
+    min_parallel_rows = PARALLEL_MIN_ROWS if min_parallel_rows is None else min_parallel_rows
+
+    order, labels, starts, lengths = partition(df)
+    df = df.take(order)
+    inputs = np.vstack([df[col].to_numpy(dtype=np.float64) for col in INPUT_COLUMNS])
+
+    if workers > 1 and len(df) >= min_parallel_rows and len(labels) > 1:
+        scores, bounds = _score_parallel(inputs, starts, lengths, workers)
+    else:
+        scores, bounds = score_block(inputs[0], inputs[1], inputs[2], starts, lengths)
+
+    df = df.copy()
+    for i, col in enumerate(OUTPUT_COLUMNS):
+        df[col] = scores[:, i]
+
+    normalization_bounds = {
+        industry: {'supply': (b[0], b[1]), 'demand': (b[2], b[3])}
+        for industry, b in zip(labels, bounds.tolist())
+    }
+    return df, normalization_bounds
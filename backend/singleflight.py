@@ -0,0 +1,114 @@
+import functools
+import inspect
+import threading
+import weakref
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+    The first caller (leader) runs the function; callers arriving while it is
+    in flight block until it finishes and receive the same result (or error).
+    Results are shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            total = self.executed + self.coalesced
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "failed": self.failed,
+                "in_flight": len(self._calls),
+                "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+            }
+
+
+# One SingleFlight group per decorated method, keyed by qualified name
+FLIGHTS = {}
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def coalesced(method):
+    """
+    Decorator putting a method behind a SingleFlight keyed on (instance, arguments).
+    Arguments are bound to the signature with defaults applied, so f(a, b),
+    f(a, b=b) and f(a) with b as its default are the same call.
+    """
+    flight = FLIGHTS.setdefault(method.__qualname__, SingleFlight(method.__qualname__))
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]
+        # A weak reference compares by instance identity, and unlike id() cannot
+        # match a later object reusing the address
+        key = (weakref.ref(self), _freeze(arguments))
+        return flight.do(key, method, self, *args, **kwargs)
+
+    return wrapper
+
+
+def stats():
+    return {name: flight.stats() for name, flight in FLIGHTS.items()}
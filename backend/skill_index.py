@@ -0,0 +1,122 @@
+import csv
+import os
+import re
+from collections import Counter, defaultdict
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+PROFILES_FILE = os.path.join(DATA_DIR, 'company_profiles.csv')
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+# "C++" and "C#" would otherwise both collapse to "c", so their symbols are spelled out
+_SYMBOLS = re.compile(r'(?<=[a-z0-9])(\+\+|#)', re.IGNORECASE)
+_SYMBOL_WORDS = {'++': 'plusplus ', '#': 'sharp '}
+
+
+def spell_symbols(text):
+    """Spells out the symbols of language names: "C++" -> "Cplusplus", "C#" -> "Csharp"."""
+    if '+' not in text and '#' not in text:
+        return text
+    return _SYMBOLS.sub(lambda m: _SYMBOL_WORDS[m.group(1)], text)
+
+
+def normalize_skill(name):
+    """Lowercases and collapses punctuation/whitespace, matching resume text normalization."""
+    return _NON_ALNUM.sub(' ', spell_symbols(name).lower()).strip()
+
+
+def split_skills(value):
+    return [s.strip() for s in str(value).split(',') if s.strip()]
+
+
+class SkillIndex:
+    """
+    Inverted index from normalized skill to the companies that list it.
+
+    Built from company_profiles.csv (Core_Skills and Emerging_Skills). Every
+    skill has a global posting set and one per industry, so questions like
+    "which companies value these skills" are set unions/intersections over
+    the posting sets rather than scans over all companies.
+    """
+
+    def __init__(self):
+        self.companies = {}                                  # industry -> [company, ...]
+        self.company_industry = {}                           # company -> industry
+        self.company_skills = {}                             # company -> {"core": [...], "emerging": [...]}
+        self.postings = defaultdict(set)                     # skill -> {company}
+        self.industry_postings = defaultdict(lambda: defaultdict(set))  # industry -> skill -> {company}
+        self.display_names = {}                              # skill -> label as written in the data
+        self.max_words = 1
+
+    @classmethod
+    def from_csv(cls, path=PROFILES_FILE):
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                index.add_company(
+                    row['Company_Name'].strip(),
+                    row['Industry'].strip(),
+                    split_skills(row.get('Core_Skills', '')),
+                    split_skills(row.get('Emerging_Skills', ''))
+                )
+        return index
+
+    def add_company(self, company, industry, core_skills, emerging_skills=()):
+        if company not in self.company_industry:
+            self.companies.setdefault(industry, []).append(company)
+        self.company_industry[company] = industry
+        self.company_skills[company] = {"core": list(core_skills), "emerging": list(emerging_skills)}
+
+        for label in list(core_skills) + list(emerging_skills):
+            skill = normalize_skill(label)
+            if not skill:
+                continue
+            self.display_names.setdefault(skill, label)
+            self.postings[skill].add(company)
+            self.industry_postings[industry][skill].add(company)
+            self.max_words = max(self.max_words, skill.count(' ') + 1)
+
+    def vocabulary(self, industry=None):
+        if industry is None:
+            return self.postings.keys()
+        return self.industry_postings.get(industry, {}).keys()
+
+    def skills_in_text(self, text, industry=None):
+        """
+        Finds indexed skills in already-normalized text (lowercase, alphanumeric
+        tokens) by intersecting the text's word n-grams with the vocabulary.
+        """
+        tokens = text.split()
+        grams = set()
+        for n in range(1, self.max_words + 1):
+            grams.update(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return grams.intersection(self.vocabulary(industry))
+
+    def companies_for_skills(self, skills, industry=None, match="any"):
+        """
+        Companies valuing the given skills.
+        match="all" returns companies listing every skill (posting-set intersection);
+        match="any" ranks companies by how many of the skills they list.
+        """
+        postings = self.postings if industry is None else self.industry_postings.get(industry, {})
+        normalized = {normalize_skill(s) for s in skills}
+        lists = [postings.get(s, set()) for s in normalized]
+
+        if match == "all":
+            if not lists:
+                return []
+            hits = set.intersection(*sorted(lists, key=len))
+            return [
+                {"Company": c, "Matched_Skills": sorted(self.display_names[s] for s in normalized)}
+                for c in sorted(hits)
+            ]
+
+        counts = Counter()
+        matched = defaultdict(list)
+        for skill, companies in zip(normalized, lists):
+            for company in companies:
+                counts[company] += 1
+                matched[company].append(self.display_names[skill])
+        ranked = sorted(counts, key=lambda c: (-counts[c], c))
+        return [{"Company": c, "Matched_Skills": sorted(matched[c])} for c in ranked]
@@ -0,0 +1,206 @@
+"""
+Skill taxonomy for resume matching: canonical skills, their aliases and a
+character n-gram index for fuzzy matches.
+
+Canonical skills are the normalized names (see skill_index.normalize_skill)
+of every skill in jobs.json, internship_data.csv's Top_Skills and
+company_profiles.csv. Each one is reachable through its surface forms:
+
+- the normalized name ("node.js" -> "node js") and its joined-up form ("nodejs");
+  "C++" and "C#" are spelled out ("cplusplus", "csharp") on both sides, so they
+  neither collapse to "c" nor match each other
+- singular/plural of the last word ("data structure" / "data structures")
+- abbreviations in both directions ("k8s" / "kubernetes", see ABBREVIATIONS)
+- for "AI/ML"-style compounds, each part of two or more characters and its
+  abbreviations (a lone "c" of "C/C++" would match "Objective-C" or "Grade C")
+
+Resume text (already normalized) is scanned once: its distinct word n-grams
+are looked up among the surface forms, and one- and two-word grams without an
+exact hit are matched fuzzily through a trigram index over the joined-up
+surface forms. A fuzzy match must have the gram's number of words and a
+length within FUZZY_MAX_LENGTH_DIFF characters, so one word never matches a
+longer skill that merely ends with it ("manufacturing" is not "Lean
+Manufacturing", nor "informatics" "Bioinformatics"). Only surfaces sharing a
+trigram with the gram are looked at, and results are cached per gram, so a
+long resume costs about its number of distinct words, not words x skills.
+"""
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+from skill_index import normalize_skill, split_skills
+
+# Abbreviation -> what it stands for; both directions are aliases
+ABBREVIATIONS = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "js": "javascript",
+    "aws": "amazon web services",
+    "genai": "generative ai",
+    "nlp": "natural language processing",
+    "k8s": "kubernetes",
+    "gcp": "google cloud platform",
+    "ts": "typescript",
+    "cpp": "cplusplus",
+}
+NGRAM = 3
+# Fuzzy matching only for grams of at least this many characters (joined up)...
+FUZZY_MIN_CHARS = 6
+# ...whose trigram Dice similarity to a surface form is at least this
+FUZZY_THRESHOLD = 0.8
+# ...of the same number of words and about the same length (a typo or plural apart)
+FUZZY_MAX_LENGTH_DIFF = 2
+FUZZY_MAX_WORDS = 2
+_COMPOUND = re.compile(r'[/&]')
+
+
+def _joined(form):
+    return form.replace(' ', '')
+
+
+def char_ngrams(text, n=NGRAM):
+    padded = f"^{text}$"
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def _inflections(form):
+    words = form.split()
+    last = words[-1]
+    if len(last) < 4 or not last.isalpha():
+        return []
+    if last.endswith('s') and not last.endswith(('ss', 'is', 'us')):
+        return [' '.join(words[:-1] + [last[:-1]])]
+    if not last.endswith('s'):
+        return [' '.join(words[:-1] + [last + 's'])]
+    return []
+
+
+class SkillMatch:
+    """Skills found in one resume; has() answers for any skill name."""
+
+    def __init__(self, taxonomy, grams, found):
+        self.taxonomy = taxonomy
+        self.grams = grams
+        self.found = found              # canonical keys
+
+    def has(self, skill):
+        key = normalize_skill(skill)
+        if key in self.taxonomy.labels:
+            return key in self.found
+        # Skills outside the taxonomy: exact surface forms only
+        return not self.grams.isdisjoint(self.taxonomy.surface_forms(skill))
+
+
+class SkillTaxonomy:
+    def __init__(self, abbreviations=ABBREVIATIONS):
+        self.abbreviations = dict(abbreviations)
+        self.expansions = defaultdict(set)
+        for short, long in self.abbreviations.items():
+            self.expansions[short].add(long)
+            self.expansions[long].add(short)
+        self.labels = {}                        # canonical key -> label as first seen
+        self.surfaces = defaultdict(set)        # surface form -> {canonical key}
+        self.joined = defaultdict(set)          # joined-up surface form -> {canonical key}
+        self.postings = defaultdict(list)       # trigram -> [joined-up surface form]
+        self.trigram_counts = {}                # joined-up surface form -> number of trigrams
+        self.word_counts = defaultdict(set)     # joined-up surface form -> word counts it was written with
+        self.max_words = 1
+        self._forms_cache = {}
+        self._fuzzy = lru_cache(maxsize=65536)(self._fuzzy_lookup)
+
+    @classmethod
+    def build(cls, jobs_data=None, top_skills=(), skill_index=None, abbreviations=ABBREVIATIONS):
+        """From jobs.json data, Top_Skills values ("A, B, C") and a SkillIndex of company profiles."""
+        taxonomy = cls(abbreviations)
+        for jobs in (jobs_data or {}).values():
+            for job in jobs:
+                for skill in job.get('core_skills', []):
+                    taxonomy.add(skill)
+        for value in top_skills:
+            for skill in split_skills(value):
+                taxonomy.add(skill)
+        if skill_index is not None:
+            for label in skill_index.display_names.values():
+                taxonomy.add(label)
+        return taxonomy
+
+    def surface_forms(self, label):
+        forms = self._forms_cache.get(label)
+        if forms is not None:
+            return forms
+        key = normalize_skill(label)
+        bases = [key]
+        if _COMPOUND.search(label):
+            bases += [part for part in map(normalize_skill, _COMPOUND.split(label)) if len(part) > 1]
+        forms = set()
+        for base in filter(None, bases):
+            for form in [base] + sorted(self.expansions.get(base, ())):
+                forms.add(form)
+                forms.add(_joined(form))
+                forms.update(_inflections(form))
+        forms.discard('')
+        forms = self._forms_cache[label] = frozenset(forms)
+        return forms
+
+    def add(self, label):
+        key = normalize_skill(label)
+        if not key or key in self.labels:
+            return key
+        self.labels[key] = label
+        forms = self.surface_forms(label)
+        # "leanmanufacturing" stands for the two words it joins, not for a one-word skill
+        spaced = {_joined(form) for form in forms if ' ' in form}
+        for form in forms:
+            self.surfaces[form].add(key)
+            self.max_words = max(self.max_words, form.count(' ') + 1)
+            joined = _joined(form)
+            if ' ' in form or form not in spaced:
+                self.word_counts[joined].add(form.count(' ') + 1)
+            if joined not in self.joined:
+                grams = char_ngrams(joined)
+                self.trigram_counts[joined] = len(grams)
+                for gram in grams:
+                    self.postings[gram].append(joined)
+            self.joined[joined].add(key)
+        self._fuzzy.cache_clear()
+        return key
+
+    def _fuzzy_lookup(self, joined, words):
+        grams = char_ngrams(joined)
+        n = len(grams)
+        # Dice >= t needs the other side's trigram count within these bounds,
+        # tightened to the length difference allowed (one trigram per character)
+        low = max(n * FUZZY_THRESHOLD / (2 - FUZZY_THRESHOLD), n - FUZZY_MAX_LENGTH_DIFF)
+        high = min(n * (2 - FUZZY_THRESHOLD) / FUZZY_THRESHOLD, n + FUZZY_MAX_LENGTH_DIFF)
+        shared = defaultdict(int)
+        for gram in grams:
+            for form in self.postings.get(gram, ()):
+                shared[form] += 1
+        found = set()
+        for form, common in shared.items():
+            m = self.trigram_counts[form]
+            if (low <= m <= high and words in self.word_counts[form]
+                    and 2 * common / (n + m) >= FUZZY_THRESHOLD):
+                found |= self.joined[form]
+        return frozenset(found)
+
+    def scan(self, text):
+        """Canonical skills in normalized text (lowercase alphanumeric tokens), as a SkillMatch."""
+        tokens = text.split()
+        grams = set()
+        for n in range(1, self.max_words + 1):
+            grams.update(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+        found = set()
+        for gram in grams:
+            keys = self.surfaces.get(gram)
+            if keys:
+                found |= keys
+                continue
+            joined = _joined(gram)
+            keys = self.joined.get(joined)
+            if keys:
+                found |= keys
+            elif len(joined) >= FUZZY_MIN_CHARS and gram.count(' ') < FUZZY_MAX_WORDS:
+                found |= self._fuzzy(joined, gram.count(' ') + 1)
+        return SkillMatch(self, grams, found)
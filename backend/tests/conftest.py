@@ -0,0 +1,43 @@
+# Run from backend/:  python -m pytest tests
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+import pytest
+
+
+@pytest.fixture
+def panel_dir(tmp_path):
+    """A small synthetic data/ directory (the three panel CSVs)."""
+    from benchmarks import synthetic
+    return synthetic.write_panel(str(tmp_path / "data"), industries=8)
+
+
+class _User:
+    email = "test@example.com"
+
+    def __init__(self, role):
+        self.role = role
+
+
+@pytest.fixture
+def api_client():
+    """
+    In-process client for the API, authenticated as a STUDENT_USER (set client.user.role to switch).
+    Startup hooks are not run (no data watcher thread).
+    """
+    import api
+    import auth
+    import services
+    from starlette.testclient import TestClient
+
+    user = _User("STUDENT_USER")
+    api.app.dependency_overrides[auth.get_current_user] = lambda: user
+    client = TestClient(api.app)
+    client.user = user
+    yield client
+    api.app.dependency_overrides.pop(auth.get_current_user, None)
+    services.install()
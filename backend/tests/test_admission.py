@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+import admission
+
+
+def test_full_queue_is_a_429_with_retry_after():
+    async def scenario():
+        cost_class = admission.CostClass("upload", 1, 1, 1.0)
+        await cost_class.acquire(0)
+        waiter = asyncio.ensure_future(cost_class.acquire(0))
+        await asyncio.sleep(0)
+        with pytest.raises(admission.Shed) as shed:
+            await cost_class.acquire(0)
+        cost_class.release(0.5)
+        await waiter
+        return cost_class, shed.value
+
+    cost_class, shed = asyncio.run(scenario())
+    assert shed.status_code == 429
+    assert shed.retry_after >= 1
+    assert cost_class.rejected_queue_full == 1
+    assert cost_class.admitted == 2
+
+
+def test_wait_over_budget_is_a_503_with_retry_after():
+    async def scenario():
+        cost_class = admission.CostClass("analysis", 1, 4, 0.05)
+        await cost_class.acquire(0)
+        with pytest.raises(admission.Shed) as shed:
+            await cost_class.acquire(0)
+        return cost_class, shed.value
+
+    cost_class, shed = asyncio.run(scenario())
+    assert shed.status_code == 503
+    assert shed.retry_after >= 1
+    assert cost_class.shed_wait_budget == 1
+    assert cost_class.queued() == 0
+
+
+def test_lower_priority_number_is_served_first():
+    async def scenario():
+        cost_class = admission.CostClass("analysis", 1, 4, 1.0)
+        order = []
+        await cost_class.acquire(0)
+
+        async def request(priority):
+            await cost_class.acquire(priority)
+            order.append(priority)
+            cost_class.release()
+
+        waiters = [asyncio.ensure_future(request(p)) for p in (2, 1, 0)]
+        await asyncio.sleep(0)
+        cost_class.release()
+        await asyncio.gather(*waiters)
+        return order
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+
+
+def test_middleware_sheds_with_retry_after_header(monkeypatch):
+    async def slow(request):
+        await asyncio.sleep(0.3)
+        return PlainTextResponse("done")
+
+    app = admission.AdmissionMiddleware(
+        Starlette(routes=[Route("/slow", slow)]), routes=[("GET", r"/slow", "upload", 0)]
+    )
+    monkeypatch.setitem(admission.CLASSES, "upload", admission.CostClass("upload", 1, 1, 0.1))
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await asyncio.gather(*(client.get("/slow") for _ in range(3)))
+
+    responses = asyncio.run(scenario())
+    codes = sorted(r.status_code for r in responses)
+    assert codes == [200, 429, 503]
+    for response in responses:
+        if response.status_code != 200:
+            assert int(response.headers["Retry-After"]) >= 1
+
+
+class SlowResumeLogic:
+    """Resume engine stand-in whose scoring blocks like PDF parsing does."""
+
+    def best_matches(self, file_path, year, top_k):
+        time.sleep(0.4)
+        return {"Best_Matches": []}
+
+
+def test_cheap_routes_stay_fast_while_uploads_are_queued(api_client, monkeypatch):
+    import api
+    import services
+
+    services.get_dashboard().load_data()
+    services.install(dashboard=services.get_dashboard(), resume_logic=SlowResumeLogic())
+    monkeypatch.setitem(admission.CLASSES, "upload", admission.CostClass("upload", 2, 8, 5.0))
+
+    async def upload(client):
+        return await client.post("/resume/best-matches", files={"file": ("r.pdf", b"%PDF", "application/pdf")})
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            uploads = [asyncio.ensure_future(upload(client)) for _ in range(6)]
+            await asyncio.sleep(0.05)
+            latencies = []
+            for _ in range(5):
+                start = time.perf_counter()
+                response = await client.get("/industries")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+            return latencies, await asyncio.gather(*uploads)
+
+    latencies, uploads = asyncio.run(scenario())
+    assert all(r.status_code == 200 for r in uploads)
+    # Uploads hold the loop for 0.4 s each if they block it; cheap calls must not wait on them
+    assert max(latencies) < 0.2
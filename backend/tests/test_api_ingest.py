@@ -0,0 +1,39 @@
+import pytest
+
+import profiling
+import services
+from industry_analysis import IndustryDashboard
+
+TOKEN = "secret-token"
+ROWS = {"attrition": [{"Industry": "IT", "Year": 2024, "Attrition_Rate": 0.31}]}
+
+
+@pytest.fixture
+def industry_client(api_client, panel_dir, monkeypatch):
+    api_client.user.role = "INDUSTRY_USER"
+    services.install(dashboard=IndustryDashboard(data_dir=panel_dir))
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+    return api_client
+
+
+def test_ingest_needs_the_admin_token(industry_client):
+    before = services.get_dashboard().snapshot()
+    assert industry_client.post("/data/ingest", json=ROWS).status_code == 403
+    assert industry_client.post("/data/ingest", json=ROWS, headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert services.get_dashboard().snapshot() is before
+
+
+def test_ingest_is_off_without_a_configured_token(industry_client, monkeypatch):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", None)
+    assert industry_client.post("/data/ingest", json=ROWS, headers={"X-Admin-Token": TOKEN}).status_code == 404
+
+
+def test_ingest_with_the_admin_token(industry_client):
+    response = industry_client.post("/data/ingest", json=ROWS, headers={"X-Admin-Token": TOKEN})
+    assert response.status_code == 200
+    assert response.json() == {"industries": ["IT"], "rows": 1}
+
+
+def test_ingest_still_needs_an_industry_account(industry_client):
+    industry_client.user.role = "STUDENT_USER"
+    assert industry_client.post("/data/ingest", json=ROWS, headers={"X-Admin-Token": TOKEN}).status_code == 403
@@ -0,0 +1,69 @@
+import os
+import tempfile
+
+import pytest
+
+from benchmarks import synthetic
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    # Uploads are written under the temp directory; point it somewhere we can inspect
+    directory = tmp_path / "tmp"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    return directory
+
+
+@pytest.fixture
+def resume_pdf(tmp_path):
+    return synthetic.write_resume_pdf(str(tmp_path / "resume.pdf"), pages=1)
+
+
+def post_resume(client, path, content=None, filename="resume.pdf"):
+    content = content if content is not None else open(path, "rb").read()
+    return client.post("/resume/best-matches", files={"file": (filename, content, "application/pdf")},
+                       data={"year": "2026", "top_k": "3"})
+
+
+def test_best_matches_scores_an_upload_and_cleans_up(api_client, upload_dir, resume_pdf):
+    response = post_resume(api_client, resume_pdf)
+    assert response.status_code == 200, response.text
+    assert len(response.json()["Best_Matches"]) == 3
+    assert os.listdir(upload_dir) == []
+
+
+def test_unreadable_upload_is_a_400_and_cleans_up(api_client, upload_dir, resume_pdf):
+    response = post_resume(api_client, resume_pdf, content=b"not a pdf")
+    assert response.status_code == 400
+    assert os.listdir(upload_dir) == []
+
+
+def test_engine_error_is_a_500_and_cleans_up(api_client, upload_dir, resume_pdf, monkeypatch):
+    import services
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(services.get_resume_logic(), "best_matches", fail)
+    response = post_resume(api_client, resume_pdf)
+    assert response.status_code == 500
+    assert os.listdir(upload_dir) == []
+
+
+def test_client_filename_is_not_used_as_a_path(api_client, upload_dir, resume_pdf, monkeypatch):
+    import services
+    seen = []
+    logic = services.get_resume_logic()
+    original = logic.best_matches
+
+    def record(file_path, *args, **kwargs):
+        seen.append(file_path)
+        return original(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(logic, "best_matches", record)
+    for _ in range(2):
+        assert post_resume(api_client, resume_pdf, filename="../../escape.pdf").status_code == 200
+    assert len(set(seen)) == 2
+    assert all(os.path.dirname(path) == str(upload_dir) for path in seen)
+    assert not any("escape" in path for path in seen)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from benchmarks import synthetic
+from company_analysis import CompanyAnalysis
+from industry_analysis import IndustryDashboard
+
+
+@pytest.fixture
+def company_logic(panel_dir):
+    logic = CompanyAnalysis(dashboard=IndustryDashboard(data_dir=panel_dir))
+    logic.companies = synthetic.company_universe(companies=250)
+    return logic
+
+
+def all_pages(logic, limit, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = logic.rank_companies("IT", 2026, limit=limit, cursor=cursor, **kwargs)
+        pages.append([c["Company"] for c in page["Companies"]])
+        cursor = page["Next_Cursor"]
+        if cursor is None:
+            return pages, page["Total"]
+
+
+def full_order(logic, sort_by, order, risk_level=None):
+    # Reference ranking: the whole filtered frame sorted by (value, name)
+    frame = logic.company_frame("IT", 2026)
+    values = np.asarray(frame[{"risk": "Risk_Score", "hpi": "HPI"}[sort_by]], dtype=np.float64)
+    sign = -1.0 if order == "desc" else 1.0
+    rows = [i for i in range(len(frame["Company"]))
+            if risk_level is None or frame["Risk_Level"][i] == risk_level]
+    return [frame["Company"][i] for i in sorted(rows, key=lambda i: (sign * values[i], frame["Company"][i]))]
+
+
+@pytest.mark.parametrize("sort_by,order,limit", [("risk", "desc", 20), ("hpi", "asc", 7), ("risk", "asc", 100)])
+def test_pages_cover_the_ranking_without_gaps_or_duplicates(company_logic, sort_by, order, limit):
+    pages, total = all_pages(company_logic, limit, sort_by=sort_by, order=order)
+    ranked = [name for page in pages for name in page]
+    assert all(len(page) == limit for page in pages[:-1])
+    assert total == len(ranked) == len(set(ranked)) == 250
+    assert ranked == full_order(company_logic, sort_by, order)
+
+
+def test_filtered_pages_match_the_filtered_ranking(company_logic):
+    levels = {}
+    for level in ("Low Risk", "Medium Risk", "High Risk"):
+        pages, total = all_pages(company_logic, 9, sort_by="hpi", order="desc", risk_level=level)
+        ranked = [name for page in pages for name in page]
+        assert total == len(ranked) == len(set(ranked))
+        assert ranked == full_order(company_logic, "hpi", "desc", risk_level=level)
+        levels[level] = set(ranked)
+    assert sum(len(names) for names in levels.values()) == 250
+
+
+def test_ties_are_broken_by_name_across_pages(company_logic, monkeypatch):
+    # Coarse scores so that many companies share a value and pages split ties
+    original = company_logic.company_frame
+
+    def coarse_frame(*args, **kwargs):
+        frame = original(*args, **kwargs)
+        frame["Risk_Score"] = np.round(np.asarray(frame["Risk_Score"]) / 25) * 25
+        return frame
+
+    monkeypatch.setattr(company_logic, "company_frame", coarse_frame)
+    pages, total = all_pages(company_logic, 6, sort_by="risk", order="desc")
+    ranked = [name for page in pages for name in page]
+    assert total == len(ranked) == len(set(ranked)) == 250
+    assert ranked == full_order(company_logic, "risk", "desc")
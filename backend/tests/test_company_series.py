@@ -0,0 +1,32 @@
+import pytest
+
+from benchmarks import synthetic
+from company_analysis import CompanyAnalysis
+from industry_analysis import IndustryDashboard
+
+FIELDS = ["Supply_Score", "Demand_Score", "Risk_Score", "Risk_Level", "Hiring_Surge"]
+
+
+@pytest.fixture
+def company_logic(panel_dir):
+    logic = CompanyAnalysis(dashboard=IndustryDashboard(data_dir=panel_dir))
+    logic.companies = synthetic.company_universe(industries=8, companies=40)
+    return logic
+
+
+@pytest.mark.parametrize("industry", ["IT", "Finance", "Industry_0007"])
+def test_series_matches_compare_companies_per_year(company_logic, industry):
+    selected = company_logic.companies[industry][::5]
+    series = company_logic.company_series(industry, selected, 2022, 2029)
+    assert series["Years"] == list(range(2022, 2030))
+    for j, year in enumerate(series["Years"]):
+        expected = {c["Company"]: c["Metrics"] for c in company_logic.compare_companies(industry, selected, year)}
+        for company in series["Companies"]:
+            assert {field: company[field][j] for field in FIELDS} == {
+                field: expected[company["Company"]][field] for field in FIELDS
+            }
+
+
+def test_series_leaves_out_years_without_data(company_logic):
+    series = company_logic.company_series("IT", company_logic.companies["IT"][:2], 2030, 2035)
+    assert "error" in series
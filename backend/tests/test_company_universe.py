@@ -0,0 +1,20 @@
+import csv
+
+from company_analysis import CompanyAnalysis
+from industry_analysis import IndustryDashboard
+from skill_index import PROFILES_FILE
+
+
+def test_profiled_industries_come_from_the_csv(panel_dir):
+    logic = CompanyAnalysis(dashboard=IndustryDashboard(data_dir=panel_dir))
+    with open(PROFILES_FILE, newline='') as f:
+        rows = list(csv.DictReader(f))
+    for industry in {row['Industry'] for row in rows}:
+        assert logic.companies[industry] == [row['Company_Name'] for row in rows if row['Industry'] == industry]
+
+
+def test_fallback_universe_without_the_csv(panel_dir, tmp_path):
+    logic = CompanyAnalysis(dashboard=IndustryDashboard(data_dir=panel_dir),
+                            profiles_path=str(tmp_path / "missing.csv"))
+    assert logic.companies["IT"][:2] == ["MetaSystems", "CyberCloud"]
+    assert len(logic.compare_companies("IT", logic.companies["IT"][:3], 2026)) == 3
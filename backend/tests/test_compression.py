@@ -0,0 +1,65 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+import compression
+
+BIG = {"rows": [{"Industry": "IT", "Risk_Score": i} for i in range(200)]}
+
+
+@pytest.fixture
+def client():
+    def big(request):
+        return JSONResponse(BIG)
+
+    def small(request):
+        return JSONResponse({"ok": True})
+
+    def varied(request):
+        return JSONResponse(BIG, headers={"Vary": "Origin"})
+
+    def image(request):
+        return Response(b"\0" * 4096, media_type="image/png")
+
+    app = Starlette(routes=[Route("/big", big), Route("/small", small), Route("/varied", varied),
+                            Route("/image", image)])
+    return TestClient(compression.CompressionMiddleware(app))
+
+
+def get(client, path, accept_encoding):
+    # Overrides the Accept-Encoding TestClient sends by default; "" accepts no encoding
+    headers = {"Accept-Encoding": accept_encoding}
+    return client.get(path, headers=headers)
+
+
+def test_compresses_json_for_gzip_clients(client):
+    response = get(client, "/big", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == BIG
+
+
+@pytest.mark.parametrize("path,accept_encoding", [("/big", ""), ("/big", "identity"), ("/small", "gzip")])
+def test_uncompressed_json_still_varies_on_accept_encoding(client, path, accept_encoding):
+    response = get(client, path, accept_encoding)
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_existing_vary_is_extended_once(client):
+    assert get(client, "/varied", "gzip").headers["vary"] == "Origin, Accept-Encoding"
+    assert get(client, "/varied", "").headers["vary"] == "Origin, Accept-Encoding"
+
+
+def test_non_compressible_types_pass_through(client):
+    response = get(client, "/image", "gzip")
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_brotli_is_optional(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert compression.negotiate("br, gzip;q=0.5") == "gzip"
+    assert compression.negotiate("br") is None
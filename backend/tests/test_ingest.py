@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from industry_analysis import IndustryDashboard
+
+SCORE_COLUMNS = [
+    'Interns_Intake', 'Conversion_Rate', 'Growth_Rate', 'Attrition_Rate',
+    'Talent_Supply_Score', 'Talent_Demand_Score', 'Demand_Trend', 'Risk_Score',
+]
+LABEL_COLUMNS = ['Risk_Level', 'Hiring_Surge', 'AI_Explanation', 'Hiring_Outlook', 'Competition_Level']
+
+# An update to an existing row and a new year for one industry, in the CSV layouts
+ATTRITION = [{"Industry": "IT", "Year": 2024, "Attrition_Rate": 0.31},
+             {"Industry": "IT", "Year": 2027, "Attrition_Rate": 0.12}]
+GROWTH = [{"Industry": "IT", "Year": 2027, "Growth_Rate": 0.21}]
+INTERNSHIP = [{"Industry": "IT", "Year": 2027, "Interns_Intake": 1500, "Conversion_Rate": 0.61,
+               "Top_Skills": "Python, SQL, Cloud"}]
+
+
+def write_changes(data_dir):
+    # The same changes applied to the CSVs, for a full rebuild
+    for filename, rows in (("attrition_data.csv", ATTRITION), ("industry_growth.csv", GROWTH),
+                           ("internship_data.csv", INTERNSHIP)):
+        path = f"{data_dir}/{filename}"
+        df = pd.read_csv(path).set_index(['Industry', 'Year'])
+        for row in rows:
+            key = (row["Industry"], row["Year"])
+            for column, value in row.items():
+                if column not in ("Industry", "Year"):
+                    df.loc[key, column] = value
+        df.reset_index().to_csv(path, index=False)
+
+
+def scored(dashboard):
+    panel = dashboard._prepare_data()
+    panel = panel.astype({'Industry': str}).sort_values(['Industry', 'Year']).reset_index(drop=True)
+    return panel
+
+
+def assert_same_rows(actual, expected):
+    assert actual[['Industry', 'Year']].values.tolist() == expected[['Industry', 'Year']].values.tolist()
+    np.testing.assert_allclose(actual[SCORE_COLUMNS].to_numpy(float), expected[SCORE_COLUMNS].to_numpy(float),
+                               rtol=1e-9, atol=1e-9)
+    assert actual[LABEL_COLUMNS].values.tolist() == expected[LABEL_COLUMNS].values.tolist()
+
+
+@pytest.fixture
+def dashboards(panel_dir, tmp_path):
+    incremental = IndustryDashboard(data_dir=panel_dir)
+    incremental._prepare_data()
+    rebuilt_dir = tmp_path / "rebuilt"
+    rebuilt_dir.mkdir()
+    for name in ("attrition_data.csv", "industry_growth.csv", "internship_data.csv"):
+        (rebuilt_dir / name).write_bytes((tmp_path / "data" / name).read_bytes())
+    write_changes(str(rebuilt_dir))
+    return incremental, IndustryDashboard(data_dir=str(rebuilt_dir))
+
+
+def test_ingest_rescore_all_matches_full_rebuild(dashboards):
+    incremental, rebuilt = dashboards
+    result = incremental.ingest(attrition=ATTRITION, growth=GROWTH, internship=INTERNSHIP, rescore_all=True)
+    assert result["rows"] == 2
+    assert_same_rows(scored(incremental), scored(rebuilt))
+    assert incremental.normalization_bounds.keys() == rebuilt.normalization_bounds.keys()
+    for industry, bounds in rebuilt.normalization_bounds.items():
+        for name, values in bounds.items():
+            assert incremental.normalization_bounds[industry][name] == pytest.approx(values)
+
+
+def test_ingest_rescores_only_the_affected_industry(dashboards):
+    incremental, rebuilt = dashboards
+    before = scored(incremental)
+    result = incremental.ingest(attrition=ATTRITION, growth=GROWTH, internship=INTERNSHIP)
+    assert result["industries"] == ["IT"]
+
+    after, expected = scored(incremental), scored(rebuilt)
+    # The changed industry is exactly what a full rebuild gives
+    assert_same_rows(after[after['Industry'] == 'IT'].reset_index(drop=True),
+                     expected[expected['Industry'] == 'IT'].reset_index(drop=True))
+    # Every other industry keeps its rows as they were: forecasts made with the
+    # previous slope, and scores normalized over them (see ingest's docstring)
+    others = before[before['Industry'] != 'IT'].reset_index(drop=True)
+    assert_same_rows(after[after['Industry'] != 'IT'].reset_index(drop=True), others)
+
+
+def test_ingest_rejects_incomplete_new_rows(dashboards):
+    incremental, _ = dashboards
+    with pytest.raises(ValueError):
+        incremental.ingest(attrition=[{"Industry": "IT", "Year": 2030, "Attrition_Rate": 0.1}])
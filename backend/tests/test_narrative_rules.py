@@ -0,0 +1,198 @@
+"""narrative_rules against the per-row if/elif chains it replaced (copied below as they were)."""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import narrative_rules
+from industry_analysis import IndustryDashboard
+
+STUDENT_FIELDS = ["Hiring_Outlook", "Outlook_Description", "Competition_Level",
+                  "Competition_Description", "Preparation_Guidance"]
+
+
+def legacy_risk_level(score):
+    if score <= 35:
+        return "Low Risk"
+    elif score <= 65:
+        return "Medium Risk"
+    else:
+        return "High Risk"
+
+
+def legacy_hiring_surge(row):
+    if row['Year'] != 2026:
+        return None
+    demand_trend = row.get('Demand_Trend', 0)
+    hpi = (
+        (row['Talent_Demand_Score'] - row['Talent_Supply_Score'])
+        + (row['Attrition_Rate'] * 20)
+        + (demand_trend * 0.8)
+    )
+    if hpi >= 30 or (hpi >= 20 and demand_trend > 5):
+        return "1-3 months"
+    elif hpi >= 15 or demand_trend > 0:
+        return "4-6 months"
+    else:
+        return "6-12 months"
+
+
+def legacy_explanation(row):
+    risk_level = legacy_risk_level(row['Risk_Score'])
+    reasons = []
+    gap = row['Talent_Demand_Score'] - row['Talent_Supply_Score']
+    if gap > 20:
+        reasons.append("demand significantly exceeds supply, creating critical shortage pressure")
+    elif gap > 0:
+        reasons.append("demand outpaces supply, tightening the talent pipeline")
+    elif gap < -20:
+        reasons.append("talent supply is robust relative to current market demand")
+    else:
+        reasons.append("supply and demand are currently in a state of relative equilibrium")
+    demand_trend = row.get('Demand_Trend', 0)
+    if demand_trend > 10:
+        reasons.append("strong demand momentum suggests accelerating hiring needs")
+    elif demand_trend > 0:
+        reasons.append("positive demand momentum indicates steady market growth")
+    elif demand_trend < -10:
+        reasons.append("declining demand trend is easing immediate workforce pressure")
+    if row['Attrition_Rate'] > 0.18:
+        reasons.append("aggressive attrition rates are accelerating workforce leakage")
+    elif row['Attrition_Rate'] > 0.12:
+        reasons.append("steady attrition continues to drive routine hiring requirements")
+    elif row['Attrition_Rate'] < 0.05:
+        reasons.append("exceptionally stable retention rates are mitigating overall risk")
+    if abs(row['Risk_Score'] - 5) < 5:
+        reasons.append("workforce risk is at a historic low for this industry")
+    elif gap < 0 and row['Risk_Score'] > 20:
+        reasons.append("operational risk remains elevated due to high attrition despite healthy supply")
+    reason_str = "; ".join(reasons[:3])
+    year_ctx = " (Current Planning Horizon)" if row['Year'] == 2026 else ""
+    return f"{risk_level}{year_ctx} detected. {reason_str.capitalize()}."
+
+
+def legacy_student_insights(row):
+    demand = row['Talent_Demand_Score']
+    risk = row['Risk_Score']
+    supply = row['Talent_Supply_Score']
+    growth = row['Growth_Rate']
+    conversion = row['Conversion_Rate']
+    industry = row['Industry']
+
+    if risk <= 30 and demand >= 60:
+        outlook = "Excellent" if growth > 0.08 else "Favorable"
+        if growth > 0.05:
+            desc = f"Rapidly expanding {industry} market. Strong demand combined with high growth makes this an ideal entry point for early-career professionals."
+        else:
+            desc = f"Stable and favorable {industry} outlook. Consistent hiring and low risk provide a secure career trajectory."
+    elif risk <= 55:
+        outlook = "Promising" if conversion > 0.8 else "Moderate"
+        if conversion > 0.75:
+            desc = f"Balanced market with high internship-to-job conversion. Competition exists, but focus on hands-on experience as a primary differentiator."
+        else:
+            desc = f"Transitional {industry} market. Evolving industry requirements mean students should focus on both traditional and emerging skills to stay relevant."
+    else:
+        outlook = "Niche-only" if risk > 85 else "Competitive"
+        desc = f"High-bar entry environment in {industry}. Success requires elite technical specializations and a strong professional network to bypass standard filters."
+
+    gap = demand - supply
+    if gap < -30:
+        comp_level = "Hyper-Competitive"
+        comp_desc = f"Market saturation in {industry} is high. Generalist roles are extremely contested; focus on distinct technical edge cases."
+    elif gap < -15:
+        comp_level = "Selective"
+        comp_desc = f"Applicant supply in {industry} outpaces standard demand. Focus on highly specialized niches to stand out from the general pool."
+    elif gap > 20:
+        comp_level = "High Opportunity"
+        comp_desc = f"Significant talent shortage in {industry}. Employers are actively competing for graduates with core competencies."
+    elif gap > 5 or (gap > 0 and growth > 0.08):
+        comp_level = "Growth-led"
+        comp_desc = f"Emerging demand in {industry} is creating new vacancies faster than they can be filled. Early entry is highly advantageous."
+    else:
+        comp_level = "Balanced"
+        comp_desc = f"Stable talent equilibrium in {industry}. Typical recruitment cycles; standard qualifications and strong portfolios are the keys to success."
+
+    guidance = []
+    surge = legacy_hiring_surge(row)
+    if surge == "1-3 months":
+        guidance.append("Immediate Action: Finalize your portfolio and start applying now to catch the upcoming hiring peak.")
+    elif surge == "4-6 months":
+        guidance.append("Strategic Prep: Use the next quarter to master 1-2 'In-Demand' skills before the surge begins.")
+    else:
+        guidance.append("Plan Ahead: Aim for foundational certifications and early internships to build a long-term lead.")
+    if comp_level == "High Competition":
+        guidance.append("Differentiation: Focus on multi-disciplinary projects to stand out in a crowded applicant pool.")
+    elif comp_level == "Opportunity-rich":
+        guidance.append("Speed-to-Market: Optimize your LinkedIn and resume for rapid technical screening.")
+    guidance.append(f"Network Strategy: Connect with 3-5 professionals currently in {row['Industry']} to understand team culture.")
+    if row['Conversion_Rate'] > 0.7:
+        guidance.append("Internship Focus: Target top-tier internships here, as conversion rates to full-time roles are exceptional.")
+    else:
+        guidance.append("Broaden Search: Diversify your applications beyond just internships to include direct entry-level roles.")
+
+    return {
+        "Hiring_Outlook": outlook,
+        "Outlook_Description": desc,
+        "Competition_Level": comp_level,
+        "Competition_Description": comp_desc,
+        "Preparation_Guidance": guidance,
+    }
+
+
+def boundary_panel():
+    """Rows on and around every threshold the rules compare against."""
+    supply = [40.0]
+    gaps = [-35, -30, -20, -15, -5, 0, 0.5, 5, 10, 20, 25, 30]
+    risks = [0, 5, 9.99, 10, 20, 21, 30, 35, 50, 55, 65, 85, 90]
+    attritions = [0.03, 0.05, 0.12, 0.15, 0.18, 0.25]
+    trends = [-15, -10, 0, 3, 5, 10, 12]
+    growths = [0.03, 0.05, 0.07, 0.08, 0.1]
+    conversions = [0.6, 0.7, 0.75, 0.8, 0.9]
+    rng = np.random.default_rng(5)
+    combos = list(itertools.product(supply, gaps, risks, attritions, trends))
+    n = len(combos)
+    df = pd.DataFrame(combos, columns=['Talent_Supply_Score', 'gap', 'Risk_Score', 'Attrition_Rate', 'Demand_Trend'])
+    df['Talent_Demand_Score'] = df['Talent_Supply_Score'] + df.pop('gap')
+    df['Growth_Rate'] = rng.choice(growths, n)
+    df['Conversion_Rate'] = rng.choice(conversions, n)
+    df['Year'] = rng.choice([2025, 2026, 2027], n)
+    df['Industry'] = rng.choice(["IT", "Healthcare", "EV"], n)
+    return df
+
+
+@pytest.fixture(scope="module")
+def scored_panel(tmp_path_factory):
+    from benchmarks import synthetic
+    data_dir = synthetic.write_panel(str(tmp_path_factory.mktemp("panel") / "data"), industries=40)
+    dashboard = IndustryDashboard(data_dir=data_dir)
+    return dashboard, dashboard.snapshot()[0]
+
+
+def assert_matches_legacy(dashboard, df):
+    for _, row in df.iterrows():
+        assert row['Risk_Level'] == legacy_risk_level(row['Risk_Score'])
+        assert row['Hiring_Surge'] == legacy_hiring_surge(row)
+        assert row['AI_Explanation'] == legacy_explanation(row)
+        assert dashboard.get_student_insights(row, None, fields=STUDENT_FIELDS) == legacy_student_insights(row)
+
+
+def test_scored_panel_matches_legacy_rules(scored_panel):
+    dashboard, panel = scored_panel
+    assert set(panel['Year']) >= {2026, 2027}
+    assert_matches_legacy(dashboard, panel)
+
+
+def test_threshold_rows_match_legacy_rules(scored_panel):
+    dashboard, _ = scored_panel
+    df = narrative_rules.annotate(boundary_panel())
+    # Every rule outcome is exercised
+    assert set(df['Hiring_Surge'].dropna()) == {"1-3 months", "4-6 months", "6-12 months"}
+    assert set(df['Hiring_Outlook']) == {"Excellent", "Favorable", "Promising", "Moderate", "Competitive", "Niche-only"}
+    assert len(set(df['Competition_Level'])) == 5
+    assert_matches_legacy(dashboard, df)
+
+
+def test_risk_levels_helper_matches_legacy():
+    scores = [0, 35, 35.01, 65, 65.01, 100]
+    assert list(narrative_rules.risk_levels(scores)) == [legacy_risk_level(s) for s in scores]
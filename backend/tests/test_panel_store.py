@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+import panel_store
+
+
+def test_exact_store_matches_csv_panel(panel_dir, tmp_path):
+    store_dir = panel_store.build_store(panel_dir, str(tmp_path / "store"))
+    assert panel_store.is_fresh(panel_dir, store_dir)
+
+    expected = panel_store.read_csv_panel(panel_dir)
+    loaded = panel_store.load_store(store_dir)
+    assert loaded.columns.tolist() == expected.columns.tolist()
+    for column in expected.columns:
+        assert loaded[column].astype(expected[column].dtype).tolist() == expected[column].tolist(), column
+    # Rates are float64 copies, bit-identical to the CSV values
+    for column in panel_store.RATE_COLUMNS:
+        assert loaded[column].dtype == np.float64
+        assert np.array_equal(loaded[column].to_numpy(), expected[column].to_numpy())
+
+
+def test_float32_store_is_within_tolerance(panel_dir, tmp_path):
+    store_dir = panel_store.build_store(panel_dir, str(tmp_path / "store"))
+    expected = panel_store.read_csv_panel(panel_dir)
+    loaded = panel_store.load_store(store_dir, exact=False)
+    for column in panel_store.RATE_COLUMNS:
+        assert loaded[column].dtype == np.float32
+        np.testing.assert_allclose(loaded[column].to_numpy(np.float64), expected[column].to_numpy(), rtol=1e-6)
+
+
+def test_store_goes_stale_when_a_csv_changes(panel_dir, tmp_path):
+    store_dir = panel_store.build_store(panel_dir, str(tmp_path / "store"))
+    path = f"{panel_dir}/attrition_data.csv"
+    df = pd.read_csv(path)
+    df.loc[0, 'Attrition_Rate'] = 0.333
+    df.to_csv(path, index=False)
+    assert not panel_store.is_fresh(panel_dir, store_dir)
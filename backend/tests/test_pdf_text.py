@@ -0,0 +1,28 @@
+import pytest
+
+import pdf_text
+from benchmarks import synthetic
+
+
+@pytest.fixture(scope="module")
+def long_resume(tmp_path_factory):
+    path = tmp_path_factory.mktemp("pdf") / "resume.pdf"
+    yield synthetic.write_resume_pdf(str(path), pages=40)
+    pdf_text.shutdown_pool()
+
+
+def test_parallel_extraction_matches_serial(long_resume):
+    serial = pdf_text.extract_pdf_text(long_resume, workers=1)
+    assert pdf_text.extract_pdf_text(long_resume, workers=2) == serial
+    assert pdf_text._pool is not None
+
+
+def test_parallel_extraction_stops_at_the_character_budget(long_resume):
+    serial = pdf_text.extract_pdf_text(long_resume, workers=1, max_chars=5000)
+    assert len(serial) == 5000
+    assert pdf_text.extract_pdf_text(long_resume, workers=2, max_chars=5000) == serial
+
+
+def test_oversized_files_are_rejected(long_resume):
+    with pytest.raises(ValueError):
+        pdf_text.extract_pdf_text(long_resume, max_bytes=100)
@@ -0,0 +1,87 @@
+import time
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+import profiling
+
+TOKEN = "secret-token"
+
+
+def client(monkeypatch):
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+
+    def hello(request):
+        return PlainTextResponse("hello")
+
+    return TestClient(profiling.ProfilingMiddleware(Starlette(routes=[Route("/", hello)])))
+
+
+def test_profiles_with_the_admin_token_header(monkeypatch):
+    response = client(monkeypatch).get("/?profile=1", headers={"X-Admin-Token": TOKEN})
+    assert response.text == "hello"
+    assert "x-profile-id" in response.headers
+
+
+def test_token_in_the_query_string_is_ignored(monkeypatch):
+    response = client(monkeypatch).get(f"/?profile=1&admin_token={TOKEN}")
+    assert response.text == "hello"
+    assert "x-profile-id" not in response.headers
+
+
+def sync_client(monkeypatch, session_class=profiling.ProfileSession):
+    from fastapi import FastAPI
+
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", TOKEN)
+    monkeypatch.setattr(profiling, "ProfileSession", session_class)
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_endpoint():
+        # A sync endpoint: FastAPI runs it in the threadpool. Slow enough to top the report.
+        time.sleep(0.05)
+        return {"total": sum(range(10_000))}
+
+    profiling.install(app)
+    return TestClient(app)
+
+
+def test_profiles_a_sync_endpoint_in_the_threadpool(monkeypatch):
+    response = sync_client(monkeypatch).get("/sync", headers={"X-Profile": "inline", "X-Admin-Token": TOKEN})
+    assert response.status_code == 200
+    assert "sync_endpoint" in response.text
+
+
+class RefusedProfile:
+    """Stands in for cProfile on Python 3.12+ once a profiler is active in the process."""
+    active = False
+
+    def enable(self):
+        if RefusedProfile.active:
+            raise ValueError("Another profiling tool is already active")
+        RefusedProfile.active = True
+        self.profiler = profiling.cProfile.Profile()
+        self.profiler.enable()
+
+    def disable(self):
+        self.profiler.disable()
+        RefusedProfile.active = False
+
+    def create_stats(self):
+        self.profiler.create_stats()
+        self.stats = self.profiler.stats
+
+
+class OneProfilerSession(profiling.ProfileSession):
+    profiler_class = RefusedProfile
+
+
+def test_sync_endpoint_survives_a_refused_second_profiler(monkeypatch):
+    client = sync_client(monkeypatch, OneProfilerSession)
+    response = client.get("/sync", headers={"X-Profile": "1", "X-Admin-Token": TOKEN})
+    assert response.status_code == 200
+    assert response.json() == {"total": sum(range(10_000))}
+    assert "x-profile-id" in response.headers
+    assert not RefusedProfile.active
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from quantile_sketch import QuantileSketch
+
+K = 400
+QS = np.linspace(0.01, 0.99, 99)
+
+
+def rank_error(sketch, values):
+    # Largest |rank(estimate) / n - q| over QS
+    ranks = np.searchsorted(np.sort(values), sketch.quantiles(QS)) / len(values)
+    return np.abs(ranks - QS).max()
+
+
+@pytest.fixture(scope="module")
+def values():
+    return np.random.default_rng(1).lognormal(0, 1, 200_000)
+
+
+def test_small_universes_match_series_quantile():
+    values = np.random.default_rng(2).normal(50, 10, K)
+    sketch = QuantileSketch.of(values, k=K)
+    assert sketch.is_exact()
+    expected = pd.Series(values).quantile([0.05, 0.5, 0.95]).to_numpy()
+    np.testing.assert_array_equal(sketch.quantiles([0.05, 0.5, 0.95]), expected)
+
+
+@pytest.mark.parametrize("batches", [1, 50, 2000])
+def test_rank_error_is_bounded_in_k(values, batches):
+    sketch = QuantileSketch(k=K)
+    for batch in np.array_split(values, batches):
+        sketch.update(batch)
+    assert not sketch.is_exact()
+    assert sketch.n == len(values)
+    assert sketch.size() < 3 * K
+    assert rank_error(sketch, values) < 3 / K
+
+
+def test_merged_shards_sketch_the_union(values):
+    shards = [QuantileSketch.of(part, k=K) for part in np.array_split(values, 7)]
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    assert merged.n == len(values)
+    assert merged.size() < 3 * K
+    assert rank_error(merged, values) < 3 / K
+
+
+def test_exact_merge_equals_the_exact_union():
+    values = np.random.default_rng(3).uniform(0, 1, 300)
+    merged = QuantileSketch.of(values[:120], k=K).merge(QuantileSketch.of(values[120:], k=K))
+    assert merged.is_exact()
+    np.testing.assert_allclose(merged.quantiles(QS), np.percentile(values, QS * 100))
+
+
+def test_same_input_gives_the_same_bounds(values):
+    first = QuantileSketch.of(values, k=K).quantiles([0.05, 0.95])
+    again = QuantileSketch.of(values, k=K).quantiles([0.05, 0.95])
+    np.testing.assert_array_equal(first, again)
+
+
+def test_empty_sketch_raises():
+    with pytest.raises(ValueError):
+        QuantileSketch().quantiles([0.5])
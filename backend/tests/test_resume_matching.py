@@ -0,0 +1,20 @@
+from benchmarks import synthetic
+from industry_analysis import IndustryDashboard
+from job_catalogue import JobCatalogue
+from resume_analyzer import ResumeAnalyzer
+
+
+def analyzer(panel_dir):
+    return ResumeAnalyzer(dashboard=IndustryDashboard(data_dir=panel_dir))
+
+
+def test_explicit_empty_catalogue_is_used(panel_dir):
+    result = analyzer(panel_dir).rank_jobs("python sql cloud", catalogue=JobCatalogue({}))
+    assert result == {"Jobs_Scored": 0, "Best_Matches": []}
+
+
+def test_explicit_catalogue_replaces_the_default(panel_dir):
+    catalogue = JobCatalogue(synthetic.job_catalogue(jobs=4, industries=2))
+    result = analyzer(panel_dir).rank_jobs("python sql cloud", top_k=10, catalogue=catalogue)
+    assert result["Jobs_Scored"] == 4
+    assert {m["Job_Title"] for m in result["Best_Matches"]} == set(catalogue.titles)
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import sharded_scoring
+
+
+def raw_panel(industries=40, years=7, seed=3):
+    rng = np.random.default_rng(seed)
+    n = industries * years
+    df = pd.DataFrame({
+        'Industry': np.repeat([f"Industry_{i:03d}" for i in range(industries)], years),
+        'Year': np.tile(np.arange(2020, 2020 + years), industries),
+        'Talent_Supply_Raw': rng.uniform(100, 5000, n),
+        'Talent_Demand_Raw': rng.uniform(100, 5000, n),
+        'Attrition_Rate': rng.uniform(0.02, 0.3, n),
+    })
+    # Shuffled, with an uneven industry, as an ingest can leave it
+    df = df.drop(index=[5, 6, 40]).sample(frac=1, random_state=seed)
+    return df
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pool():
+    yield
+    sharded_scoring.shutdown_pool()
+
+
+def test_parallel_scores_match_serial():
+    df = raw_panel()
+    serial, serial_bounds = sharded_scoring.score_panel(df, workers=1)
+    parallel, parallel_bounds = sharded_scoring.score_panel(df, workers=2, min_parallel_rows=0)
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert parallel_bounds == serial_bounds
+
+
+def test_pool_workers_do_not_fork_the_server():
+    assert sharded_scoring.pool_context().get_start_method() in ("forkserver", "spawn")
@@ -0,0 +1,62 @@
+import threading
+import time
+
+from singleflight import coalesced
+
+
+class Slow:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    @coalesced
+    def analysis(self, industry, year=2026, fields=None):
+        self.calls += 1
+        self.release.wait(5)
+        return (industry, year, fields)
+
+
+def run_concurrently(calls):
+    results = [None] * len(calls)
+
+    def run(i, fn):
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i, fn)) for i, fn in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_equivalent_calls_are_merged():
+    slow = Slow()
+    threads, results = run_concurrently([
+        lambda: slow.analysis("IT", 2026),
+        lambda: slow.analysis("IT", year=2026),
+        lambda: slow.analysis("IT"),
+        lambda: slow.analysis(industry="IT", fields=None),
+    ])
+    time.sleep(0.2)
+    slow.release.set()
+    for thread in threads:
+        thread.join()
+    assert slow.calls == 1
+    assert results == [("IT", 2026, None)] * 4
+
+
+def test_different_arguments_and_instances_run_separately():
+    first, second = Slow(), Slow()
+    threads, results = run_concurrently([
+        lambda: first.analysis("IT", 2026),
+        lambda: first.analysis("IT", 2027),
+        lambda: second.analysis("IT", 2026),
+        lambda: first.analysis("IT", 2026, fields=frozenset(["Metrics"])),
+    ])
+    time.sleep(0.2)
+    first.release.set()
+    second.release.set()
+    for thread in threads:
+        thread.join()
+    assert first.calls == 3
+    assert second.calls == 1
+    assert results[1] == ("IT", 2027, None)
@@ -0,0 +1,59 @@
+import pytest
+
+import pdf_text
+from skill_index import spell_symbols
+from skill_taxonomy import SkillTaxonomy
+
+SKILLS = ["C++", "C#", "Computer Vision", "AI/ML", "Node.js", "Data Structures", "Kubernetes", "C/C++ Embedded",
+          "Lean Manufacturing", "Bioinformatics", "AI Diagnostics"]
+
+
+@pytest.fixture(scope="module")
+def taxonomy():
+    return SkillTaxonomy.build(top_skills=[", ".join(SKILLS)])
+
+
+def found(taxonomy, resume_text):
+    # Resume text as ResumeAnalyzer.extract_text normalizes it
+    match = taxonomy.scan(pdf_text.normalize(spell_symbols(resume_text)))
+    return {skill for skill in SKILLS if match.has(skill)}
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("Built a trading engine in C++ and Python", {"C++"}),
+    ("Wrote CPP services", {"C++"}),
+    ("Five years of C# and .NET", {"C#"}),
+    ("Research in computer vision and ML", {"Computer Vision", "AI/ML"}),
+    ("nodejs backends, data structure design, k8s", {"Node.js", "Data Structures", "Kubernetes"}),
+    ("Lean manufactring and bioinformatic pipelines", {"Lean Manufacturing", "Bioinformatics"}),
+])
+def test_finds_skills_and_their_aliases(taxonomy, text, expected):
+    assert found(taxonomy, text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "Five years of C# and .NET",
+    "iOS apps in Objective-C",
+    "Graduated with a Grade C in chemistry",
+    "Plan C: a vitamin C supplement startup",
+])
+def test_c_like_tokens_do_not_match_cplusplus(taxonomy, text):
+    assert not found(taxonomy, text) & {"C++", "C/C++ Embedded"}
+
+
+def test_cv_is_not_computer_vision(taxonomy):
+    assert "Computer Vision" not in found(taxonomy, "CV: see attached. Updated CV available on request.")
+
+
+def test_csharp_does_not_match_cplusplus_and_back(taxonomy):
+    assert found(taxonomy, "C++") == {"C++"}
+    assert found(taxonomy, "C#") == {"C#"}
+
+
+@pytest.mark.parametrize("text,skill", [
+    ("Ten years in automotive manufacturing", "Lean Manufacturing"),
+    ("Health informatics coursework", "Bioinformatics"),
+    ("Ran vehicle diagnostics", "AI Diagnostics"),
+])
+def test_one_word_does_not_fuzzy_match_a_longer_skill_ending_with_it(taxonomy, text, skill):
+    assert skill not in found(taxonomy, text)
@@ -0,0 +1,52 @@
+import copy
+import threading
+import time
+
+from industry_analysis import IndustryDashboard
+
+
+def test_ingest_leaves_the_previous_snapshot_untouched(panel_dir):
+    dashboard = IndustryDashboard(data_dir=panel_dir)
+    panel, bounds = dashboard.snapshot()
+    panel_before, bounds_before = panel.copy(), copy.deepcopy(bounds)
+
+    dashboard.ingest(attrition=[{"Industry": "IT", "Year": 2024, "Attrition_Rate": 0.31}])
+
+    new_panel, new_bounds = dashboard.snapshot()
+    assert new_bounds is not bounds
+    assert new_bounds["IT"] != bounds_before["IT"]
+    assert dashboard.normalization_bounds is new_bounds
+    # A request still holding the old pair keeps a consistent view of it
+    assert bounds == bounds_before
+    assert panel.equals(panel_before)
+
+
+def test_reload_publishes_panel_and_bounds_together(panel_dir):
+    dashboard = IndustryDashboard(data_dir=panel_dir)
+    panel, bounds = dashboard.snapshot()
+    dashboard.reload()
+    new_panel, new_bounds = dashboard.snapshot()
+    assert new_panel is not panel and new_bounds is not bounds
+    assert dashboard.normalization_bounds is new_bounds
+
+
+def test_concurrent_first_requests_build_once(panel_dir, monkeypatch):
+    dashboard = IndustryDashboard(data_dir=panel_dir)
+    builds = []
+    score = dashboard._score
+
+    def slow_score(df):
+        builds.append(threading.get_ident())
+        time.sleep(0.2)
+        return score(df)
+
+    monkeypatch.setattr(dashboard, "_score", slow_score)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(dashboard.snapshot())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(result is results[0] for result in results)